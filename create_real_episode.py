@@ -8,7 +8,6 @@ import asyncio
 import json
 import os
 from datetime import datetime
-from typing import List
 from dotenv import load_dotenv
 from mutagen.mp3 import MP3
 import io
@@ -17,10 +16,9 @@ load_dotenv()
 
 from src.models.case import CaseFile, Evidence
 from src.models.script import DialogueLine, PodcastScript
-from src.services.debate import create_debate_engine
 from src.services.audio import create_audio_service
 from src.services.crawler import create_crawler_service
-from src.services.image_scraper import create_image_scraper, CaseImage
+from src.services.episode import produce_episode
 
 
 async def fetch_real_case(query: str = "cold case unsolved murder", use_database: bool = True) -> CaseFile:
@@ -80,6 +78,8 @@ async def fetch_real_case(query: str = "cold case unsolved murder", use_database
             return case
     except Exception as e:
         print(f"⚠️  Crawler error: {e}")
+    finally:
+        await crawler.aclose()
     
     # Fallback to a well-documented real case
     print("📋 Using documented case: The Isdal Woman")
@@ -155,35 +155,24 @@ async def create_real_episode():
     print(f"   Date: {case.date_occurred}")
     print(f"   Evidence items: {len(case.evidence_list)}")
     
-    # Step 1.5: Scrape images from case sources
-    print("\n🖼️  SCRAPING CASE IMAGES...")
-    image_scraper = create_image_scraper()
-    case_images: List[CaseImage] = []
-    
-    if case.source_urls:
-        case_images = await image_scraper.scrape_and_download(
-            case.source_urls, 
-            limit_per_url=5
-        )
-        print(f"✅ Downloaded {len(case_images)} images")
-        for img in case_images:
-            print(f"   - [{img.image_type}] {img.local_path}")
-    else:
+    # Step 2: Generate AI debate while scraping images from case sources
+    print("\n🤖 GENERATING DEBATE + 🖼️  SCRAPING CASE IMAGES...")
+    if not case.source_urls:
         print("⚠️  No source URLs for image scraping")
     
-    # Step 2: Generate AI debate
-    print("\n🤖 GENERATING DEBATE...")
-    debate_engine = create_debate_engine()
-    
     try:
         # Adjust exchanges based on available ElevenLabs credits
         # With limited credits, generate ~12 exchanges for ~5 minute episode
-        script = await debate_engine.generate_debate(case, num_exchanges=12)
+        script, case_images = await produce_episode(case, num_exchanges=12)
         print(f"✅ Generated {len(script.chapters)} dialogue lines")
     except Exception as e:
         print(f"❌ Debate generation failed: {e}")
         raise
     
+    print(f"✅ Downloaded {len(case_images)} images")
+    for img in case_images:
+        print(f"   - [{img.image_type}] {img.local_path}")
+    
     # Step 3: Generate audio with timestamps
     print("\n🔊 GENERATING AUDIO WITH TIMESTAMPS...")
     audio_service = create_audio_service()
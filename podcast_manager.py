@@ -9,7 +9,6 @@ Handles scheduling, budget tracking, and episode generation.
 import asyncio
 import argparse
 import sys
-from datetime import datetime
 from dotenv import load_dotenv
 
 load_dotenv()
@@ -89,7 +88,7 @@ def cmd_schedule(args):
         episodes = scheduler.schedule_multiple(args.add_episodes)
         print(f"✅ Scheduled {len(episodes)} episodes:")
         for ep in episodes:
-            date = datetime.fromisoformat(ep.scheduled_date)
+            date = ep.scheduled_date
             print(f"   📅 {date.strftime('%b %d, %Y')} - {ep.case_query[:40]}...")
     
     if not any([args.frequency, args.day is not None, args.add_episodes]):
@@ -222,7 +221,7 @@ def cmd_calendar(args):
         print("Click each link to add to Google Calendar:\n")
         
         for episode in upcoming[:10]:
-            date = datetime.fromisoformat(episode.scheduled_date)
+            date = episode.scheduled_date
             url = get_google_calendar_url(episode)
             print(f"📅 {date.strftime('%b %d, %Y')} - {episode.case_query[:25]}...")
             print(f"   {url}\n")
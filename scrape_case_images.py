@@ -46,15 +46,14 @@ async def scrape_wikipedia_case(case_name: str):
     """Scrape images from Wikipedia for a famous cold case."""
     print(f"🔍 Scraping images for: {case_name}")
     
-    scraper = create_image_scraper()
-    
     if case_name in CASE_SOURCES:
         urls = CASE_SOURCES[case_name]
     else:
         # Try Wikipedia search
         urls = [f"https://en.wikipedia.org/wiki/{case_name.replace(' ', '_')}"]
     
-    images = await scraper.scrape_and_download(urls, limit_per_url=8)
+    async with create_image_scraper() as scraper:
+        images = await scraper.scrape_and_download(urls, limit_per_url=8)
     
     print(f"\n✅ Downloaded {len(images)} images:")
     for img in images:
@@ -79,13 +78,11 @@ async def scrape_for_current_episode():
     print(f"📋 Case: {case.get('title', 'Unknown')}")
     print(f"📍 Location: {case.get('location', 'Unknown')}")
     
-    scraper = create_image_scraper()
-    
     # Try to scrape from source URLs
     source_urls = case.get("sources", [])
     if source_urls:
         print(f"\n🌐 Scraping from {len(source_urls)} source URLs...")
-        images = await scraper.scrape_and_download(source_urls, limit_per_url=5)
+        urls = source_urls
     else:
         # Search for related images
         print("\n🔍 No source URLs, searching Wikipedia...")
@@ -102,8 +99,10 @@ async def scrape_for_current_episode():
             if term:
                 wiki_url = f"https://en.wikipedia.org/wiki/{term.replace(' ', '_')}"
                 urls.append(wiki_url)
-        
-        images = await scraper.scrape_and_download(urls[:3], limit_per_url=5)
+        urls = urls[:3]
+    
+    async with create_image_scraper() as scraper:
+        images = await scraper.scrape_and_download(urls, limit_per_url=5)
     
     if images:
         print(f"\n✅ Downloaded {len(images)} images")
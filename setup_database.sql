@@ -55,10 +55,58 @@ CREATE TABLE IF NOT EXISTS jobs (
 
 -- Indexes for common queries
 CREATE INDEX IF NOT EXISTS idx_cases_location ON cases(location);
+-- Keyset pagination order for list_cases
+CREATE INDEX IF NOT EXISTS idx_cases_created_at_case_id ON cases(created_at DESC, case_id DESC);
 CREATE INDEX IF NOT EXISTS idx_evidence_case_id ON evidence(case_id);
 CREATE INDEX IF NOT EXISTS idx_scripts_case_id ON scripts(case_id);
 CREATE INDEX IF NOT EXISTS idx_media_script_id ON media(script_id);
 CREATE INDEX IF NOT EXISTS idx_jobs_status ON jobs(status);
+-- Pollers and timeout sweeps only ever look at unfinished jobs
+CREATE INDEX IF NOT EXISTS idx_jobs_active ON jobs(status, updated_at)
+    WHERE status IN ('pending', 'processing');
+
+-- Transactional writes, called via supabase.rpc() from DatabaseService
+CREATE OR REPLACE FUNCTION create_case_with_evidence(case_data JSONB, evidence_rows JSONB)
+RETURNS UUID
+LANGUAGE plpgsql
+AS $$
+DECLARE
+    new_case_id UUID;
+BEGIN
+    INSERT INTO cases (case_id, title, location, date_occurred, raw_content, source_urls, created_at)
+    SELECT case_id, title, location, date_occurred, raw_content, source_urls, created_at
+    FROM jsonb_populate_record(NULL::cases, case_data)
+    RETURNING case_id INTO new_case_id;
+
+    INSERT INTO evidence (evidence_id, case_id, description, evidence_type, source_url)
+    SELECT evidence_id, case_id, description, evidence_type, source_url
+    FROM jsonb_populate_recordset(NULL::evidence, COALESCE(evidence_rows, '[]'::JSONB));
+
+    RETURN new_case_id;
+END;
+$$;
+
+CREATE OR REPLACE FUNCTION delete_case_with_evidence(target_case_id UUID)
+RETURNS BOOLEAN
+LANGUAGE plpgsql
+AS $$
+BEGIN
+    DELETE FROM evidence WHERE case_id = target_case_id;
+    DELETE FROM cases WHERE case_id = target_case_id;
+    RETURN FOUND;
+END;
+$$;
+
+CREATE OR REPLACE FUNCTION delete_script_with_media(target_script_id UUID)
+RETURNS BOOLEAN
+LANGUAGE plpgsql
+AS $$
+BEGIN
+    DELETE FROM media WHERE script_id = target_script_id;
+    DELETE FROM scripts WHERE script_id = target_script_id;
+    RETURN FOUND;
+END;
+$$;
 
 -- Create storage bucket for podcasts (run separately in Storage settings)
 -- INSERT INTO storage.buckets (id, name, public) VALUES ('podcasts', 'podcasts', true);
@@ -0,0 +1,54 @@
+"""Shared Anthropic client for the podcast host agents.
+
+Both hosts talk to the same model, so they share one AsyncAnthropic client
+and its connection pool instead of each opening their own.
+"""
+
+from functools import cache
+from typing import Optional
+
+from anthropic import AsyncAnthropic, DefaultAsyncHttpxClient
+from pydantic_ai.models.anthropic import AnthropicModel, AnthropicModelSettings
+from pydantic_ai.providers.anthropic import AnthropicProvider
+
+from src.utils.http import DEFAULT_LIMITS, DEFAULT_TIMEOUT
+
+HOST_MODEL_NAME = "claude-sonnet-4-20250514"
+
+# Each host keeps one conversation per debate and resends it every turn, so
+# put a cache breakpoint on the latest message: the next turn then reads the
+# whole earlier conversation from the prompt cache instead of paying for it.
+HOST_MODEL_SETTINGS = AnthropicModelSettings(anthropic_cache_messages=True)
+
+
+@cache
+def get_anthropic_client(api_key: Optional[str] = None) -> AsyncAnthropic:
+    """Get the process-wide Anthropic client for an API key.
+    
+    Args:
+        api_key: Anthropic API key; falls back to ANTHROPIC_API_KEY when None.
+    
+    Returns:
+        A cached AsyncAnthropic client backed by a pooled HTTP/2 connection.
+    """
+    # The SDK's own client class keeps its defaults (redirects, transport
+    # compatibility) while letting us tune pooling and enable HTTP/2.
+    http_client = DefaultAsyncHttpxClient(
+        limits=DEFAULT_LIMITS, timeout=DEFAULT_TIMEOUT, http2=True
+    )
+    return AsyncAnthropic(api_key=api_key, http_client=http_client)
+
+
+@cache
+def get_host_model(api_key: Optional[str] = None) -> AnthropicModel:
+    """Get the model shared by the podcast host agents.
+    
+    Args:
+        api_key: Anthropic API key; falls back to ANTHROPIC_API_KEY when None.
+    
+    Returns:
+        An AnthropicModel that reuses the shared Anthropic client and caches
+        each turn's conversation prefix.
+    """
+    provider = AnthropicProvider(anthropic_client=get_anthropic_client(api_key))
+    return AnthropicModel(HOST_MODEL_NAME, provider=provider, settings=HOST_MODEL_SETTINGS)
@@ -9,6 +9,7 @@ import os
 
 from pydantic_ai import Agent
 
+from src.agents.client import get_host_model
 from src.config import get_settings
 from src.models.case import CaseFile
 from src.models.script import DialogueLine
@@ -97,7 +98,7 @@ def create_maya_agent() -> Agent[CaseFile, DialogueLine]:
         os.environ["ANTHROPIC_API_KEY"] = settings.anthropic_api_key
     
     return Agent(
-        "claude-sonnet-4-20250514",
+        get_host_model(settings.anthropic_api_key or None),
         system_prompt=MAYA_VANCE_SYSTEM_PROMPT,
         output_type=DialogueLine,
         retries=2,
@@ -8,8 +8,8 @@ who testified in Dahmer, Hinckley cases) and cold case investigators like Paul H
 import os
 
 from pydantic_ai import Agent
-from pydantic_ai.models.anthropic import AnthropicModel
 
+from src.agents.client import get_host_model
 from src.config import get_settings
 from src.models.case import CaseFile
 from src.models.script import DialogueLine
@@ -100,7 +100,7 @@ def create_thorne_agent() -> Agent[CaseFile, DialogueLine]:
         os.environ["ANTHROPIC_API_KEY"] = settings.anthropic_api_key
     
     return Agent(
-        "claude-sonnet-4-20250514",
+        get_host_model(settings.anthropic_api_key or None),
         system_prompt=DR_THORNE_SYSTEM_PROMPT,
         output_type=DialogueLine,
         retries=2,
@@ -12,8 +12,10 @@ import os
 
 from src.services.stripe_service import (
     create_stripe_service,
+    get_plan_price_id,
     MEMBERSHIP_PLANS,
     MembershipTier,
+    StripeService,
 )
 from src.services.auth import create_auth_service
 
@@ -60,6 +62,25 @@ class MemberStatusResponse(BaseModel):
 # Price IDs cache
 _price_ids: dict[str, dict] = {}
 
+# Shared across requests so Stripe calls reuse one pooled connection
+_stripe_service: Optional[StripeService] = None
+
+
+def get_stripe_service() -> StripeService:
+    """Return the process-wide StripeService, creating it on first use."""
+    global _stripe_service
+    if _stripe_service is None:
+        _stripe_service = create_stripe_service()
+    return _stripe_service
+
+
+async def close_stripe_service() -> None:
+    """Close the process-wide StripeService's connection pool, if one was created."""
+    global _stripe_service
+    if _stripe_service is not None:
+        await _stripe_service.aclose()
+        _stripe_service = None
+
 
 @router.post("/checkout", response_model=CheckoutResponse)
 async def create_checkout(request: CheckoutRequest):
@@ -69,7 +90,7 @@ async def create_checkout(request: CheckoutRequest):
     Returns URL to redirect user to Stripe's hosted checkout page.
     """
     try:
-        stripe = create_stripe_service()
+        stripe = get_stripe_service()
     except ValueError as e:
         raise HTTPException(
             status_code=503,
@@ -80,21 +101,22 @@ async def create_checkout(request: CheckoutRequest):
     if not plan:
         raise HTTPException(status_code=400, detail=f"Invalid tier: {request.tier}")
     
-    # Get or create price IDs
-    if request.tier not in _price_ids:
-        # In production, these would be pre-created in Stripe Dashboard
-        # For now, create them dynamically
-        try:
-            prices = await stripe.create_product_and_prices(plan)
-            _price_ids[request.tier] = prices
-        except Exception as e:
-            raise HTTPException(
-                status_code=500,
-                detail=f"Failed to create Stripe product: {e}"
-            )
-    
-    price_key = "monthly_price_id" if request.billing_cycle == "monthly" else "yearly_price_id"
-    price_id = _price_ids[request.tier][price_key]
+    # Prefer price IDs pre-created in the Stripe Dashboard and set on the plan
+    price_id = get_plan_price_id(request.tier, request.billing_cycle)
+    if price_id is None:
+        # Otherwise create them dynamically, once per tier
+        if request.tier not in _price_ids:
+            try:
+                prices = await stripe.create_product_and_prices(plan)
+                _price_ids[request.tier] = prices
+            except Exception as e:
+                raise HTTPException(
+                    status_code=500,
+                    detail=f"Failed to create Stripe product: {e}"
+                )
+        
+        price_key = "monthly_price_id" if request.billing_cycle == "monthly" else "yearly_price_id"
+        price_id = _price_ids[request.tier][price_key]
     
     # Create checkout session
     result = await stripe.create_checkout_session(
@@ -202,7 +224,7 @@ async def stripe_webhook(
     - invoice.payment_failed: Payment failed
     """
     try:
-        stripe = create_stripe_service()
+        stripe = get_stripe_service()
     except ValueError:
         raise HTTPException(status_code=503, detail="Stripe not configured")
     
@@ -285,7 +307,7 @@ async def get_billing_portal(email: str, return_url: str = "/"):
         if not member or not member.get("stripe_customer_id"):
             raise HTTPException(status_code=404, detail="No active subscription found")
         
-        stripe = create_stripe_service()
+        stripe = get_stripe_service()
         portal_url = await stripe.create_billing_portal_session(
             customer_id=member["stripe_customer_id"],
             return_url=return_url,
@@ -421,6 +421,7 @@ async def _execute_crawl_job(job_id: str, query: str, limit: int) -> None:
     from src.services.crawler import create_crawler_service
 
     db = create_database_service()
+    crawler = None
 
     try:
         # Update job status to processing
@@ -452,6 +453,10 @@ async def _execute_crawl_job(job_id: str, query: str, limit: int) -> None:
         logger.error(f"Crawl job {job_id} failed: {e}")
         await db.update_job_status(job_id, "failed", error_message=str(e))
 
+    finally:
+        if crawler is not None:
+            await crawler.aclose()
+
 
 async def _execute_debate_job(job_id: str, case_id: str) -> None:
     """Execute debate job in background."""
@@ -23,11 +23,15 @@ class Settings(BaseSettings):
     # Supabase
     supabase_url: str = ""
     supabase_key: str = ""
+    # Direct Postgres DSN; enables pooled asyncpg reads (requires asyncpg)
+    supabase_db_url: str = ""
 
     # Configuration
     log_level: str = "INFO"
     max_retry_attempts: int = 3
     base_delay_seconds: float = 1.0
+    # Keep MD5-derived case/evidence IDs for databases populated before BLAKE2b
+    crawler_legacy_md5_ids: bool = False
 
     # ElevenLabs
     elevenlabs_model: str = "eleven_v3"
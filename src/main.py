@@ -7,6 +7,7 @@ import uvicorn
 import os
 import asyncio
 import json
+from contextlib import asynccontextmanager
 from typing import Optional, List
 
 # Import our services
@@ -15,7 +16,7 @@ from src.services.debate import create_debate_engine
 from src.services.audio import create_audio_service
 
 # Import API routers
-from src.api.membership import router as membership_router
+from src.api.membership import close_stripe_service, router as membership_router
 
 # Import case selector for database access
 try:
@@ -24,7 +25,14 @@ try:
 except ImportError:
     CASE_SELECTOR_AVAILABLE = False
 
-app = FastAPI(title="Murder Index API")
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Close shared API clients when the server shuts down."""
+    yield
+    await close_stripe_service()
+
+
+app = FastAPI(title="Murder Index API", lifespan=lifespan)
 
 # Include membership routes
 app.include_router(membership_router)
@@ -4,6 +4,7 @@ from src.services.audio import AudioService, create_audio_service
 from src.services.crawler import CrawlerService, create_crawler_service
 from src.services.database import DatabaseError, DatabaseService, create_database_service
 from src.services.debate import DebateEngine, create_debate_engine
+from src.services.episode import produce_episode
 from src.services.video import VideoService, create_video_service
 
 __all__ = [
@@ -16,6 +17,7 @@ __all__ = [
     "create_database_service",
     "DebateEngine",
     "create_debate_engine",
+    "produce_episode",
     "VideoService",
     "create_video_service",
 ]
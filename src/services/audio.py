@@ -1,14 +1,41 @@
 """Audio service for synthesizing podcast audio using ElevenLabs."""
 
+import asyncio
 import logging
-from typing import Any, List, Optional
+from functools import cache
+from typing import Any, AsyncIterator, List, Optional
 
 from src.models.script import DialogueLine, PodcastScript
 from src.utils.errors import AudioServiceError, ElevenLabsAPIError
+from src.utils.http import create_async_http_client
 from src.utils.retry import with_retry
 
 logger = logging.getLogger(__name__)
 
+# Lines synthesized at once per service by default. Every line spends
+# ElevenLabs credits, so episodes are synthesized one line at a time unless a
+# caller opts in to more; keep any override within the plan's request limit.
+MAX_CONCURRENT_SYNTHESES = 1
+
+
+@cache
+def get_elevenlabs_client(api_key: str) -> Any:
+    """
+    Get the process-wide ElevenLabs async client for an API key.
+
+    Every AudioService with the same key shares one client, so segments after
+    the first reuse pooled HTTP/2 connections instead of a new TLS handshake.
+
+    Args:
+        api_key: API key for ElevenLabs service
+
+    Returns:
+        A cached AsyncElevenLabs client
+    """
+    from elevenlabs import AsyncElevenLabs
+
+    return AsyncElevenLabs(api_key=api_key, httpx_client=create_async_http_client())
+
 
 class AudioService:
     """Service for converting podcast scripts to audio using ElevenLabs."""
@@ -20,6 +47,7 @@ class AudioService:
         thorne_voice_id: str = "",
         maya_voice_id: str = "",
         model_id: str = "eleven_v3",
+        max_concurrent_syntheses: int = MAX_CONCURRENT_SYNTHESES,
     ) -> None:
         """
         Initialize the AudioService.
@@ -30,6 +58,7 @@ class AudioService:
             thorne_voice_id: Voice ID for Dr. Thorne
             maya_voice_id: Voice ID for Maya Vance
             model_id: ElevenLabs model ID (default: eleven_v3)
+            max_concurrent_syntheses: Maximum dialogue lines synthesized at once
         """
         self.api_key = elevenlabs_api_key
         self.supabase = supabase_client
@@ -38,14 +67,13 @@ class AudioService:
             "dr_aris_thorne": thorne_voice_id,
             "maya_vance": maya_voice_id,
         }
+        self.max_concurrent_syntheses = max_concurrent_syntheses
         self._client: Optional[Any] = None
 
     async def _get_client(self) -> Any:
         """Get or create the ElevenLabs async client."""
         if self._client is None:
-            from elevenlabs import AsyncElevenLabs
-
-            self._client = AsyncElevenLabs(api_key=self.api_key)
+            self._client = get_elevenlabs_client(self.api_key)
         return self._client
 
     def apply_directorial_pass(self, line: DialogueLine) -> DialogueLine:
@@ -66,7 +94,7 @@ class AudioService:
         # For now, we just return the line as-is since validation is handled by Pydantic
         return line
 
-    @with_retry(max_attempts=3, base_delay=1.0, exceptions=(ElevenLabsAPIError, Exception))
+    @with_retry(max_attempts=3, base_delay=1.0, exceptions=(AudioServiceError,))
     async def synthesize_dialogue(self, line: DialogueLine) -> bytes:
         """
         Convert a single dialogue line to audio using eleven_v3 model.
@@ -77,6 +105,26 @@ class AudioService:
         Returns:
             Audio data as bytes
 
+        Raises:
+            ElevenLabsAPIError: If ElevenLabs API returns an error
+            AudioServiceError: If synthesis fails
+        """
+        return b"".join([chunk async for chunk in self.synthesize_dialogue_stream(line)])
+
+    async def synthesize_dialogue_stream(self, line: DialogueLine) -> AsyncIterator[bytes]:
+        """
+        Stream the audio for a single dialogue line as it is generated.
+
+        Chunks are yielded as ElevenLabs sends them, so callers can write to
+        disk or forward audio without holding the whole clip in memory. A
+        stream cannot be resumed part-way, so this method is not retried.
+
+        Args:
+            line: DialogueLine to synthesize
+
+        Yields:
+            Audio data chunks in playback order
+
         Raises:
             ElevenLabsAPIError: If ElevenLabs API returns an error
             AudioServiceError: If synthesis fails
@@ -93,19 +141,13 @@ class AudioService:
         text = processed_line.to_elevenlabs_format()
 
         try:
-            # Use ElevenLabs text-to-speech API
-            audio_generator = client.text_to_speech.convert(
+            # Use ElevenLabs streaming text-to-speech API
+            async for chunk in client.text_to_speech.stream(
                 voice_id=voice_id,
                 text=text,
                 model_id=self.model_id,
-            )
-
-            # Collect audio bytes from generator
-            audio_chunks: List[bytes] = []
-            async for chunk in audio_generator:
-                audio_chunks.append(chunk)
-
-            return b"".join(audio_chunks)
+            ):
+                yield chunk
 
         except Exception as e:
             error_msg = str(e)
@@ -113,6 +155,45 @@ class AudioService:
                 raise ElevenLabsAPIError(500, error_msg)
             raise AudioServiceError(f"Audio synthesis failed: {e}")
 
+    async def synthesize_lines(self, lines: List[DialogueLine]) -> List[bytes]:
+        """
+        Convert dialogue lines to audio, several at a time.
+
+        Up to ``max_concurrent_syntheses`` lines are in flight at once, so
+        network waits overlap; the segments keep the order of ``lines``. When
+        a line fails, the lines still in flight are cancelled.
+
+        Args:
+            lines: DialogueLines to synthesize
+
+        Returns:
+            Audio bytes for each line, in input order
+
+        Raises:
+            AudioServiceError: If any line fails to synthesize
+        """
+        semaphore = asyncio.Semaphore(self.max_concurrent_syntheses)
+
+        async def synthesize(idx: int, line: DialogueLine) -> bytes:
+            async with semaphore:
+                try:
+                    logger.debug(f"Synthesizing line {idx + 1}/{len(lines)}")
+                    return await self.synthesize_dialogue(line)
+                except Exception as e:
+                    logger.error(f"Failed to synthesize line {idx + 1}: {e}")
+                    raise AudioServiceError(
+                        f"Failed to synthesize dialogue line {idx + 1}: {e}"
+                    )
+
+        try:
+            async with asyncio.TaskGroup() as tg:
+                tasks = [
+                    tg.create_task(synthesize(idx, line)) for idx, line in enumerate(lines)
+                ]
+        except ExceptionGroup as group:
+            raise group.exceptions[0]
+        return [task.result() for task in tasks]
+
     def _concatenate_audio(self, segments: List[bytes]) -> bytes:
         """
         Merge audio segments into a single byte array.
@@ -129,8 +210,9 @@ class AudioService:
         """
         Generate full episode audio from a PodcastScript.
 
-        Processes all DialogueLines sequentially, concatenates audio,
-        and uploads to Supabase storage.
+        Synthesizes all DialogueLines (up to max_concurrent_syntheses at
+        once, keeping script order), concatenates audio, and uploads to
+        Supabase storage.
 
         Args:
             script: PodcastScript to convert to audio
@@ -144,17 +226,8 @@ class AudioService:
         if not script.chapters:
             raise AudioServiceError("Script has no dialogue lines to process")
 
-        audio_segments: List[bytes] = []
-
-        # Process each dialogue line sequentially (Req 3.1)
-        for idx, line in enumerate(script.chapters):
-            try:
-                logger.debug(f"Synthesizing line {idx + 1}/{len(script.chapters)}")
-                audio_data = await self.synthesize_dialogue(line)
-                audio_segments.append(audio_data)
-            except Exception as e:
-                logger.error(f"Failed to synthesize line {idx + 1}: {e}")
-                raise AudioServiceError(f"Failed to synthesize dialogue line {idx + 1}: {e}")
+        # Segments come back in chapter order (Req 3.1)
+        audio_segments = await self.synthesize_lines(script.chapters)
 
         # Concatenate all audio segments
         full_audio = self._concatenate_audio(audio_segments)
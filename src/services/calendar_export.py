@@ -109,7 +109,7 @@ def export_schedule_to_ics(output_file: str = "murder_index_schedule.ics") -> st
     
     events = []
     for episode in upcoming:
-        start = datetime.fromisoformat(episode.scheduled_date)
+        start = episode.scheduled_date
         
         # Create event
         events.append({
@@ -143,7 +143,7 @@ python3 podcast_manager.py run
 
 def get_google_calendar_url(episode) -> str:
     """Generate a Google Calendar add event URL."""
-    start = datetime.fromisoformat(episode.scheduled_date)
+    start = episode.scheduled_date
     end = start + timedelta(hours=1)
     
     # Format for Google Calendar
@@ -1,18 +1,144 @@
 """Crawler service for scraping cold case data using Firecrawl."""
 
+import asyncio
 import hashlib
 import logging
 import re
 from typing import Any, List, Optional
-from uuid import uuid4
+from uuid import UUID
 
+import httpx
 from firecrawl import AsyncFirecrawlApp
 
 from src.models.case import CaseFile, Evidence
 from src.utils.errors import CrawlerError, FirecrawlAPIError
+from src.utils.http import DEFAULT_LIMITS, get_ssl_context
 
 logger = logging.getLogger(__name__)
 
+# Upper bound on concurrent Firecrawl scrape requests per service instance
+MAX_CONCURRENT_SCRAPES = 10
+
+# Title/location/date sit near the top of a page; only this prefix is searched
+FIELD_SCAN_LIMIT = 8192
+
+# Evidence can appear anywhere, but very long pages are truncated for scanning
+EVIDENCE_SCAN_LIMIT = 65536
+
+# Parsed CaseFiles kept per service instance; the cache is cleared when full
+PARSE_CACHE_MAX_ENTRIES = 4096
+
+# Every evidence pattern requires one of these (lowercase) substrings, so pages
+# without any of them can skip the regex scan entirely
+EVIDENCE_KEYWORDS = (
+    "evidence",
+    "clue",
+    "finding",
+    "discover",
+    "found",
+    "witness",
+    "testimony",
+    "forensic",
+    "dna",
+    "fingerprint",
+    "weapon",
+)
+
+# Search hits that mention none of these (lowercase) terms near the top are
+# navigation, listing or error pages and are not worth parsing
+CASE_PAGE_KEYWORDS = (
+    "cold case",
+    "homicide",
+    "murder",
+    "missing",
+    "unsolved",
+    "victim",
+)
+CASE_PAGE_SCAN_LIMIT = 16384
+
+_has_digit = re.compile(r"\d").search
+
+# Titles almost always sit in the first few lines; only those are scanned by
+# prefix before falling back to the multiline heading regexes
+HEADING_SCAN_LINES = 50
+_H1_RE = re.compile(r"^#\s+(.+?)$", re.MULTILINE)
+_HEADING_RE = re.compile(r"^#{1,3}\s+(.+?)$", re.MULTILINE)
+
+
+def _compile_folded(*patterns: str, flags: int = 0) -> tuple[tuple[re.Pattern[str], ...], ...]:
+    """
+    Compile lowercase patterns twice: case-insensitive and case-sensitive.
+
+    The case-sensitive variant is run against pre-lowercased ASCII text, which
+    is cheaper than IGNORECASE matching. Lowercasing can change the length of
+    non-ASCII text (e.g. "İ"), so such text keeps the IGNORECASE variant.
+    """
+    return (
+        tuple(re.compile(pattern, flags | re.IGNORECASE) for pattern in patterns),
+        tuple(re.compile(pattern, flags) for pattern in patterns),
+    )
+
+
+def _fold_ascii(text: str) -> Optional[str]:
+    """Lowercase text for the case-sensitive patterns, or None if not ASCII."""
+    return text.lower() if text.isascii() else None
+
+
+# Patterns for evidence-related content: labelled findings and bullet points.
+# The bullet pattern is bounded and line-local so long non-matching lines
+# cannot trigger quadratic backtracking.
+_EVIDENCE_PATTERNS, _EVIDENCE_PATTERNS_FOLDED = _compile_folded(
+    r"(?:evidence|clue|finding|discovery):\s*(.+?)(?:\n|$)",
+    r"[-*]\s*([^\n]{0,300}?(?:found|discovered|evidence|witness|testimony)[^\n]{0,300})(?:\n|$)",
+    r"(?:physical evidence|forensic|dna|fingerprint|weapon):\s*(.+?)(?:\n|$)",
+)
+
+# Genuine evidence rarely exceeds a couple dozen items; the rest is noise
+MAX_EVIDENCE_ITEMS = 50
+
+# Evidence classification terms, listed in category priority order
+_TERM_TO_TYPE = {
+    "dna": "physical",
+    "fingerprint": "physical",
+    "blood": "physical",
+    "weapon": "physical",
+    "forensic": "physical",
+    "physical": "physical",
+    "witness": "testimonial",
+    "testimony": "testimonial",
+    "saw": "testimonial",
+    "heard": "testimonial",
+    "statement": "testimonial",
+    "document": "documentary",
+    "record": "documentary",
+    "letter": "documentary",
+    "email": "documentary",
+    "phone": "documentary",
+}
+_TYPE_PRIORITY = {"physical": 0, "testimonial": 1, "documentary": 2}
+
+# "key: value" labels for location and date, found together in a single pass.
+# The lookahead lets overlapping labels (e.g. "Location: X. Date: Y") both match.
+(_FIELD_LABEL_RE,), (_FIELD_LABEL_RE_FOLDED,) = _compile_folded(
+    r"(?=(?:(?P<location>location|place|city|town|county|state)"
+    r"|(?P<date>date|occurred|happened|on)):\s*(?P<value>[^\n]+))",
+)
+# Matched case-insensitively, so [a-z] accepts capitals as well
+_LOCATION_PATTERNS, _LOCATION_PATTERNS_FOLDED = _compile_folded(
+    r"(?:in|at|near)\s+([a-z][a-z]+(?:\s+[a-z][a-z]+)*,\s*[a-z]{2})",
+    r"([a-z][a-z]+(?:\s+[a-z][a-z]+)*,\s*[a-z][a-z]+)",
+)
+# Date patterns in priority order, each with the literal (if any) it needs
+_DATE_PATTERNS: tuple[tuple[Optional[str], re.Pattern[str]], ...] = (
+    ("/", re.compile(r"(\d{1,2}/\d{1,2}/\d{2,4})")),
+    (None, re.compile(r"(\w+\s+\d{1,2},?\s+\d{4})")),
+    ("-", re.compile(r"(\d{4}-\d{2}-\d{2})")),
+)
+# Lookahead so overlapping terms (e.g. "recordna") are all seen in one pass
+(_EVIDENCE_TYPE_RE,), (_EVIDENCE_TYPE_RE_FOLDED,) = _compile_folded(
+    "(?=(" + "|".join(_TERM_TO_TYPE) + "))"
+)
+
 
 class CrawlerService:
     """Service for crawling and scraping cold case data from web sources."""
@@ -21,6 +147,7 @@ class CrawlerService:
         self,
         firecrawl_api_key: str,
         supabase_client: Optional[Any] = None,
+        legacy_md5_ids: bool = False,
     ) -> None:
         """
         Initialize the CrawlerService.
@@ -28,9 +155,63 @@ class CrawlerService:
         Args:
             firecrawl_api_key: API key for Firecrawl service
             supabase_client: Supabase client for persistence (optional)
+            legacy_md5_ids: Derive case/evidence IDs with MD5 instead of BLAKE2b,
+                matching IDs already stored by earlier versions
         """
         self.firecrawl = AsyncFirecrawlApp(api_key=firecrawl_api_key)
         self.supabase = supabase_client
+        self._http = self._share_http_client()
+        self.legacy_md5_ids = legacy_md5_ids
+        self._parse_cache: dict[bytes, CaseFile] = {}
+        self._scrape_semaphore = asyncio.Semaphore(MAX_CONCURRENT_SCRAPES)
+
+    def _sdk_http_client(self) -> Any:
+        """Get the Firecrawl SDK's async HTTP wrapper, or None if it has none."""
+        return getattr(getattr(self.firecrawl, "_v2_client", None), "async_http_client", None)
+
+    def _share_http_client(self) -> Optional[httpx.AsyncClient]:
+        """
+        Give the Firecrawl SDK a pooled HTTP/2 client with keep-alive.
+
+        The httpx-based SDK builds its client with keep-alive disabled, so every
+        scrape pays a fresh TCP+TLS handshake. The SDK takes no client argument,
+        so its client is swapped for a pooled one with the same base URL,
+        headers and timeout. SDKs without an httpx transport are left untouched.
+
+        Returns:
+            The pooled client if one was installed, None otherwise
+        """
+        sdk_http = self._sdk_http_client()
+        sdk_client = getattr(sdk_http, "_client", None)
+        if not isinstance(sdk_client, httpx.AsyncClient):
+            return None
+
+        client = httpx.AsyncClient(
+            base_url=sdk_client.base_url,
+            headers=sdk_client.headers,
+            timeout=sdk_client.timeout,
+            limits=DEFAULT_LIMITS,
+            http2=True,
+            verify=get_ssl_context(),
+        )
+        # The replaced client has not sent a request, so it holds no connections
+        sdk_http._client = client
+        return client
+
+    async def aclose(self) -> None:
+        """
+        Close the crawler's HTTP client.
+
+        Closes the pooled client when one was installed, otherwise the SDK's
+        own client through its ``close()``; SDK versions without one are left
+        alone.
+        """
+        if self._http is not None:
+            await self._http.aclose()
+            return
+        close = getattr(self._sdk_http_client(), "close", None)
+        if close is not None:
+            await close()
 
     async def search_cold_cases(
         self,
@@ -69,31 +250,29 @@ class CrawlerService:
             # Response has 'web' attribute with list of SearchResultWeb objects
             urls_to_scrape: List[str] = []
             
-            if hasattr(response, 'web') and response.web:
+            web = getattr(response, "web", None)
+            if web:
                 # Extract URLs from SearchResultWeb objects
-                for result in response.web:
-                    if hasattr(result, 'url') and result.url:
-                        urls_to_scrape.append(result.url)
+                for result in web:
+                    if len(urls_to_scrape) >= limit:
+                        break
+                    result_url = getattr(result, "url", None)
+                    if result_url:
+                        urls_to_scrape.append(result_url)
             elif isinstance(response, dict):
                 # Fallback for dict response format
                 results = response.get("data", []) or response.get("web", [])
                 for result in results:
+                    if len(urls_to_scrape) >= limit:
+                        break
                     if isinstance(result, dict) and result.get("url"):
                         urls_to_scrape.append(result["url"])
 
-            # Scrape each URL to get full content
-            case_files: List[CaseFile] = []
-            for url in urls_to_scrape[:limit]:
-                try:
-                    case_file = await self.scrape_case_url(url)
-                    if case_file:
-                        case_files.append(case_file)
-                except Exception as e:
-                    # Log error and continue processing remaining sources (Req 1.4)
-                    logger.warning(f"Failed to scrape URL {url}: {e}")
-                    continue
-
-            return case_files
+            # Scrape all URLs concurrently to get full content
+            scraped = await asyncio.gather(
+                *(self._safe_scrape(url) for url in urls_to_scrape)
+            )
+            return [case_file for case_file in scraped if case_file]
 
         except Exception as e:
             if "status" in str(e).lower() or "error" in str(e).lower():
@@ -128,20 +307,64 @@ class CrawlerService:
             # Handle ScrapeResponse object from Firecrawl v2
             response_dict: dict[str, Any] = {"url": url}
             
-            if hasattr(response, 'markdown'):
-                response_dict["markdown"] = response.markdown
-            if hasattr(response, 'metadata'):
-                response_dict["metadata"] = response.metadata if isinstance(response.metadata, dict) else {}
+            markdown = getattr(response, "markdown", None)
+            if markdown is not None:
+                response_dict["markdown"] = markdown
+            metadata = getattr(response, "metadata", None)
+            if metadata is not None:
+                response_dict["metadata"] = metadata if isinstance(metadata, dict) else {}
             elif isinstance(response, dict):
                 response_dict = response
                 response_dict["url"] = url
 
-            return self._parse_case_from_response(response_dict)
+            if not self._looks_like_case_page(response_dict.get("markdown")):
+                logger.info(f"Skipping non-case page: {url}")
+                return None
+
+            # Regex scanning and model validation are CPU-bound; keep them off
+            # the event loop so concurrent scrapes keep making progress
+            return await asyncio.to_thread(self._parse_case_from_response, response_dict)
 
         except Exception as e:
             logger.error(f"Failed to scrape URL {url}: {e}")
             raise FirecrawlAPIError(500, str(e))
 
+    @staticmethod
+    def _looks_like_case_page(markdown: Optional[str]) -> bool:
+        """
+        Cheap keyword gate run before the full parse pipeline.
+
+        Args:
+            markdown: Scraped markdown content
+
+        Returns:
+            True if the page mentions any case keyword near the top
+        """
+        if not markdown:
+            return False
+        text = markdown[:CASE_PAGE_SCAN_LIMIT].lower()
+        return any(keyword in text for keyword in CASE_PAGE_KEYWORDS)
+
+    async def _safe_scrape(self, url: str) -> Optional[CaseFile]:
+        """
+        Scrape a URL, logging and swallowing failures.
+
+        Concurrency is bounded by the service's scrape semaphore.
+
+        Args:
+            url: URL to scrape for cold case data
+
+        Returns:
+            CaseFile if successfully scraped, None otherwise
+        """
+        async with self._scrape_semaphore:
+            try:
+                return await self.scrape_case_url(url)
+            except Exception as e:
+                # Log error and continue processing remaining sources (Req 1.4)
+                logger.warning(f"Failed to scrape URL {url}: {e}")
+                return None
+
     def _parse_case_from_response(
         self,
         response: dict[str, Any],
@@ -167,19 +390,32 @@ class CrawlerService:
         metadata = response.get("metadata", {}) or {}
         url = response.get("url", "")
 
+        # Skip re-parsing content already seen under the same URL and title
+        cache_key = self._parse_cache_key(url, metadata, markdown)
+        cached = self._parse_cache.get(cache_key)
+        if cached is not None:
+            return cached.model_copy(deep=True)
+
         # Generate case_id from URL or content hash
         case_id = self._generate_case_id(url, markdown)
 
+        # Single-value fields are only searched for in the page header
+        header = markdown[:FIELD_SCAN_LIMIT]
+        header_folded = _fold_ascii(header)
+
         # Extract title from metadata or markdown
-        title = self._extract_title(metadata, markdown)
+        title = self._extract_title(metadata, header)
         if not title:
             return None
 
+        # Find labelled location/date values in one pass over the header
+        location_label, date_label = self._scan_field_labels(header, header_folded)
+
         # Extract location from content
-        location = self._extract_location(markdown)
+        location = self._extract_location(header, location_label, header_folded)
 
         # Extract date if available
-        date_occurred = self._extract_date(markdown)
+        date_occurred = self._extract_date(header, date_label)
 
         # Extract evidence items
         evidence_list = self._extract_evidence(markdown)
@@ -188,7 +424,7 @@ class CrawlerService:
         source_urls = [url] if url else []
 
         try:
-            return CaseFile(
+            case_file = CaseFile(
                 case_id=case_id,
                 title=title,
                 location=location,
@@ -201,6 +437,20 @@ class CrawlerService:
             logger.warning(f"Failed to create CaseFile: {e}")
             return None
 
+        if len(self._parse_cache) >= PARSE_CACHE_MAX_ENTRIES:
+            self._parse_cache.clear()
+        self._parse_cache[cache_key] = case_file
+        return case_file.model_copy(deep=True)
+
+    @staticmethod
+    def _parse_cache_key(url: str, metadata: dict[str, Any], markdown: str) -> bytes:
+        """Content-addressed key covering every input the parser reads."""
+        hasher = hashlib.blake2b(digest_size=16)
+        for part in (url, str(metadata.get("title") or ""), markdown):
+            hasher.update(part.encode(errors="surrogatepass"))
+            hasher.update(b"\0")
+        return hasher.digest()
+
     def _extract_evidence(self, markdown: str) -> List[Evidence]:
         """
         Parse evidence items from markdown content.
@@ -214,33 +464,50 @@ class CrawlerService:
             List of distinct Evidence items
         """
         evidence_list: List[Evidence] = []
-        seen_ids: set[str] = set()
-
-        # Pattern to find evidence-related content
-        # Look for bullet points, numbered lists, or sections mentioning evidence
-        evidence_patterns = [
-            r"(?:evidence|clue|finding|discovery):\s*(.+?)(?:\n|$)",
-            r"[-*]\s*(.+?(?:found|discovered|evidence|witness|testimony).+?)(?:\n|$)",
-            r"(?:physical evidence|forensic|dna|fingerprint|weapon):\s*(.+?)(?:\n|$)",
-        ]
-
-        for pattern in evidence_patterns:
-            matches = re.findall(pattern, markdown, re.IGNORECASE)
-            for match in matches:
-                description = match.strip()
-                if not description or len(description) < 10:
+        seen_keys: set[bytes] = set()
+
+        if len(markdown) > EVIDENCE_SCAN_LIMIT:
+            logger.warning(
+                f"Markdown is {len(markdown)} chars; scanning the first "
+                f"{EVIDENCE_SCAN_LIMIT} for evidence"
+            )
+            markdown = markdown[:EVIDENCE_SCAN_LIMIT]
+
+        # Cheap substring prefilter before running the regex alternations
+        markdown_lower = markdown.lower()
+        if not any(keyword in markdown_lower for keyword in EVIDENCE_KEYWORDS):
+            return evidence_list
+
+        # Match on the lowercased copy when offsets line up with the original
+        if markdown.isascii():
+            patterns, haystack = _EVIDENCE_PATTERNS_FOLDED, markdown_lower
+        else:
+            patterns, haystack = _EVIDENCE_PATTERNS, markdown
+
+        for pattern in patterns:
+            for match in pattern.finditer(haystack):
+                start, end = match.span(1)
+                # Stripping only shortens, so short spans are rejected unread
+                if end - start < 10:
+                    continue
+                description = markdown[start:end].strip()
+                if len(description) < 10:
                     continue
 
-                # Determine evidence type
-                evidence_type = self._classify_evidence_type(description)
+                # Deduplicate before any classification or model validation;
+                # descriptions differing only in case collapse to one item
+                dedup_key = hashlib.blake2b(
+                    description.lower().encode(), digest_size=8
+                ).digest()
+                if dedup_key in seen_keys:
+                    continue
+                seen_keys.add(dedup_key)
 
                 # Generate unique evidence_id
                 evidence_id = self._generate_evidence_id(description)
 
-                # Ensure uniqueness
-                if evidence_id in seen_ids:
-                    continue
-                seen_ids.add(evidence_id)
+                # Determine evidence type
+                evidence_type = self._classify_evidence_type(description)
 
                 try:
                     evidence = Evidence(
@@ -252,48 +519,52 @@ class CrawlerService:
                 except Exception:
                     continue
 
+                if len(evidence_list) >= MAX_EVIDENCE_ITEMS:
+                    return evidence_list
+
         return evidence_list
 
     def _classify_evidence_type(self, description: str) -> str:
         """Classify evidence type based on description content."""
-        description_lower = description.lower()
-
-        if any(
-            term in description_lower
-            for term in ["dna", "fingerprint", "blood", "weapon", "forensic", "physical"]
-        ):
-            return "physical"
-        elif any(
-            term in description_lower
-            for term in ["witness", "testimony", "saw", "heard", "statement"]
-        ):
-            return "testimonial"
-        elif any(
-            term in description_lower
-            for term in ["document", "record", "letter", "email", "phone"]
-        ):
-            return "documentary"
+        # Single scan over all terms; the highest-priority category found wins
+        best: Optional[str] = None
+        folded = _fold_ascii(description)
+        if folded is not None:
+            matches = _EVIDENCE_TYPE_RE_FOLDED.finditer(folded)
         else:
-            return "circumstantial"
+            matches = _EVIDENCE_TYPE_RE.finditer(description)
+        for match in matches:
+            evidence_type = _TERM_TO_TYPE.get(match.group(1).casefold())
+            if evidence_type == "physical":
+                return evidence_type
+            if evidence_type and (
+                best is None or _TYPE_PRIORITY[evidence_type] < _TYPE_PRIORITY[best]
+            ):
+                best = evidence_type
+        return best or "circumstantial"
+
+    def _digest16(self, data: str) -> bytes:
+        """Hash text to 16 bytes for deterministic UUID generation."""
+        if self.legacy_md5_ids:
+            return hashlib.md5(data.encode()).digest()
+        return hashlib.blake2b(data.encode(), digest_size=16).digest()
 
     def _generate_case_id(self, url: str, content: str) -> str:
         """Generate a unique case ID as a valid UUID."""
         if url:
             # Use URL hash to generate deterministic UUID
-            hash_bytes = hashlib.md5(url.encode()).digest()
+            hash_bytes = self._digest16(url)
         else:
             # Fall back to content hash
-            hash_bytes = hashlib.md5(content.encode()).digest()
+            hash_bytes = self._digest16(content)
         
         # Convert to UUID format
-        import uuid
-        return str(uuid.UUID(bytes=hash_bytes))
+        return str(UUID(bytes=hash_bytes))
 
     def _generate_evidence_id(self, description: str) -> str:
         """Generate a unique evidence ID as a valid UUID."""
-        import uuid
-        hash_bytes = hashlib.md5(description.encode()).digest()
-        return str(uuid.UUID(bytes=hash_bytes))
+        hash_bytes = self._digest16(description)
+        return str(UUID(bytes=hash_bytes))
 
     def _extract_title(
         self,
@@ -306,52 +577,142 @@ class CrawlerService:
             return str(metadata["title"]).strip()
 
         # Try to find H1 heading in markdown
-        h1_match = re.search(r"^#\s+(.+?)$", markdown, re.MULTILINE)
+        h1 = self._scan_heading_lines(markdown, max_level=1)
+        if h1:
+            return h1
+        h1_match = _H1_RE.search(markdown)
         if h1_match:
             return h1_match.group(1).strip()
 
         # Try to find any heading
-        heading_match = re.search(r"^#{1,3}\s+(.+?)$", markdown, re.MULTILINE)
+        heading = self._scan_heading_lines(markdown, max_level=3)
+        if heading:
+            return heading
+        heading_match = _HEADING_RE.search(markdown)
         if heading_match:
             return heading_match.group(1).strip()
 
         # Fall back to first line
-        first_line = markdown.strip().split("\n")[0]
+        first_line = markdown.lstrip().partition("\n")[0]
         if first_line:
             return first_line[:100].strip()
 
         return "Unknown Case"
 
-    def _extract_location(self, markdown: str) -> str:
-        """Extract location from markdown content."""
-        # Common location patterns
-        location_patterns = [
-            r"(?:location|place|city|town|county|state):\s*(.+?)(?:\n|$)",
-            r"(?:in|at|near)\s+([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*,\s*[A-Z]{2})",
-            r"([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*,\s*[A-Z][a-z]+)",
-        ]
-
-        for pattern in location_patterns:
-            match = re.search(pattern, markdown, re.IGNORECASE)
+    @staticmethod
+    def _scan_heading_lines(markdown: str, max_level: int) -> Optional[str]:
+        """
+        Find a heading by line prefix in the first HEADING_SCAN_LINES lines.
+
+        Args:
+            markdown: Markdown content to scan
+            max_level: Deepest heading level to accept (1 for H1 only)
+
+        Returns:
+            The heading text, or None when the regex fallback must decide
+        """
+        for line in markdown.split("\n", HEADING_SCAN_LINES)[:HEADING_SCAN_LINES]:
+            if not line.startswith("#"):
+                continue
+            rest = line.lstrip("#")
+            if len(line) - len(rest) > max_level or (rest and not rest[0].isspace()):
+                continue
+            # A bare marker can still match the regex across the newline
+            return rest.strip() or None
+        return None
+
+    def _scan_field_labels(
+        self,
+        markdown: str,
+        folded: Optional[str] = None,
+    ) -> tuple[Optional[str], Optional[str]]:
+        """
+        Find the first "location:"-style and "date:"-style labels in one pass.
+
+        Args:
+            markdown: Markdown content to scan
+            folded: Lowercased ASCII copy of markdown, from _fold_ascii
+
+        Returns:
+            Tuple of (location label value, date label value); None when absent
+        """
+        if ":" not in markdown:
+            return None, None
+
+        if folded is not None:
+            matches = _FIELD_LABEL_RE_FOLDED.finditer(folded)
+        else:
+            matches = _FIELD_LABEL_RE.finditer(markdown)
+
+        location: Optional[str] = None
+        date: Optional[str] = None
+        for match in matches:
+            value = markdown[match.start("value"):match.end("value")]
+            if match.group("location") is not None:
+                if location is None:
+                    location = value
+            elif date is None:
+                date = value
+            if location is not None and date is not None:
+                break
+        return location, date
+
+    def _extract_location(
+        self,
+        markdown: str,
+        label: Optional[str] = None,
+        folded: Optional[str] = None,
+    ) -> str:
+        """
+        Extract location from markdown content.
+
+        Args:
+            markdown: Markdown content to parse
+            label: Value of the first location label, from _scan_field_labels
+            folded: Lowercased ASCII copy of markdown, from _fold_ascii
+        """
+        if label is not None:
+            location = label.strip()
+            if len(location) > 2:
+                return location[:100]
+
+        # Every remaining location pattern needs a comma
+        if "," not in markdown:
+            return "Unknown Location"
+
+        if folded is not None:
+            patterns, haystack = _LOCATION_PATTERNS_FOLDED, folded
+        else:
+            patterns, haystack = _LOCATION_PATTERNS, markdown
+
+        for pattern in patterns:
+            match = pattern.search(haystack)
             if match:
-                location = match.group(1).strip()
+                location = markdown[match.start(1):match.end(1)].strip()
                 if location and len(location) > 2:
                     return location[:100]
 
         return "Unknown Location"
 
-    def _extract_date(self, markdown: str) -> Optional[str]:
-        """Extract date from markdown content."""
-        # Common date patterns
-        date_patterns = [
-            r"(?:date|occurred|happened|on):\s*(.+?)(?:\n|$)",
-            r"(\d{1,2}/\d{1,2}/\d{2,4})",
-            r"(\w+\s+\d{1,2},?\s+\d{4})",
-            r"(\d{4}-\d{2}-\d{2})",
-        ]
-
-        for pattern in date_patterns:
-            match = re.search(pattern, markdown, re.IGNORECASE)
+    def _extract_date(self, markdown: str, label: Optional[str] = None) -> Optional[str]:
+        """
+        Extract date from markdown content.
+
+        Args:
+            markdown: Markdown content to parse
+            label: Value of the first date label, from _scan_field_labels
+        """
+        if label is not None:
+            return label.strip()[:50]
+
+        # Every remaining date pattern needs a digit
+        if not _has_digit(markdown):
+            return None
+
+        for required, pattern in _DATE_PATTERNS:
+            if required is not None and required not in markdown:
+                continue
+            match = pattern.search(markdown)
             if match:
                 return match.group(1).strip()[:50]
 
@@ -390,16 +751,19 @@ class CrawlerService:
             if not result.data:
                 raise CrawlerError("Failed to insert case into database")
 
-            # Insert evidence items
-            for evidence in case.evidence_list:
-                evidence_data = {
+            # Insert all evidence items in a single request
+            evidence_rows = [
+                {
                     "evidence_id": evidence.evidence_id,
                     "case_id": case.case_id,
                     "description": evidence.description,
                     "evidence_type": evidence.evidence_type,
                     "source_url": evidence.source_url,
                 }
-                self.supabase.table("evidence").insert(evidence_data).execute()
+                for evidence in case.evidence_list
+            ]
+            if evidence_rows:
+                self.supabase.table("evidence").insert(evidence_rows).execute()
 
             logger.info(f"Persisted case {case.case_id} with {len(case.evidence_list)} evidence items")
             return case.case_id
@@ -425,4 +789,5 @@ def create_crawler_service(supabase_client: Optional[Any] = None) -> CrawlerServ
     return CrawlerService(
         firecrawl_api_key=settings.firecrawl_api_key,
         supabase_client=supabase_client,
+        legacy_md5_ids=settings.crawler_legacy_md5_ids,
     )
@@ -1,14 +1,23 @@
 """Database service for Supabase operations."""
 
+import asyncio
+import json
 import logging
-from datetime import datetime
-from typing import Any, List, Optional
-from uuid import uuid4
+import time
+from datetime import UTC, datetime
+from functools import lru_cache
+from typing import Any, Callable, List, Optional, cast
+from uuid import UUID, uuid4
+
+import httpx
+from cachetools import LFUCache, TTLCache
+from postgrest.exceptions import APIError
 
 from src.models.case import CaseFile, Evidence
 from src.models.job import JobStatus
 from src.models.script import DialogueLine, PodcastScript
-from src.utils.errors import ColdCaseCrawlerError
+from src.utils.errors import ColdCaseCrawlerError, TransientError
+from src.utils.retry import with_retry
 
 logger = logging.getLogger(__name__)
 
@@ -19,20 +28,393 @@ class DatabaseError(ColdCaseCrawlerError):
     pass
 
 
+class TransientDatabaseError(DatabaseError, TransientError):
+    """A request that failed before reaching Postgres, so it is safe to retry."""
+
+    pass
+
+
+# PostgREST errors raised when it could not reach or get a connection to Postgres
+_TRANSIENT_POSTGREST_CODES = frozenset({"PGRST000", "PGRST001", "PGRST002", "PGRST003"})
+
+
+@with_retry(max_attempts=3, base_delay=0.05, exceptions=(TransientDatabaseError,))
+async def _execute(query: Any) -> Any:
+    """
+    Execute a PostgREST query, retrying failures that never reached Postgres.
+
+    Only connection-level failures are retried, so writes cannot be applied
+    twice; constraint violations and other API errors surface immediately.
+
+    Args:
+        query: PostgREST request builder, ready to execute
+
+    Returns:
+        The PostgREST response
+
+    Raises:
+        TransientDatabaseError: If every attempt failed to connect
+    """
+    try:
+        return query.execute()
+    except (httpx.ConnectError, httpx.ConnectTimeout, httpx.PoolTimeout) as e:
+        raise TransientDatabaseError(f"Could not connect to Supabase: {e}") from e
+    except APIError as e:
+        if e.code in _TRANSIENT_POSTGREST_CODES:
+            raise TransientDatabaseError(f"PostgREST could not reach Postgres: {e}") from e
+        raise
+
+
+# Column projections: exactly what the models hydrate, nothing more
+CASE_COLUMNS = "case_id, title, location, date_occurred, raw_content, source_urls, created_at"
+EVIDENCE_COLUMNS = "evidence_id, description, evidence_type, source_url"
+SCRIPT_COLUMNS = "script_id, case_id, episode_title, chapters, social_hooks, created_at"
+JOB_COLUMNS = "job_id, job_type, status, result_id, error_message, created_at, updated_at"
+
+# Case columns plus their evidence rows, fetched in one PostgREST request
+CASE_WITH_EVIDENCE = f"{CASE_COLUMNS}, evidence({EVIDENCE_COLUMNS})"
+
+# The same shape as CASE_WITH_EVIDENCE, for the direct Postgres read path
+_CASE_WITH_EVIDENCE_SQL = """
+    SELECT c.case_id, c.title, c.location, c.date_occurred, c.raw_content,
+           c.source_urls, c.created_at,
+           COALESCE(
+               json_agg(
+                   json_build_object(
+                       'evidence_id', e.evidence_id,
+                       'description', e.description,
+                       'evidence_type', e.evidence_type,
+                       'source_url', e.source_url
+                   )
+               ) FILTER (WHERE e.evidence_id IS NOT NULL),
+               '[]'
+           ) AS evidence
+    FROM cases c
+    LEFT JOIN evidence e ON e.case_id = c.case_id
+    WHERE c.case_id = $1
+    GROUP BY c.case_id
+"""
+
+_EVIDENCE_BY_CASE_SQL = f"SELECT {EVIDENCE_COLUMNS} FROM evidence WHERE case_id = $1"
+
+_JOB_BY_ID_SQL = f"SELECT {JOB_COLUMNS} FROM jobs WHERE job_id = $1"
+
+# Only finished jobs are cached: another worker may move a pending or
+# processing job on at any time, and pollers must see that immediately
+_TERMINAL_JOB_STATUSES = frozenset({"completed", "failed"})
+
+# asyncpg pools shared by every DatabaseService, keyed by DSN
+_pools: dict[str, Any] = {}
+_pool_lock = asyncio.Lock()
+
+
+async def _init_connection(conn: Any) -> None:
+    """Decode json/jsonb columns to Python objects, as PostgREST does."""
+    for type_name in ("json", "jsonb"):
+        await conn.set_type_codec(
+            type_name, encoder=json.dumps, decoder=json.loads, schema="pg_catalog"
+        )
+
+
+async def get_database_pool(dsn: str) -> Any:
+    """
+    Return the shared asyncpg pool for a Postgres DSN, creating it on first use.
+
+    Args:
+        dsn: Direct Postgres connection string for the Supabase database
+
+    Returns:
+        asyncpg connection pool
+
+    Raises:
+        ImportError: If asyncpg is not installed
+    """
+    pool = _pools.get(dsn)
+    if pool is None:
+        async with _pool_lock:
+            pool = _pools.get(dsn)
+            if pool is None:
+                import asyncpg
+
+                pool = await asyncpg.create_pool(
+                    dsn,
+                    min_size=10,
+                    max_size=50,
+                    max_inactive_connection_lifetime=300,
+                    # Supabase's pgbouncer/Supavisor poolers cannot reuse
+                    # server-side prepared statements across transactions
+                    statement_cache_size=0,
+                    server_settings={"jit": "off"},
+                    init=_init_connection,
+                )
+                _pools[dsn] = pool
+    return pool
+
+
+def _record_to_row(record: Any) -> dict[str, Any]:
+    """Convert an asyncpg record to the dict shape PostgREST returns."""
+    row = dict(record)
+    for key, value in row.items():
+        if isinstance(value, UUID):
+            row[key] = str(value)
+        elif isinstance(value, datetime):
+            row[key] = value.isoformat()
+    return row
+
+
+# Keyset pagination position: (created_at, case_id) of the last row seen
+CaseCursor = tuple[datetime, str]
+
+# Bound once: row hydration calls it for every timestamp column
+_fromiso = datetime.fromisoformat
+
+
+def _now_iso() -> str:
+    """Current UTC time as an ISO 8601 string with offset."""
+    return datetime.now(UTC).isoformat()
+
+
+def _rows_to_evidence(rows: List[dict[str, Any]]) -> List[Evidence]:
+    """Build Evidence items from evidence rows selected with EVIDENCE_COLUMNS."""
+    return [
+        Evidence(
+            evidence_id=ev["evidence_id"],
+            description=ev["description"],
+            evidence_type=ev["evidence_type"],
+            source_url=ev.get("source_url"),
+        )
+        for ev in rows
+    ]
+
+
+def _row_to_case(row: dict[str, Any]) -> CaseFile:
+    """
+    Build a CaseFile from a cases row with embedded evidence.
+
+    Args:
+        row: Row selected with CASE_WITH_EVIDENCE
+
+    Returns:
+        The hydrated CaseFile
+    """
+    return CaseFile(
+        case_id=row["case_id"],
+        title=row["title"],
+        location=row["location"],
+        date_occurred=row.get("date_occurred"),
+        raw_content=row["raw_content"],
+        evidence_list=_rows_to_evidence(row.get("evidence") or []),
+        source_urls=row.get("source_urls", []),
+        created_at=_fromiso(row["created_at"]),
+    )
+
+
+def _rows_to_cases(rows: List[dict[str, Any]]) -> List[CaseFile]:
+    """Hydrate case rows, skipping any that fail validation."""
+    cases = []
+    for row in rows:
+        try:
+            cases.append(_row_to_case(row))
+        except Exception as e:
+            logger.warning(f"Skipping malformed case row {row.get('case_id')}: {e}")
+    return cases
+
+
+def chapters_to_json(chapters: List[DialogueLine]) -> List[dict[str, Any]]:
+    """
+    Convert dialogue lines to the JSON rows stored in scripts.chapters.
+
+    DialogueLine's fields (speaker, text, emotion_tag) are all plain strings,
+    so copying each model's field dict is already JSON-ready and measures
+    faster than both a per-key dict literal and pydantic's model_dump.
+    """
+    return [vars(line).copy() for line in chapters]
+
+
+def _row_to_script(row: dict[str, Any]) -> PodcastScript:
+    """
+    Build a PodcastScript from a scripts row.
+
+    Args:
+        row: Row from the scripts table
+
+    Returns:
+        The hydrated PodcastScript
+    """
+    # Convert chapters from JSON
+    chapters = [
+        DialogueLine(
+            speaker=ch["speaker"],
+            text=ch["text"],
+            emotion_tag=ch.get("emotion_tag", "neutral"),
+        )
+        for ch in row.get("chapters", [])
+    ]
+
+    return PodcastScript(
+        script_id=row["script_id"],
+        case_id=row["case_id"],
+        episode_title=row["episode_title"],
+        chapters=chapters,
+        social_hooks=row.get("social_hooks", []),
+        created_at=_fromiso(row["created_at"]),
+    )
+
+
+def _row_to_job(row: dict[str, Any]) -> JobStatus:
+    """
+    Build a JobStatus from a jobs row.
+
+    Args:
+        row: Row selected with JOB_COLUMNS
+
+    Returns:
+        The hydrated JobStatus
+    """
+    return JobStatus(
+        job_id=row["job_id"],
+        job_type=row["job_type"],
+        status=row["status"],
+        result_id=row.get("result_id"),
+        error_message=row.get("error_message"),
+        created_at=_fromiso(row["created_at"]),
+        updated_at=_fromiso(row["updated_at"]),
+    )
+
+
+class _ExpiringLFUCache(LFUCache[str, tuple[float, Any]]):
+    """
+    LFU cache whose entries also expire after ``ttl`` seconds.
+
+    Case reads are heavily skewed toward active investigations, so eviction
+    keeps the most frequently read cases; the TTL still bounds how long a
+    write made outside this process can go unseen. Read entries with
+    ``get`` only, which treats expired entries as misses.
+    """
+
+    def __init__(self, maxsize: int, ttl: float, timer: Any = time.monotonic) -> None:
+        super().__init__(maxsize)
+        self._ttl = ttl
+        self._timer = timer
+
+    def __setitem__(self, key: Any, value: Any) -> None:
+        super().__setitem__(key, (self._timer() + self._ttl, value))
+
+    def get(self, key: Any, default: Any = None) -> Any:
+        entry = super().get(key)
+        if entry is None:
+            return default
+        expires, value = entry
+        if expires <= self._timer():
+            del self[key]
+            return default
+        return value
+
+
 class DatabaseService:
     """Service for Supabase database operations."""
 
-    def __init__(self, supabase_client: Any) -> None:
+    def __init__(
+        self,
+        supabase_client: Any,
+        db_url: str = "",
+        cache_size: int = 512,
+        cache_ttl: float = 60.0,
+    ) -> None:
         """
         Initialize the DatabaseService.
 
         Args:
             supabase_client: Supabase client instance
+            db_url: Direct Postgres DSN; when set, hot-path reads use a pooled
+                asyncpg connection instead of PostgREST
+            cache_size: Maximum entries per read cache (cases, evidence, scripts, jobs)
+            cache_ttl: Seconds a cached row is served before it is re-read
         """
         self.supabase = supabase_client
+        self.db_url = db_url
+
+        # postgrest-py table builders hold no query state (every select/insert/
+        # update/delete starts a fresh request), so one handle per table is reused
+        self._cases = supabase_client.table("cases")
+        self._evidence = supabase_client.table("evidence")
+        self._scripts = supabase_client.table("scripts")
+        self._media = supabase_client.table("media")
+        self._jobs = supabase_client.table("jobs")
+
+        # Writes through this service invalidate their keys; writes made
+        # elsewhere become visible once the TTL expires. Case columns and
+        # evidence are cached separately so evidence writes keep the case row.
+        self._case_cache = _ExpiringLFUCache(cache_size, cache_ttl)
+        self._evidence_cache: TTLCache[str, List[Evidence]] = TTLCache(cache_size, cache_ttl)
+        self._script_cache: TTLCache[str, PodcastScript] = TTLCache(cache_size, cache_ttl)
+        # Holds terminal jobs only; see _cache_job
+        self._job_cache: TTLCache[str, JobStatus] = TTLCache(cache_size, cache_ttl)
+
+    async def _get_pool(self) -> Any:
+        """Return the asyncpg pool, or None when reads should use PostgREST."""
+        if not self.db_url:
+            return None
+        try:
+            return await get_database_pool(self.db_url)
+        except ImportError:
+            logger.warning("asyncpg is not installed; falling back to PostgREST reads")
+            self.db_url = ""
+            return None
 
     # ==================== CASES CRUD ====================
 
+    async def _get_many(
+        self,
+        ids: List[str],
+        *,
+        table: Any,
+        columns: str,
+        key: str,
+        lookup: Callable[[str], Any],
+        store: Callable[[str, Any], None],
+        hydrate: Callable[[dict[str, Any]], Any],
+    ) -> List[Any]:
+        """
+        Fetch several rows by primary key in one ``in_`` query.
+
+        Cached entries are served locally; only the misses hit the database.
+        Results follow the order of ``ids``, with duplicates collapsed and
+        missing or malformed rows dropped.
+
+        Args:
+            ids: Primary key values to look up
+            table: PostgREST table handle to query
+            columns: Column projection for the select
+            key: Primary key column name
+            lookup: Returns the cached model for an ID, or None
+            store: Caches a freshly hydrated model under its ID
+            hydrate: Row-to-model converter
+
+        Returns:
+            Copies of the hydrated models that were found
+        """
+        wanted = list(dict.fromkeys(ids))
+        found = {}
+        for i in wanted:
+            cached = lookup(i)
+            if cached is not None:
+                found[i] = cached
+        missing = [i for i in wanted if i not in found]
+
+        if missing:
+            result = await _execute(table.select(columns).in_(key, missing))
+            for row in result.data or []:
+                try:
+                    model = hydrate(row)
+                except Exception as e:
+                    logger.warning(f"Skipping malformed row {row.get(key)}: {e}")
+                    continue
+                found[row[key]] = model
+                store(row[key], model)
+
+        return [found[i].model_copy(deep=True) for i in wanted if i in found]
+
     async def create_case(self, case: CaseFile) -> str:
         """
         Create a new case in the database.
@@ -46,6 +428,8 @@ class DatabaseService:
         Raises:
             DatabaseError: If creation fails
         """
+        self._case_cache.pop(case.case_id, None)
+        self._evidence_cache.pop(case.case_id, None)
         try:
             case_data = {
                 "case_id": case.case_id,
@@ -57,31 +441,42 @@ class DatabaseService:
                 "created_at": case.created_at.isoformat(),
             }
 
-            result = self.supabase.table("cases").insert(case_data).execute()
+            evidence_rows = [
+                self._evidence_row(case.case_id, evidence) for evidence in case.evidence_list
+            ]
+
+            # Case and evidence are written in one transaction (setup_database.sql)
+            result = await _execute(
+                self.supabase.rpc(
+                    "create_case_with_evidence",
+                    {"case_data": case_data, "evidence_rows": evidence_rows},
+                )
+            )
 
             if not result.data:
                 raise DatabaseError("Failed to insert case into database")
 
-            # Insert evidence items
-            for evidence in case.evidence_list:
-                await self._create_evidence(case.case_id, evidence)
-
             logger.info(f"Created case {case.case_id}")
             return case.case_id
 
         except Exception as e:
             raise DatabaseError(f"Failed to create case: {e}")
 
-    async def _create_evidence(self, case_id: str, evidence: Evidence) -> None:
-        """Create evidence record linked to a case."""
-        evidence_data = {
+    @staticmethod
+    def _evidence_row(case_id: str, evidence: Evidence) -> dict[str, Any]:
+        """Build the evidence table row for an Evidence item."""
+        return {
             "evidence_id": evidence.evidence_id,
             "case_id": case_id,
             "description": evidence.description,
             "evidence_type": evidence.evidence_type,
             "source_url": evidence.source_url,
         }
-        self.supabase.table("evidence").insert(evidence_data).execute()
+
+    async def _create_evidence(self, case_id: str, evidence: Evidence) -> None:
+        """Create a single evidence record linked to a case."""
+        self._evidence_cache.pop(case_id, None)
+        await _execute(self._evidence.insert(self._evidence_row(case_id, evidence)))
 
     async def get_case(self, case_id: str) -> Optional[CaseFile]:
         """
@@ -93,44 +488,93 @@ class DatabaseService:
         Returns:
             CaseFile if found, None otherwise
         """
+        cached = self._cached_case(case_id)
+        if cached is not None:
+            return cached.model_copy(deep=True)
+
         try:
-            result = self.supabase.table("cases").select("*").eq("case_id", case_id).execute()
+            pool = await self._get_pool()
+            cached_row = self._case_cache.get(case_id)
+            if cached_row is not None:
+                # Only the evidence was invalidated; keep the cached case columns
+                evidence = await self._fetch_evidence(case_id, pool)
+                self._evidence_cache[case_id] = evidence
+                return cast(
+                    CaseFile, cached_row.model_copy(update={"evidence_list": evidence}, deep=True)
+                )
 
-            if not result.data:
+            if pool is not None:
+                async with pool.acquire() as conn:
+                    record = await conn.fetchrow(_CASE_WITH_EVIDENCE_SQL, case_id)
+                row = _record_to_row(record) if record else None
+            else:
+                result = await _execute(
+                    self._cases.select(CASE_WITH_EVIDENCE)
+                    .eq("case_id", case_id)
+                    .maybe_single()
+                )
+                row = result.data if result is not None else None
+
+            if not row:
                 return None
 
-            case_data = result.data[0]
+            case = _row_to_case(row)
+            self._cache_case(case_id, case)
+            return case.model_copy(deep=True)
+
+        except Exception as e:
+            logger.error(f"Failed to get case {case_id}: {e}")
+            return None
 
-            # Fetch associated evidence
-            evidence_result = (
-                self.supabase.table("evidence").select("*").eq("case_id", case_id).execute()
+    def _cached_case(self, case_id: str) -> Optional[CaseFile]:
+        """Assemble a case from the case and evidence caches, or None on a miss."""
+        case = self._case_cache.get(case_id)
+        evidence = self._evidence_cache.get(case_id)
+        if case is None or evidence is None:
+            return None
+        return cast(CaseFile, case.model_copy(update={"evidence_list": evidence}))
+
+    def _cache_case(self, case_id: str, case: CaseFile) -> None:
+        """Cache a case's columns and its evidence under separate keys."""
+        self._case_cache[case_id] = case.model_copy(update={"evidence_list": []})
+        self._evidence_cache[case_id] = case.evidence_list
+
+    async def _fetch_evidence(self, case_id: str, pool: Any) -> List[Evidence]:
+        """Read just the evidence rows for a case."""
+        if pool is not None:
+            async with pool.acquire() as conn:
+                records = await conn.fetch(_EVIDENCE_BY_CASE_SQL, case_id)
+            rows = [_record_to_row(record) for record in records]
+        else:
+            result = await _execute(
+                self._evidence.select(EVIDENCE_COLUMNS).eq("case_id", case_id)
             )
+            rows = result.data or []
+        return _rows_to_evidence(rows)
 
-            evidence_list = []
-            for ev in evidence_result.data or []:
-                evidence_list.append(
-                    Evidence(
-                        evidence_id=ev["evidence_id"],
-                        description=ev["description"],
-                        evidence_type=ev["evidence_type"],
-                        source_url=ev.get("source_url"),
-                    )
-                )
+    async def get_cases(self, case_ids: List[str]) -> List[CaseFile]:
+        """
+        Retrieve several cases in a single query.
 
-            return CaseFile(
-                case_id=case_data["case_id"],
-                title=case_data["title"],
-                location=case_data["location"],
-                date_occurred=case_data.get("date_occurred"),
-                raw_content=case_data["raw_content"],
-                evidence_list=evidence_list,
-                source_urls=case_data.get("source_urls", []),
-                created_at=datetime.fromisoformat(case_data["created_at"]),
-            )
+        Args:
+            case_ids: The case IDs to retrieve
 
+        Returns:
+            CaseFiles that were found, in the order requested
+        """
+        try:
+            return await self._get_many(
+                case_ids,
+                table=self._cases,
+                columns=CASE_WITH_EVIDENCE,
+                key="case_id",
+                lookup=self._cached_case,
+                store=self._cache_case,
+                hydrate=_row_to_case,
+            )
         except Exception as e:
-            logger.error(f"Failed to get case {case_id}: {e}")
-            return None
+            logger.error(f"Failed to get cases {case_ids}: {e}")
+            return []
 
     async def get_cases_by_location(self, location: str) -> List[CaseFile]:
         """
@@ -143,15 +587,12 @@ class DatabaseService:
             List of CaseFiles matching the location
         """
         try:
-            result = self.supabase.table("cases").select("*").eq("location", location).execute()
-
-            cases = []
-            for case_data in result.data or []:
-                case = await self.get_case(case_data["case_id"])
-                if case:
-                    cases.append(case)
+            result = await _execute(
+                self._cases.select(CASE_WITH_EVIDENCE)
+                .eq("location", location)
+            )
 
-            return cases
+            return _rows_to_cases(result.data or [])
 
         except Exception as e:
             logger.error(f"Failed to get cases by location {location}: {e}")
@@ -167,6 +608,7 @@ class DatabaseService:
         Returns:
             True if update succeeded, False otherwise
         """
+        self._case_cache.pop(case.case_id, None)
         try:
             case_data = {
                 "title": case.title,
@@ -176,11 +618,9 @@ class DatabaseService:
                 "source_urls": case.source_urls,
             }
 
-            result = (
-                self.supabase.table("cases")
-                .update(case_data)
+            result = await _execute(
+                self._cases.update(case_data)
                 .eq("case_id", case.case_id)
-                .execute()
             )
 
             return bool(result.data)
@@ -199,12 +639,15 @@ class DatabaseService:
         Returns:
             True if deletion succeeded, False otherwise
         """
+        self._case_cache.pop(case_id, None)
+        self._evidence_cache.pop(case_id, None)
         try:
-            # Delete evidence first (foreign key constraint)
-            self.supabase.table("evidence").delete().eq("case_id", case_id).execute()
-
-            # Delete the case
-            result = self.supabase.table("cases").delete().eq("case_id", case_id).execute()
+            # Evidence and case rows are deleted in one transaction
+            result = await _execute(
+                self.supabase.rpc(
+                    "delete_case_with_evidence", {"target_case_id": case_id}
+                )
+            )
 
             return bool(result.data)
 
@@ -212,30 +655,46 @@ class DatabaseService:
             logger.error(f"Failed to delete case {case_id}: {e}")
             return False
 
-    async def list_cases(self, limit: int = 100) -> List[CaseFile]:
+    async def list_cases(
+        self,
+        limit: int = 100,
+        after: Optional[CaseCursor] = None,
+    ) -> tuple[List[CaseFile], Optional[CaseCursor]]:
         """
-        List all cases.
+        List cases newest first, one keyset page at a time.
 
         Args:
             limit: Maximum number of cases to return
+            after: Cursor returned by the previous page; None for the first page
 
         Returns:
-            List of CaseFiles
+            Tuple of (CaseFiles, cursor for the next page or None when exhausted)
         """
         try:
-            result = self.supabase.table("cases").select("case_id").limit(limit).execute()
+            query = (
+                self._cases.select(CASE_WITH_EVIDENCE)
+                .order("created_at", desc=True)
+                .order("case_id", desc=True)
+                .limit(limit)
+            )
+            if after is not None:
+                created_at, case_id = after[0].isoformat(), after[1]
+                query = query.or_(
+                    f'created_at.lt."{created_at}",'
+                    f'and(created_at.eq."{created_at}",case_id.lt."{case_id}")'
+                )
 
-            cases = []
-            for row in result.data or []:
-                case = await self.get_case(row["case_id"])
-                if case:
-                    cases.append(case)
+            rows = (await _execute(query)).data or []
 
-            return cases
+            next_cursor = None
+            if len(rows) == limit:
+                next_cursor = (_fromiso(rows[-1]["created_at"]), rows[-1]["case_id"])
+
+            return _rows_to_cases(rows), next_cursor
 
         except Exception as e:
             logger.error(f"Failed to list cases: {e}")
-            return []
+            return [], None
 
     # ==================== SCRIPTS CRUD ====================
 
@@ -252,16 +711,10 @@ class DatabaseService:
         Raises:
             DatabaseError: If creation fails
         """
+        self._script_cache.pop(script.script_id, None)
         try:
             # Convert chapters to JSON-serializable format
-            chapters_json = [
-                {
-                    "speaker": line.speaker,
-                    "text": line.text,
-                    "emotion_tag": line.emotion_tag,
-                }
-                for line in script.chapters
-            ]
+            chapters_json = chapters_to_json(script.chapters)
 
             script_data = {
                 "script_id": script.script_id,
@@ -272,7 +725,7 @@ class DatabaseService:
                 "created_at": script.created_at.isoformat(),
             }
 
-            result = self.supabase.table("scripts").insert(script_data).execute()
+            result = await _execute(self._scripts.insert(script_data))
 
             if not result.data:
                 raise DatabaseError("Failed to insert script into database")
@@ -293,39 +746,53 @@ class DatabaseService:
         Returns:
             PodcastScript if found, None otherwise
         """
+        cached = self._script_cache.get(script_id)
+        if cached is not None:
+            return cached.model_copy(deep=True)
+
         try:
-            result = (
-                self.supabase.table("scripts").select("*").eq("script_id", script_id).execute()
+            result = await _execute(
+                self._scripts.select(SCRIPT_COLUMNS)
+                .eq("script_id", script_id)
+                .maybe_single()
             )
 
-            if not result.data:
+            # maybe_single() yields no response at all when the row is missing
+            if result is None or not result.data:
                 return None
 
-            script_data = result.data[0]
-
-            # Convert chapters from JSON
-            chapters = [
-                DialogueLine(
-                    speaker=ch["speaker"],
-                    text=ch["text"],
-                    emotion_tag=ch.get("emotion_tag", "neutral"),
-                )
-                for ch in script_data.get("chapters", [])
-            ]
-
-            return PodcastScript(
-                script_id=script_data["script_id"],
-                case_id=script_data["case_id"],
-                episode_title=script_data["episode_title"],
-                chapters=chapters,
-                social_hooks=script_data.get("social_hooks", []),
-                created_at=datetime.fromisoformat(script_data["created_at"]),
-            )
+            script = _row_to_script(result.data)
+            self._script_cache[script_id] = script
+            return script.model_copy(deep=True)
 
         except Exception as e:
             logger.error(f"Failed to get script {script_id}: {e}")
             return None
 
+    async def get_scripts(self, script_ids: List[str]) -> List[PodcastScript]:
+        """
+        Retrieve several scripts in a single query.
+
+        Args:
+            script_ids: The script IDs to retrieve
+
+        Returns:
+            PodcastScripts that were found, in the order requested
+        """
+        try:
+            return await self._get_many(
+                script_ids,
+                table=self._scripts,
+                columns=SCRIPT_COLUMNS,
+                key="script_id",
+                lookup=self._script_cache.get,
+                store=self._script_cache.__setitem__,
+                hydrate=_row_to_script,
+            )
+        except Exception as e:
+            logger.error(f"Failed to get scripts {script_ids}: {e}")
+            return []
+
     async def get_scripts_by_case_id(self, case_id: str) -> List[PodcastScript]:
         """
         Retrieve scripts filtered by case_id.
@@ -337,13 +804,17 @@ class DatabaseService:
             List of PodcastScripts for the case
         """
         try:
-            result = self.supabase.table("scripts").select("*").eq("case_id", case_id).execute()
+            result = await _execute(
+                self._scripts.select(SCRIPT_COLUMNS)
+                .eq("case_id", case_id)
+            )
 
             scripts = []
-            for script_data in result.data or []:
-                script = await self.get_script(script_data["script_id"])
-                if script:
-                    scripts.append(script)
+            for row in result.data or []:
+                try:
+                    scripts.append(_row_to_script(row))
+                except Exception as e:
+                    logger.warning(f"Skipping malformed script row {row.get('script_id')}: {e}")
 
             return scripts
 
@@ -361,15 +832,9 @@ class DatabaseService:
         Returns:
             True if update succeeded, False otherwise
         """
+        self._script_cache.pop(script.script_id, None)
         try:
-            chapters_json = [
-                {
-                    "speaker": line.speaker,
-                    "text": line.text,
-                    "emotion_tag": line.emotion_tag,
-                }
-                for line in script.chapters
-            ]
+            chapters_json = chapters_to_json(script.chapters)
 
             script_data = {
                 "episode_title": script.episode_title,
@@ -377,11 +842,9 @@ class DatabaseService:
                 "social_hooks": script.social_hooks,
             }
 
-            result = (
-                self.supabase.table("scripts")
-                .update(script_data)
+            result = await _execute(
+                self._scripts.update(script_data)
                 .eq("script_id", script.script_id)
-                .execute()
             )
 
             return bool(result.data)
@@ -400,12 +863,14 @@ class DatabaseService:
         Returns:
             True if deletion succeeded, False otherwise
         """
+        self._script_cache.pop(script_id, None)
         try:
-            # Delete associated media first
-            self.supabase.table("media").delete().eq("script_id", script_id).execute()
-
-            # Delete the script
-            result = self.supabase.table("scripts").delete().eq("script_id", script_id).execute()
+            # Media and script rows are deleted in one transaction
+            result = await _execute(
+                self.supabase.rpc(
+                    "delete_script_with_media", {"target_script_id": script_id}
+                )
+            )
 
             return bool(result.data)
 
@@ -446,10 +911,10 @@ class DatabaseService:
                 "media_type": media_type,
                 "storage_path": storage_path,
                 "public_url": public_url,
-                "created_at": datetime.utcnow().isoformat(),
+                "created_at": _now_iso(),
             }
 
-            result = self.supabase.table("media").insert(media_data).execute()
+            result = await _execute(self._media.insert(media_data))
 
             if not result.data:
                 raise DatabaseError("Failed to insert media into database")
@@ -471,12 +936,24 @@ class DatabaseService:
             Media record dict if found, None otherwise
         """
         try:
-            result = self.supabase.table("media").select("*").eq("media_id", media_id).execute()
+            pool = await self._get_pool()
+            if pool is not None:
+                async with pool.acquire() as conn:
+                    record = await conn.fetchrow(
+                        "SELECT * FROM media WHERE media_id = $1", media_id
+                    )
+                return _record_to_row(record) if record else None
 
-            if not result.data:
+            result = await _execute(
+                self._media.select("*")
+                .eq("media_id", media_id)
+                .maybe_single()
+            )
+
+            if result is None or not result.data:
                 return None
 
-            return result.data[0]
+            return cast(dict[str, Any], result.data)
 
         except Exception as e:
             logger.error(f"Failed to get media {media_id}: {e}")
@@ -493,7 +970,7 @@ class DatabaseService:
             List of media records for the script
         """
         try:
-            result = self.supabase.table("media").select("*").eq("script_id", script_id).execute()
+            result = await _execute(self._media.select("*").eq("script_id", script_id))
 
             return result.data or []
 
@@ -528,11 +1005,9 @@ class DatabaseService:
             if not update_data:
                 return True
 
-            result = (
-                self.supabase.table("media")
-                .update(update_data)
+            result = await _execute(
+                self._media.update(update_data)
                 .eq("media_id", media_id)
-                .execute()
             )
 
             return bool(result.data)
@@ -552,7 +1027,7 @@ class DatabaseService:
             True if deletion succeeded, False otherwise
         """
         try:
-            result = self.supabase.table("media").delete().eq("media_id", media_id).execute()
+            result = await _execute(self._media.delete().eq("media_id", media_id))
 
             return bool(result.data)
 
@@ -575,6 +1050,7 @@ class DatabaseService:
         Raises:
             DatabaseError: If creation fails
         """
+        self._job_cache.pop(job.job_id, None)
         try:
             job_data = {
                 "job_id": job.job_id,
@@ -586,7 +1062,7 @@ class DatabaseService:
                 "updated_at": job.updated_at.isoformat(),
             }
 
-            result = self.supabase.table("jobs").insert(job_data).execute()
+            result = await _execute(self._jobs.insert(job_data))
 
             if not result.data:
                 raise DatabaseError("Failed to insert job into database")
@@ -597,38 +1073,72 @@ class DatabaseService:
         except Exception as e:
             raise DatabaseError(f"Failed to create job: {e}")
 
-    async def get_job(self, job_id: str) -> Optional[JobStatus]:
+    async def get_job_row(self, job_id: str) -> Optional[dict[str, Any]]:
         """
-        Retrieve a job by ID.
+        Retrieve a job's raw row, skipping model hydration and the read cache.
+
+        Pollers that only inspect ``status`` or ``result_id`` should use this.
 
         Args:
             job_id: The job ID to retrieve
 
         Returns:
-            JobStatus if found, None otherwise
+            Row dict (timestamps as ISO strings) if found, None otherwise
         """
         try:
-            result = self.supabase.table("jobs").select("*").eq("job_id", job_id).execute()
+            pool = await self._get_pool()
+            if pool is not None:
+                async with pool.acquire() as conn:
+                    record = await conn.fetchrow(_JOB_BY_ID_SQL, job_id)
+                return _record_to_row(record) if record else None
+
+            result = await _execute(
+                self._jobs.select(JOB_COLUMNS)
+                .eq("job_id", job_id)
+                .maybe_single()
+            )
 
-            if not result.data:
+            if result is None or not result.data:
                 return None
 
-            job_data = result.data[0]
+            return cast(dict[str, Any], result.data)
 
-            return JobStatus(
-                job_id=job_data["job_id"],
-                job_type=job_data["job_type"],
-                status=job_data["status"],
-                result_id=job_data.get("result_id"),
-                error_message=job_data.get("error_message"),
-                created_at=datetime.fromisoformat(job_data["created_at"]),
-                updated_at=datetime.fromisoformat(job_data["updated_at"]),
-            )
+        except Exception as e:
+            logger.error(f"Failed to get job {job_id}: {e}")
+            return None
 
+    async def get_job(self, job_id: str) -> Optional[JobStatus]:
+        """
+        Retrieve a job by ID.
+
+        Args:
+            job_id: The job ID to retrieve
+
+        Returns:
+            JobStatus if found, None otherwise
+        """
+        cached = self._job_cache.get(job_id)
+        if cached is not None:
+            return cached.model_copy()
+
+        job_data = await self.get_job_row(job_id)
+        if job_data is None:
+            return None
+
+        try:
+            job = _row_to_job(job_data)
         except Exception as e:
             logger.error(f"Failed to get job {job_id}: {e}")
             return None
 
+        self._cache_job(job_id, job)
+        return job.model_copy()
+
+    def _cache_job(self, job_id: str, job: JobStatus) -> None:
+        """Cache a job once it has finished; its status can no longer change."""
+        if job.status in _TERMINAL_JOB_STATUSES:
+            self._job_cache[job_id] = job
+
     async def update_job_status(
         self,
         job_id: str,
@@ -648,10 +1158,11 @@ class DatabaseService:
         Returns:
             True if update succeeded, False otherwise
         """
+        self._job_cache.pop(job_id, None)
         try:
             update_data: dict[str, Any] = {
                 "status": status,
-                "updated_at": datetime.utcnow().isoformat(),
+                "updated_at": _now_iso(),
             }
 
             if result_id is not None:
@@ -659,9 +1170,7 @@ class DatabaseService:
             if error_message is not None:
                 update_data["error_message"] = error_message
 
-            result = (
-                self.supabase.table("jobs").update(update_data).eq("job_id", job_id).execute()
-            )
+            result = await _execute(self._jobs.update(update_data).eq("job_id", job_id))
 
             return bool(result.data)
 
@@ -669,6 +1178,40 @@ class DatabaseService:
             logger.error(f"Failed to update job {job_id}: {e}")
             return False
 
+    async def bulk_update_job_status(
+        self,
+        job_ids: List[str],
+        status: str,
+        updated_at: Optional[str] = None,
+    ) -> int:
+        """
+        Set the same status on many jobs in one request.
+
+        Args:
+            job_ids: The job IDs to update
+            status: New status value
+            updated_at: ISO timestamp to record; defaults to now, so a sweep
+                that issues several batches can share one timestamp
+
+        Returns:
+            Number of jobs updated (0 on failure)
+        """
+        if not job_ids:
+            return 0
+
+        for job_id in job_ids:
+            self._job_cache.pop(job_id, None)
+        try:
+            update_data = {"status": status, "updated_at": updated_at or _now_iso()}
+
+            result = await _execute(self._jobs.update(update_data).in_("job_id", job_ids))
+
+            return len(result.data or [])
+
+        except Exception as e:
+            logger.error(f"Failed to update {len(job_ids)} jobs to {status}: {e}")
+            return 0
+
     async def delete_job(self, job_id: str) -> bool:
         """
         Delete a job record.
@@ -679,8 +1222,9 @@ class DatabaseService:
         Returns:
             True if deletion succeeded, False otherwise
         """
+        self._job_cache.pop(job_id, None)
         try:
-            result = self.supabase.table("jobs").delete().eq("job_id", job_id).execute()
+            result = await _execute(self._jobs.delete().eq("job_id", job_id))
 
             return bool(result.data)
 
@@ -688,6 +1232,30 @@ class DatabaseService:
             logger.error(f"Failed to delete job {job_id}: {e}")
             return False
 
+    async def get_jobs(self, job_ids: List[str]) -> List[JobStatus]:
+        """
+        Retrieve several jobs in a single query.
+
+        Args:
+            job_ids: The job IDs to retrieve
+
+        Returns:
+            JobStatuss that were found, in the order requested
+        """
+        try:
+            return await self._get_many(
+                job_ids,
+                table=self._jobs,
+                columns=JOB_COLUMNS,
+                key="job_id",
+                lookup=self._job_cache.get,
+                store=self._cache_job,
+                hydrate=_row_to_job,
+            )
+        except Exception as e:
+            logger.error(f"Failed to get jobs {job_ids}: {e}")
+            return []
+
     async def get_jobs_by_status(self, status: str) -> List[JobStatus]:
         """
         Retrieve jobs filtered by status.
@@ -699,23 +1267,9 @@ class DatabaseService:
             List of JobStatus records matching the status
         """
         try:
-            result = self.supabase.table("jobs").select("*").eq("status", status).execute()
-
-            jobs = []
-            for job_data in result.data or []:
-                jobs.append(
-                    JobStatus(
-                        job_id=job_data["job_id"],
-                        job_type=job_data["job_type"],
-                        status=job_data["status"],
-                        result_id=job_data.get("result_id"),
-                        error_message=job_data.get("error_message"),
-                        created_at=datetime.fromisoformat(job_data["created_at"]),
-                        updated_at=datetime.fromisoformat(job_data["updated_at"]),
-                    )
-                )
+            result = await _execute(self._jobs.select(JOB_COLUMNS).eq("status", status))
 
-            return jobs
+            return [_row_to_job(row) for row in result.data or []]
 
         except Exception as e:
             logger.error(f"Failed to get jobs by status {status}: {e}")
@@ -725,33 +1279,63 @@ class DatabaseService:
 
     async def case_exists(self, case_id: str) -> bool:
         """Check if a case exists."""
+        if self._case_cache.get(case_id) is not None:
+            return True
         try:
-            result = (
-                self.supabase.table("cases").select("case_id").eq("case_id", case_id).execute()
+            pool = await self._get_pool()
+            if pool is not None:
+                async with pool.acquire() as conn:
+                    return bool(
+                        await conn.fetchval(
+                            "SELECT EXISTS (SELECT 1 FROM cases WHERE case_id = $1)", case_id
+                        )
+                    )
+
+            # HEAD request: PostgREST answers with Content-Range only, no body
+            result = await _execute(
+                self._cases.select("case_id", count="exact", head=True)
+                .eq("case_id", case_id)
+                .limit(1)
             )
-            return bool(result.data)
+            return bool(result.count)
         except Exception:
             return False
 
     async def script_exists(self, script_id: str) -> bool:
         """Check if a script exists."""
+        if script_id in self._script_cache:
+            return True
         try:
-            result = (
-                self.supabase.table("scripts")
-                .select("script_id")
+            pool = await self._get_pool()
+            if pool is not None:
+                async with pool.acquire() as conn:
+                    return bool(
+                        await conn.fetchval(
+                            "SELECT EXISTS (SELECT 1 FROM scripts WHERE script_id = $1)",
+                            script_id,
+                        )
+                    )
+
+            # HEAD request: PostgREST answers with Content-Range only, no body
+            result = await _execute(
+                self._scripts.select("script_id", count="exact", head=True)
                 .eq("script_id", script_id)
-                .execute()
+                .limit(1)
             )
-            return bool(result.data)
+            return bool(result.count)
         except Exception:
             return False
 
 
 # Factory function for creating DatabaseService with settings
+@lru_cache
 def create_database_service() -> DatabaseService:
     """
     Create a DatabaseService instance using application settings.
 
+    The instance is shared so its Supabase client and read caches are reused
+    across requests.
+
     Returns:
         Configured DatabaseService instance
     """
@@ -761,4 +1345,4 @@ def create_database_service() -> DatabaseService:
 
     settings = get_settings()
     supabase_client = create_client(settings.supabase_url, settings.supabase_key)
-    return DatabaseService(supabase_client=supabase_client)
+    return DatabaseService(supabase_client=supabase_client, db_url=settings.supabase_db_url)
@@ -1,17 +1,142 @@
 """Debate engine service for generating podcast scripts using PydanticAI agents."""
 
+import asyncio
 import logging
-from typing import Any, List, Optional
+import re
+from functools import cache
+from typing import Any, List, Optional, Tuple
 from uuid import uuid4
 
+from pydantic_ai.messages import CachePoint, ModelMessage, UserContent
+
 from src.agents.maya import create_maya_agent
 from src.agents.thorne import create_thorne_agent
 from src.models.case import CaseFile
 from src.models.script import DialogueLine, PodcastScript
+from src.services.database import chapters_to_json
 from src.utils.errors import AgentResponseError, DebateEngineError
+from src.utils.patterns import literal_union
 
 logger = logging.getLogger(__name__)
 
+# Phrases that mark a line as a candidate social media hook, matched in one pass
+_HOOK_RE = re.compile(
+    literal_union(
+        (
+            "wait",
+            "but here's the thing",
+            "the evidence",
+            "nobody knew",
+            "the truth",
+            "what if",
+            "think about it",
+            "full body chills",
+            "the timeline",
+            "the alibi",
+        )
+    ),
+    re.IGNORECASE,
+)
+
+# How each host is named in the RECENT CONVERSATION block of a prompt
+_SPEAKER_NAMES = {"maya_vance": "Maya", "dr_aris_thorne": "Dr. Thorne"}
+
+
+# Per-turn instructions; see build_instruction_schedule
+_MAYA_OPENING = """
+You are OPENING this episode of Murder Index. This is the INTRO.
+- Welcome listeners to Murder Index
+- Introduce yourself and mention Dr. Thorne
+- Briefly tease this week's case to hook listeners
+- Set the tone for the investigation ahead
+Generate your opening dialogue line as Maya Vance.
+"""
+
+_MAYA_CLOSING = """
+You are CLOSING this episode of Murder Index. This is the OUTRO.
+- Summarize the key theories discussed
+- Thank listeners for joining
+- Remind them to subscribe and follow Murder Index for next week's case
+- Sign off with warmth
+Generate your closing dialogue line as Maya Vance.
+"""
+
+_MAYA_CONTINUE = """
+Continue the discussion as Maya Vance.
+Respond to Dr. Thorne's points while advancing your narrative perspective.
+Generate your next dialogue line.
+"""
+
+_THORNE_OPENING = """
+Maya just opened the show. Respond as Dr. Thorne with your intro.
+- Greet listeners with your characteristic dry wit
+- Acknowledge Maya's enthusiasm
+- Set expectations for evidence-based analysis
+Generate your opening dialogue line as Dr. Thorne.
+"""
+
+_THORNE_CLOSING = """
+You are helping CLOSE this episode of Murder Index.
+- Summarize what the evidence actually supports
+- Acknowledge what remains unknown about this case
+- Encourage listeners to think critically
+- Sign off professionally
+Generate your closing dialogue line as Dr. Thorne.
+"""
+
+_THORNE_CONTINUE = """
+Respond to Maya's points as Dr. Aris Thorne.
+Challenge her theories with evidence-based analysis.
+Generate your next dialogue line.
+"""
+
+
+@cache
+def build_instruction_schedule(num_exchanges: int) -> Tuple[str, ...]:
+    """
+    Lay out the instruction for every turn of a debate.
+
+    Turn ``i`` is spoken with ``i`` lines already in the conversation: even
+    turns are Maya's, odd turns Thorne's. Both hosts open in the first
+    exchange and close in the last one; when a debate has a single exchange
+    the openings win.
+
+    Args:
+        num_exchanges: Number of back-and-forth exchanges in the debate
+
+    Returns:
+        Tuple of 2 * num_exchanges instruction strings, indexed by turn
+    """
+    last_maya_turn = 2 * num_exchanges - 2
+    schedule = []
+    for turn in range(2 * num_exchanges):
+        if turn % 2 == 0:
+            if turn == 0:
+                schedule.append(_MAYA_OPENING)
+            elif turn == last_maya_turn:
+                schedule.append(_MAYA_CLOSING)
+            else:
+                schedule.append(_MAYA_CONTINUE)
+        else:
+            if turn == 1:
+                schedule.append(_THORNE_OPENING)
+            elif turn == last_maya_turn + 1:
+                schedule.append(_THORNE_CLOSING)
+            else:
+                schedule.append(_THORNE_CONTINUE)
+    return tuple(schedule)
+
+
+class _HostSession:
+    """One host's running conversation with its agent during a debate."""
+
+    def __init__(self, messages: Optional[List[ModelMessage]] = None, seen: int = 0) -> None:
+        # Full message history from the agent's previous runs
+        self.messages: List[ModelMessage] = messages or []
+        # Number of dialogue lines already contained in that history
+        self.seen = seen
+
+
 
 class DebateEngine:
     """Service for generating debate-style podcast scripts between two AI hosts."""
@@ -38,6 +163,11 @@ class DebateEngine:
         """
         Generate alternating dialogue between hosts about the case.
 
+        Each host keeps one multi-turn conversation for the whole debate: the
+        case briefing is sent once, and every later turn only adds the other
+        host's new line plus the instruction, passing earlier turns as
+        ``message_history`` instead of re-sending them in the prompt.
+
         Args:
             case: The CaseFile to debate
             num_exchanges: Number of back-and-forth exchanges (default 10)
@@ -50,42 +180,24 @@ class DebateEngine:
             AgentResponseError: If an agent fails to generate valid response
         """
         dialogue_lines: List[DialogueLine] = []
+        # The briefing is identical for all 2N turns; render it once
+        case_prefix = self._build_case_prefix(case)
+        schedule = build_instruction_schedule(num_exchanges)
+        maya_session, thorne_session = _HostSession(), _HostSession()
 
         try:
             for exchange_num in range(num_exchanges):
-                # Maya speaks first in each exchange
-                maya_prompt = self._build_prompt(case, dialogue_lines, "maya")
-                maya_result = await self.maya.run(maya_prompt, deps=case)
-
-                if not maya_result or not maya_result.output:
-                    raise AgentResponseError(
-                        f"Maya agent failed to generate response at exchange {exchange_num + 1}"
+                # Maya speaks first in each exchange, then Thorne responds
+                dialogue_lines.append(
+                    await self._maya_turn(
+                        case, case_prefix, schedule, dialogue_lines, exchange_num, maya_session
                     )
-
-                # Ensure Maya's line has correct speaker
-                maya_line = DialogueLine(
-                    speaker="maya_vance",
-                    text=maya_result.output.text,
-                    emotion_tag=maya_result.output.emotion_tag,
                 )
-                dialogue_lines.append(maya_line)
-
-                # Thorne responds
-                thorne_prompt = self._build_prompt(case, dialogue_lines, "thorne")
-                thorne_result = await self.thorne.run(thorne_prompt, deps=case)
-
-                if not thorne_result or not thorne_result.output:
-                    raise AgentResponseError(
-                        f"Thorne agent failed to generate response at exchange {exchange_num + 1}"
+                dialogue_lines.append(
+                    await self._thorne_turn(
+                        case, case_prefix, schedule, dialogue_lines, exchange_num, thorne_session
                     )
-
-                # Ensure Thorne's line has correct speaker
-                thorne_line = DialogueLine(
-                    speaker="dr_aris_thorne",
-                    text=thorne_result.output.text,
-                    emotion_tag=thorne_result.output.emotion_tag,
                 )
-                dialogue_lines.append(thorne_line)
 
                 logger.debug(f"Completed exchange {exchange_num + 1}/{num_exchanges}")
 
@@ -97,24 +209,113 @@ class DebateEngine:
         # Compile the script
         return self.compile_script(case, dialogue_lines)
 
-    def _build_prompt(
+    async def generate_debates(
+        self,
+        cases: List[CaseFile],
+        num_exchanges: int = 10,
+        max_parallel: int = 8,
+    ) -> List[PodcastScript | Exception]:
+        """
+        Generate debates for several cases concurrently.
+
+        Args:
+            cases: The CaseFiles to debate
+            num_exchanges: Number of back-and-forth exchanges per debate
+            max_parallel: Maximum debates in flight at once (default 8)
+
+        Returns:
+            One entry per case, in order: the PodcastScript, or the exception
+            that debate raised
+        """
+        semaphore = asyncio.Semaphore(max_parallel)
+
+        async def bounded(case: CaseFile) -> PodcastScript:
+            async with semaphore:
+                return await self.generate_debate(case, num_exchanges=num_exchanges)
+
+        results = await asyncio.gather(
+            *(bounded(case) for case in cases), return_exceptions=True
+        )
+
+        failures = sum(isinstance(result, Exception) for result in results)
+        if failures:
+            logger.warning(f"{failures}/{len(cases)} debates failed")
+        return list(results)
+
+    async def _maya_turn(
         self,
         case: CaseFile,
-        context: List[DialogueLine],
-        speaker: str,
-    ) -> str:
+        case_prefix: str,
+        schedule: Tuple[str, ...],
+        dialogue_lines: List[DialogueLine],
+        exchange_num: int,
+        session: _HostSession,
+    ) -> DialogueLine:
+        """Run Maya on the conversation so far and return her line."""
+        maya_prompt = self._build_prompt(
+            case_prefix, dialogue_lines, schedule[len(dialogue_lines)], session.seen
+        )
+        maya_result = await self.maya.run(
+            maya_prompt, deps=case, message_history=session.messages or None
+        )
+
+        if not maya_result or not maya_result.output:
+            raise AgentResponseError(
+                f"Maya agent failed to generate response at exchange {exchange_num + 1}"
+            )
+
+        session.messages = maya_result.all_messages()
+        session.seen = len(dialogue_lines) + 1
+
+        # Ensure Maya's line has correct speaker
+        return DialogueLine(
+            speaker="maya_vance",
+            text=maya_result.output.text,
+            emotion_tag=maya_result.output.emotion_tag,
+        )
+
+    async def _thorne_turn(
+        self,
+        case: CaseFile,
+        case_prefix: str,
+        schedule: Tuple[str, ...],
+        dialogue_lines: List[DialogueLine],
+        exchange_num: int,
+        session: _HostSession,
+    ) -> DialogueLine:
+        """Run Thorne on the conversation so far and return his line."""
+        thorne_prompt = self._build_prompt(
+            case_prefix, dialogue_lines, schedule[len(dialogue_lines)], session.seen
+        )
+        thorne_result = await self.thorne.run(
+            thorne_prompt, deps=case, message_history=session.messages or None
+        )
+
+        if not thorne_result or not thorne_result.output:
+            raise AgentResponseError(
+                f"Thorne agent failed to generate response at exchange {exchange_num + 1}"
+            )
+
+        session.messages = thorne_result.all_messages()
+        session.seen = len(dialogue_lines) + 1
+
+        # Ensure Thorne's line has correct speaker
+        return DialogueLine(
+            speaker="dr_aris_thorne",
+            text=thorne_result.output.text,
+            emotion_tag=thorne_result.output.emotion_tag,
+        )
+
+    def _build_case_prefix(self, case: CaseFile) -> str:
         """
-        Construct context-aware prompts for agents.
+        Render the static case briefing shared by every turn of a debate.
 
         Args:
             case: The CaseFile being discussed
-            context: Previous dialogue lines in the conversation
-            speaker: Which speaker is being prompted ("maya" or "thorne")
 
         Returns:
-            Formatted prompt string for the agent
+            Case information, details and key evidence
         """
-        # Build case context
         case_context = f"""
 CASE INFORMATION:
 Title: {case.title}
@@ -133,67 +334,49 @@ CASE DETAILS:
             )
             case_context += f"\nKEY EVIDENCE:\n{evidence_summary}"
 
+        return case_context
+
+    def _build_prompt(
+        self,
+        case_prefix: str,
+        context: List[DialogueLine],
+        instruction: str,
+        seen: int = 0,
+    ) -> List[UserContent]:
+        """
+        Construct context-aware prompts for agents.
+
+        The case briefing comes first and is followed by a cache point, so it
+        stays byte-identical across all turns of a debate and providers with
+        prompt caching (Anthropic) reuse the system prompt plus briefing.
+        Only the conversation and instruction after it change per turn.
+
+        When the agent already holds the earlier turns in its message history
+        (``seen`` > 0), the briefing is omitted and only the lines it has not
+        seen yet are sent.
+
+        Args:
+            case_prefix: Case briefing from _build_case_prefix
+            context: Previous dialogue lines in the conversation
+            instruction: This turn's entry from build_instruction_schedule
+            seen: Number of leading context lines already in the agent's history
+
+        Returns:
+            Prompt parts for the agent: case briefing, cache point, turn
+        """
         # Build conversation context
         conversation_context = ""
         if context:
-            recent_lines = context[-6:]  # Last 3 exchanges
-            conversation_context = "\nRECENT CONVERSATION:\n"
-            for line in recent_lines:
-                speaker_name = "Maya" if line.speaker == "maya_vance" else "Dr. Thorne"
-                conversation_context += f"{speaker_name}: {line.text}\n"
-
-        # Build the prompt based on speaker
-        if speaker == "maya":
-            if not context:
-                instruction = """
-You are OPENING this episode of Murder Index. This is the INTRO.
-- Welcome listeners to Murder Index
-- Introduce yourself and mention Dr. Thorne
-- Briefly tease this week's case to hook listeners
-- Set the tone for the investigation ahead
-Generate your opening dialogue line as Maya Vance.
-"""
-            elif len(context) >= 28:  # Near the end (for 15 exchanges)
-                instruction = """
-You are CLOSING this episode of Murder Index. This is the OUTRO.
-- Summarize the key theories discussed
-- Thank listeners for joining
-- Remind them to subscribe and follow Murder Index for next week's case
-- Sign off with warmth
-Generate your closing dialogue line as Maya Vance.
-"""
-            else:
-                instruction = """
-Continue the discussion as Maya Vance.
-Respond to Dr. Thorne's points while advancing your narrative perspective.
-Generate your next dialogue line.
-"""
-        else:  # thorne
-            if len(context) == 1:  # First response after Maya's intro
-                instruction = """
-Maya just opened the show. Respond as Dr. Thorne with your intro.
-- Greet listeners with your characteristic dry wit
-- Acknowledge Maya's enthusiasm
-- Set expectations for evidence-based analysis
-Generate your opening dialogue line as Dr. Thorne.
-"""
-            elif len(context) >= 29:  # Near the end
-                instruction = """
-You are helping CLOSE this episode of Murder Index.
-- Summarize what the evidence actually supports
-- Acknowledge what remains unknown about this case
-- Encourage listeners to think critically
-- Sign off professionally
-Generate your closing dialogue line as Dr. Thorne.
-"""
-            else:
-                instruction = """
-Respond to Maya's points as Dr. Aris Thorne.
-Challenge her theories with evidence-based analysis.
-Generate your next dialogue line.
-"""
+            # Last 3 exchanges, or just what the agent hasn't seen yet
+            recent_lines = context[seen:] if seen else context[-6:]
+            conversation_context = "\nRECENT CONVERSATION:\n" + "".join(
+                f"{_SPEAKER_NAMES[line.speaker]}: {line.text}\n" for line in recent_lines
+            )
 
-        return f"{case_context}\n{conversation_context}\n{instruction}"
+        turn = f"\n{conversation_context}\n{instruction}"
+        if seen:
+            return [turn]
+        return [case_prefix, CachePoint(), turn]
 
     def generate_social_hooks(self, script: PodcastScript) -> List[str]:
         """
@@ -205,34 +388,27 @@ Generate your next dialogue line.
         Returns:
             List of social media hook strings
         """
+        return self._find_social_hooks(script.chapters)
+
+    @staticmethod
+    def _find_social_hooks(dialogue_lines: List[DialogueLine]) -> List[str]:
+        """Pick up to five tweetable hook lines, in script order."""
         hooks: List[str] = []
 
-        for line in script.chapters:
+        for line in dialogue_lines:
             text = line.text
 
             # Look for dramatic or intriguing statements
-            hook_indicators = [
-                "wait",
-                "but here's the thing",
-                "the evidence",
-                "nobody knew",
-                "the truth",
-                "what if",
-                "think about it",
-                "full body chills",
-                "the timeline",
-                "the alibi",
-            ]
-
-            text_lower = text.lower()
-            if any(indicator in text_lower for indicator in hook_indicators):
+            if _HOOK_RE.search(text):
                 # Clean up the text for social media
                 hook = text.strip()
                 if len(hook) > 20 and len(hook) < 280:  # Twitter-friendly length
                     hooks.append(hook)
+                    # Limit to top 5 hooks
+                    if len(hooks) == 5:
+                        break
 
-        # Limit to top 5 hooks
-        return hooks[:5]
+        return hooks
 
     def compile_script(
         self,
@@ -252,19 +428,9 @@ Generate your next dialogue line.
         script_id = f"script-{uuid4().hex[:12]}"
         episode_title = f"The {case.location} Mystery: {case.title}"
 
-        # Create the script first without hooks
-        script = PodcastScript(
-            script_id=script_id,
-            case_id=case.case_id,
-            episode_title=episode_title,
-            chapters=dialogue_lines,
-            social_hooks=[],
-        )
-
-        # Generate social hooks from the compiled script
-        social_hooks = self.generate_social_hooks(script)
+        # Hooks only need the dialogue, so the script is validated once
+        social_hooks = self._find_social_hooks(dialogue_lines)
 
-        # Return script with hooks
         return PodcastScript(
             script_id=script_id,
             case_id=case.case_id,
@@ -283,43 +449,59 @@ Generate your next dialogue line.
         Returns:
             The script_id of the persisted script
 
+        Raises:
+            DebateEngineError: If persistence fails
+        """
+        script_ids = await self.persist_scripts([script])
+        return script_ids[0]
+
+    async def persist_scripts(self, scripts: List[PodcastScript]) -> List[str]:
+        """
+        Store several scripts in Supabase with a single bulk insert.
+
+        Args:
+            scripts: PodcastScripts to persist
+
+        Returns:
+            The script_ids of the persisted scripts, in order
+
         Raises:
             DebateEngineError: If persistence fails
         """
         if not self.supabase:
             raise DebateEngineError("Supabase client not configured")
+        if not scripts:
+            return []
 
         try:
-            # Convert chapters to JSON-serializable format
-            chapters_json = [
+            rows = [
                 {
-                    "speaker": line.speaker,
-                    "text": line.text,
-                    "emotion_tag": line.emotion_tag,
+                    "script_id": script.script_id,
+                    "case_id": script.case_id,
+                    "episode_title": script.episode_title,
+                    # Same encoding DatabaseService uses for scripts.chapters
+                    "chapters": chapters_to_json(script.chapters),
+                    "social_hooks": script.social_hooks,
                 }
-                for line in script.chapters
+                for script in scripts
             ]
 
-            script_data = {
-                "script_id": script.script_id,
-                "case_id": script.case_id,
-                "episode_title": script.episode_title,
-                "chapters": chapters_json,
-                "social_hooks": script.social_hooks,
-            }
-
-            result = self.supabase.table("scripts").insert(script_data).execute()
+            # The Supabase client is synchronous; keep the request off the event loop
+            query = self.supabase.table("scripts").insert(rows)
+            result = await asyncio.to_thread(query.execute)
 
-            if not result.data:
-                raise DebateEngineError("Failed to insert script into database")
+            if not result.data or len(result.data) != len(rows):
+                raise DebateEngineError("Failed to insert scripts into database")
 
-            logger.info(
-                f"Persisted script {script.script_id} with {len(script.chapters)} dialogue lines"
-            )
-            return script.script_id
+            for script in scripts:
+                logger.info(
+                    f"Persisted script {script.script_id} "
+                    f"with {len(script.chapters)} dialogue lines"
+                )
+            return [script.script_id for script in scripts]
 
         except Exception as e:
-            raise DebateEngineError(f"Failed to persist script: {e}")
+            raise DebateEngineError(f"Failed to persist scripts: {e}")
 
 
 def create_debate_engine(supabase_client: Optional[Any] = None) -> DebateEngine:
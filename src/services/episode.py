@@ -0,0 +1,70 @@
+"""Episode production: debate generation and image scraping for one case."""
+
+import asyncio
+import logging
+from typing import List, Optional, Tuple
+
+from src.models.case import CaseFile
+from src.models.script import PodcastScript
+from src.services.debate import DebateEngine, create_debate_engine
+from src.services.image_scraper import CaseImage, ImageScraperService, create_image_scraper
+
+logger = logging.getLogger(__name__)
+
+
+async def produce_episode(
+    case: CaseFile,
+    urls: Optional[List[str]] = None,
+    *,
+    debate_engine: Optional[DebateEngine] = None,
+    image_scraper: Optional[ImageScraperService] = None,
+    num_exchanges: int = 10,
+    images_per_url: int = 5,
+) -> Tuple[PodcastScript, List[CaseImage]]:
+    """
+    Generate a case's debate script and its images concurrently.
+
+    Both steps only depend on the CaseFile, so image scraping runs while the
+    debate is generated and its latency is hidden behind the LLM calls.
+
+    Args:
+        case: The CaseFile to produce an episode for
+        urls: Pages to scrape images from (defaults to case.source_urls)
+        debate_engine: Engine to generate the debate with (created if omitted)
+        image_scraper: Scraper to download images with (created if omitted)
+        num_exchanges: Number of back-and-forth exchanges in the debate
+        images_per_url: Max images downloaded per URL
+
+    Returns:
+        The PodcastScript and the downloaded CaseImages
+
+    Raises:
+        DebateEngineError: If debate generation fails (image work is cancelled)
+    """
+    urls = case.source_urls if urls is None else urls
+    debate_engine = debate_engine or create_debate_engine()
+    owns_scraper = image_scraper is None
+    scraper = image_scraper or create_image_scraper()
+
+    debate_task = asyncio.create_task(
+        debate_engine.generate_debate(case, num_exchanges=num_exchanges)
+    )
+    images_task = asyncio.create_task(
+        scraper.scrape_and_download(urls, limit_per_url=images_per_url)
+    )
+
+    try:
+        script, images = await asyncio.gather(debate_task, images_task)
+    except BaseException:
+        debate_task.cancel()
+        images_task.cancel()
+        raise
+    finally:
+        if owns_scraper:
+            await scraper.aclose()
+
+    logger.info(
+        f"Produced episode for case {case.case_id}: "
+        f"{len(script.chapters)} lines, {len(images)} images"
+    )
+    return script, images
@@ -5,14 +5,51 @@ import hashlib
 import logging
 import os
 import re
-from typing import Any, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 from urllib.parse import urljoin, urlparse
 
 import httpx
 from pydantic import BaseModel
+from selectolax.lexbor import LexborHTMLParser
+
+from src.utils.patterns import literal_union
 
 logger = logging.getLogger(__name__)
 
+# URL fragments of common non-content images (logos, trackers, social widgets),
+# matched against the lowercased URL in a single pass
+_SKIP_RE = re.compile(
+    literal_union((
+        'logo', 'icon', 'favicon', 'sprite', 'button',
+        'banner', 'ad', 'tracking', 'pixel', 'spacer',
+        'avatar', 'profile', 'thumb', 'social', 'share',
+        'facebook', 'twitter', 'instagram', 'pinterest',
+        'google', 'analytics', 'widget', 'badge',
+        '1x1', '2x2', 'blank', 'transparent',
+    ))
+)
+
+# Bytes read from the network per disk write when saving an image
+DOWNLOAD_CHUNK_SIZE = 65536
+
+# Characters that make urljoin rewrite a root-relative path (dot segments,
+# and the tab/newline characters urlsplit strips)
+_PATH_REWRITE_RE = re.compile(r"/\.|[\t\n\r]")
+
+
+def _is_plain_path(path: str) -> bool:
+    """Whether urljoin would keep a root-relative path exactly as written."""
+    return _PATH_REWRITE_RE.search(path) is None
+
+
+# Image types in priority order, each with the keywords that identify it
+_IMAGE_TYPE_PATTERNS = (
+    ("victim", re.compile("victim|missing|person|photo|portrait")),
+    ("location", re.compile("map|location|scene|area|site")),
+    ("evidence", re.compile("evidence|forensic|weapon|clue")),
+    ("document", re.compile("document|report|record|file")),
+)
+
 
 class CaseImage(BaseModel):
     """Represents an image scraped from a case source."""
@@ -31,12 +68,13 @@ class CaseImage(BaseModel):
 class ImageScraperService:
     """Service for scraping and downloading case-related images."""
     
-    def __init__(self, output_dir: str = "frontend/images"):
+    def __init__(self, output_dir: str = "frontend/images", max_concurrency: int = 16):
         """
         Initialize the ImageScraperService.
         
         Args:
             output_dir: Directory to save downloaded images
+            max_concurrency: Maximum page fetches and downloads in flight at once
         """
         self.output_dir = output_dir
         os.makedirs(output_dir, exist_ok=True)
@@ -49,6 +87,36 @@ class ImageScraperService:
             "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36",
             "Accept": "image/webp,image/apng,image/*,*/*;q=0.8",
         }
+        
+        # One pooled client for every page and image, so connections and TLS
+        # sessions are reused instead of set up per request. HTTP/2 lets the
+        # images of a single origin share one multiplexed connection.
+        self._client = httpx.AsyncClient(
+            timeout=30.0,
+            follow_redirects=True,
+            headers=self.headers,
+            transport=httpx.AsyncHTTPTransport(
+                http2=True,
+                retries=1,
+                limits=httpx.Limits(max_connections=32, max_keepalive_connections=32),
+            ),
+        )
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        
+        # Wire-service photos show up on many source pages; each URL is fetched
+        # once and concurrent requests for it share the in-flight download
+        self._url_to_path: Dict[str, str] = {}
+        self._inflight: Dict[str, "asyncio.Future[Optional[str]]"] = {}
+    
+    async def __aenter__(self) -> "ImageScraperService":
+        return self
+    
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.aclose()
+    
+    async def aclose(self) -> None:
+        """Close the shared HTTP client."""
+        await self._client.aclose()
     
     async def scrape_images_from_url(
         self,
@@ -68,88 +136,139 @@ class ImageScraperService:
         images: List[CaseImage] = []
         
         try:
-            async with httpx.AsyncClient(timeout=30.0, follow_redirects=True) as client:
-                response = await client.get(url, headers=self.headers)
+            async with self._semaphore:
+                response = await self._client.get(url)
                 response.raise_for_status()
                 html = response.text
+            
+            # Parse source info once per page
+            parsed_url = urlparse(url)
+            source_name = parsed_url.netloc.replace("www.", "")
+            origin = f"{parsed_url.scheme}://{parsed_url.netloc}"
+            attribution = f"Image source: {source_name} ({url})"
+            
+            found_urls = set()
+            
+            for img_url, alt_text, caption in self._extract_image_candidates(html):
+                # Make absolute URL
+                if img_url.startswith('//'):
+                    img_url = 'https:' + img_url
+                elif img_url.startswith('/') and _is_plain_path(img_url):
+                    # Root-relative: same as urljoin(url, img_url) without re-parsing url
+                    img_url = origin + img_url
+                elif not img_url.startswith('http'):
+                    img_url = urljoin(url, img_url)
                 
-                # Parse source info
-                parsed_url = urlparse(url)
-                source_name = parsed_url.netloc.replace("www.", "")
-                
-                # Extract images using regex (avoiding heavy dependencies)
-                img_patterns = [
-                    # Standard img tags
-                    r'<img[^>]+src=["\']([^"\']+)["\'][^>]*(?:alt=["\']([^"\']*)["\'])?[^>]*>',
-                    # Figure with figcaption
-                    r'<figure[^>]*>.*?<img[^>]+src=["\']([^"\']+)["\'].*?<figcaption[^>]*>([^<]+)</figcaption>',
-                    # Open Graph images
-                    r'<meta[^>]+property=["\']og:image["\'][^>]+content=["\']([^"\']+)["\']',
-                ]
-                
-                found_urls = set()
+                # Skip if already found
+                if img_url in found_urls:
+                    continue
                 
-                for pattern in img_patterns:
-                    matches = re.findall(pattern, html, re.IGNORECASE | re.DOTALL)
-                    for match in matches:
-                        if isinstance(match, tuple):
-                            img_url = match[0]
-                            alt_or_caption = match[1] if len(match) > 1 else ""
-                        else:
-                            img_url = match
-                            alt_or_caption = ""
-                        
-                        # Skip if already found or invalid
-                        if img_url in found_urls:
-                            continue
-                        
-                        # Make absolute URL
-                        if img_url.startswith('//'):
-                            img_url = 'https:' + img_url
-                        elif img_url.startswith('/'):
-                            img_url = urljoin(url, img_url)
-                        elif not img_url.startswith('http'):
-                            img_url = urljoin(url, img_url)
-                        
-                        # Filter out icons, logos, tracking pixels
-                        if self._is_valid_case_image(img_url):
-                            found_urls.add(img_url)
-                            
-                            # Generate image ID
-                            image_id = hashlib.md5(img_url.encode()).hexdigest()[:12]
-                            
-                            # Classify image type
-                            image_type = self._classify_image(img_url, alt_or_caption)
-                            
-                            # Create attribution
-                            attribution = f"Image source: {source_name} ({url})"
-                            
-                            images.append(CaseImage(
-                                image_id=image_id,
-                                url=img_url,
-                                alt_text=alt_or_caption if alt_or_caption else "",
-                                caption=alt_or_caption if alt_or_caption else "",
-                                source_url=url,
-                                source_name=source_name,
-                                attribution=attribution,
-                                image_type=image_type,
-                            ))
-                            
-                            if len(images) >= limit:
-                                break
+                # Filter out icons, logos, tracking pixels
+                if self._is_valid_case_image(img_url):
+                    found_urls.add(img_url)
+                    
+                    # Generate image ID
+                    image_id = hashlib.blake2b(img_url.encode(), digest_size=6).hexdigest()
+                    
+                    # Classify image type
+                    image_type = self._classify_image(img_url, caption or alt_text)
+                    
+                    images.append(CaseImage(
+                        image_id=image_id,
+                        url=img_url,
+                        alt_text=alt_text,
+                        caption=caption or alt_text,
+                        source_url=url,
+                        source_name=source_name,
+                        attribution=attribution,
+                        image_type=image_type,
+                    ))
                     
                     if len(images) >= limit:
                         break
-                
+            
         except Exception as e:
             logger.error(f"Failed to scrape images from {url}: {e}")
         
         return images
     
+    @staticmethod
+    def _extract_image_candidates(html: str) -> List[Tuple[str, str, str]]:
+        """
+        Parse a page once and list its images in document order.
+        
+        Args:
+            html: Page HTML
+            
+        Returns:
+            (src, alt text, figure caption) tuples for every <img> with a src,
+            followed by the Open Graph image if the page declares one
+        """
+        tree = LexborHTMLParser(html)
+        
+        # Captions belong to the first image of their <figure>
+        captions: dict[str, str] = {}
+        for figure in tree.css("figure"):
+            img = figure.css_first("img[src]")
+            figcaption = figure.css_first("figcaption")
+            if img is not None and figcaption is not None:
+                captions.setdefault(
+                    img.attributes["src"] or "", " ".join(figcaption.text().split())
+                )
+        
+        candidates = []
+        for img in tree.css("img[src]"):
+            raw_src = img.attributes["src"] or ""
+            src = raw_src.strip()
+            if src:
+                alt_text = (img.attributes.get("alt") or "").strip()
+                candidates.append((src, alt_text, captions.get(raw_src, "")))
+        
+        og_image = tree.css_first('meta[property="og:image" i][content]')
+        if og_image is not None:
+            content = (og_image.attributes["content"] or "").strip()
+            if content:
+                candidates.append((content, "", ""))
+        
+        return candidates
+    
     async def download_image(self, image: CaseImage) -> Optional[str]:
         """
         Download an image and save locally.
         
+        An image URL already downloaded by this scraper is not fetched again,
+        and concurrent calls for the same URL wait on a single download.
+        
+        Args:
+            image: CaseImage to download
+            
+        Returns:
+            Local file path if successful, None otherwise
+        """
+        local_path = self._url_to_path.get(image.url)
+        if local_path is None:
+            pending = self._inflight.get(image.url)
+            if pending is None:
+                pending = asyncio.ensure_future(self._download(image))
+                self._inflight[image.url] = pending
+                pending.add_done_callback(lambda _: self._inflight.pop(image.url, None))
+            # Shield so one cancelled caller doesn't abort the download for the others
+            local_path = await asyncio.shield(pending)
+            if local_path is None:
+                return None
+            self._url_to_path[image.url] = local_path
+        
+        image.local_path = local_path
+        return local_path
+    
+    async def _download(self, image: CaseImage) -> Optional[str]:
+        """
+        Fetch an image to disk.
+        
+        The body is streamed to disk in chunks, with file I/O run in a worker
+        thread, so neither the whole image nor the disk write sits on the
+        event loop.
+        
         Args:
             image: CaseImage to download
             
@@ -157,8 +276,7 @@ class ImageScraperService:
             Local file path if successful, None otherwise
         """
         try:
-            async with httpx.AsyncClient(timeout=30.0, follow_redirects=True) as client:
-                response = await client.get(image.url, headers=self.headers)
+            async with self._semaphore, self._client.stream("GET", image.url) as response:
                 response.raise_for_status()
                 
                 # Determine file extension
@@ -180,13 +298,20 @@ class ImageScraperService:
                 filename = f"{image.image_id}{ext}"
                 filepath = os.path.join(self.output_dir, filename)
                 
-                with open(filepath, "wb") as f:
-                    f.write(response.content)
-                
-                image.local_path = f"images/{filename}"
-                logger.info(f"Downloaded image: {filepath}")
-                return image.local_path
-                
+                f = await asyncio.to_thread(open, filepath, "wb")
+                try:
+                    async for chunk in response.aiter_bytes(DOWNLOAD_CHUNK_SIZE):
+                        await asyncio.to_thread(f.write, chunk)
+                except BaseException:
+                    # Don't leave a truncated image behind
+                    await asyncio.to_thread(f.close)
+                    await asyncio.to_thread(os.remove, filepath)
+                    raise
+                await asyncio.to_thread(f.close)
+            
+            logger.info(f"Downloaded image: {filepath}")
+            return f"images/{filename}"
+            
         except Exception as e:
             logger.error(f"Failed to download image {image.url}: {e}")
             return None
@@ -206,36 +331,22 @@ class ImageScraperService:
         Returns:
             List of downloaded CaseImage objects
         """
-        all_images: List[CaseImage] = []
-        
-        for url in urls:
-            images = await self.scrape_images_from_url(url, limit=limit_per_url)
-            
-            # Download each image
-            for image in images:
-                local_path = await self.download_image(image)
-                if local_path:
-                    all_images.append(image)
-        
-        return all_images
+        results = await asyncio.gather(
+            *(self._scrape_and_download_one(url, limit_per_url) for url in urls)
+        )
+        return [image for images in results for image in images]
+    
+    async def _scrape_and_download_one(self, url: str, limit: int) -> List[CaseImage]:
+        """Scrape one URL and download its images concurrently."""
+        images = await self.scrape_images_from_url(url, limit=limit)
+        local_paths = await asyncio.gather(*(self.download_image(image) for image in images))
+        return [image for image, local_path in zip(images, local_paths) if local_path]
     
     def _is_valid_case_image(self, url: str) -> bool:
         """Check if URL is likely a valid case-related image."""
-        url_lower = url.lower()
-        
         # Skip common non-content images
-        skip_patterns = [
-            'logo', 'icon', 'favicon', 'sprite', 'button',
-            'banner', 'ad', 'tracking', 'pixel', 'spacer',
-            'avatar', 'profile', 'thumb', 'social', 'share',
-            'facebook', 'twitter', 'instagram', 'pinterest',
-            'google', 'analytics', 'widget', 'badge',
-            '1x1', '2x2', 'blank', 'transparent',
-        ]
-        
-        for pattern in skip_patterns:
-            if pattern in url_lower:
-                return False
+        if _SKIP_RE.search(url.lower()):
+            return False
         
         # Check for valid image extension
         parsed = urlparse(url)
@@ -253,18 +364,12 @@ class ImageScraperService:
     
     def _classify_image(self, url: str, alt_text: str) -> str:
         """Classify image type based on URL and alt text."""
-        combined = (url + " " + alt_text).lower()
+        combined = f"{url} {alt_text}".lower()
         
-        if any(word in combined for word in ['victim', 'missing', 'person', 'photo', 'portrait']):
-            return "victim"
-        elif any(word in combined for word in ['map', 'location', 'scene', 'area', 'site']):
-            return "location"
-        elif any(word in combined for word in ['evidence', 'forensic', 'weapon', 'clue']):
-            return "evidence"
-        elif any(word in combined for word in ['document', 'report', 'record', 'file']):
-            return "document"
-        else:
-            return "general"
+        for image_type, pattern in _IMAGE_TYPE_PATTERNS:
+            if pattern.search(combined):
+                return image_type
+        return "general"
 
 
 def create_image_scraper(output_dir: str = "frontend/images") -> ImageScraperService:
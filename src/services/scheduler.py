@@ -1,12 +1,23 @@
 """Episode scheduler for Murder Index."""
 
-import json
+import heapq
 import os
+from collections import Counter
+from contextlib import contextmanager
 from datetime import datetime, timedelta
-from typing import Optional, List
-from pydantic import BaseModel
+from itertools import islice
+from typing import Dict, Iterator, Optional, List, Tuple
+import orjson
+from pydantic import BaseModel, TypeAdapter
 from enum import Enum
 
+_ONE_DAY = timedelta(days=1)
+
+_WEEKDAYS = ("Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun")
+
+# Summary icon per episode status; any other status shows as a failure
+_STATUS_ICONS = {"pending": "⏳", "completed": "✅"}
+
 
 class ScheduleFrequency(str, Enum):
     DAILY = "daily"
@@ -19,13 +30,17 @@ class ScheduledEpisode(BaseModel):
     """A scheduled episode."""
     episode_id: str
     case_query: str  # Search query for finding the case
-    scheduled_date: str
+    scheduled_date: datetime
     status: str = "pending"  # pending, generating, completed, failed, skipped
     generated_date: Optional[str] = None
     error: Optional[str] = None
     cost: Optional[float] = None
 
 
+# Dumps the whole episode list in one call instead of model_dump() per episode
+_EPISODE_LIST = TypeAdapter(List[ScheduledEpisode])
+
+
 class ScheduleConfig(BaseModel):
     """Scheduler configuration."""
     frequency: ScheduleFrequency = ScheduleFrequency.WEEKLY
@@ -50,34 +65,93 @@ class EpisodeScheduler:
         self.data_file = data_file
         self.config = ScheduleConfig()
         self.scheduled_episodes: List[ScheduledEpisode] = []
+        # episode_id -> first episode with that id, for the mark_* lookups
+        self._by_id: Dict[str, ScheduledEpisode] = {}
+        # (scheduled_date, list position) of episodes that may still be pending.
+        # Entries whose episode has left "pending" are dropped when they surface.
+        self._pending_heap: List[Tuple[datetime, int]] = []
+        # Latest scheduled_date, so scheduling doesn't rescan every episode
+        self._latest_date: Optional[datetime] = None
         self.case_source_index = 0
+        # Inside batch(), saves are deferred and written once when it exits
+        self._batch_depth = 0
+        self._dirty = False
         self._load_data()
+        # Membership index for config.case_sources, kept in step by add_case_source
+        self._case_sources_set = set(self.config.case_sources)
     
     def _load_data(self):
         """Load schedule data from file."""
         if os.path.exists(self.data_file):
             try:
-                with open(self.data_file, "r") as f:
-                    data = json.load(f)
+                with open(self.data_file, "rb") as f:
+                    data = orjson.loads(f.read())
                     self.scheduled_episodes = [
                         ScheduledEpisode(**e) for e in data.get("episodes", [])
                     ]
+                    self._by_id = {}
+                    for e in self.scheduled_episodes:
+                        self._by_id.setdefault(e.episode_id, e)
+                    self._pending_heap = [
+                        (e.scheduled_date, i)
+                        for i, e in enumerate(self.scheduled_episodes)
+                        if e.status == "pending"
+                    ]
+                    heapq.heapify(self._pending_heap)
+                    self._latest_date = max(
+                        (e.scheduled_date for e in self.scheduled_episodes), default=None
+                    )
                     if "config" in data:
                         self.config = ScheduleConfig(**data["config"])
                     self.case_source_index = data.get("case_source_index", 0)
             except Exception:
                 pass
     
+    @contextmanager
+    def batch(self) -> Iterator["EpisodeScheduler"]:
+        """
+        Group several changes into a single write of the schedule file.
+        
+        Batches nest; the file is written when the outermost one exits.
+        """
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if self._batch_depth == 0 and self._dirty:
+                self._write_data()
+    
     def _save_data(self):
-        """Save schedule data to file."""
+        """Save schedule data to file, or defer it to the end of the current batch."""
+        if self._batch_depth:
+            self._dirty = True
+        else:
+            self._write_data()
+    
+    def _write_data(self):
+        """
+        Write schedule data to file.
+        
+        The data goes to a temporary file next to the schedule, which then
+        replaces it, so a crash mid-write never leaves a truncated schedule.
+        """
+        self._dirty = False
         data = {
-            "episodes": [e.model_dump() for e in self.scheduled_episodes],
+            "episodes": _EPISODE_LIST.dump_python(self.scheduled_episodes),
             "config": self.config.model_dump(),
             "case_source_index": self.case_source_index,
-            "last_updated": datetime.now().isoformat(),
+            "last_updated": datetime.now(),
         }
-        with open(self.data_file, "w") as f:
-            json.dump(data, f, indent=2)
+        tmp_file = f"{self.data_file}.tmp"
+        try:
+            with open(tmp_file, "wb") as f:
+                f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+            os.replace(tmp_file, self.data_file)
+        except BaseException:
+            if os.path.exists(tmp_file):
+                os.remove(tmp_file)
+            raise
     
     def set_frequency(self, frequency: ScheduleFrequency):
         """Set episode generation frequency."""
@@ -92,7 +166,8 @@ class EpisodeScheduler:
     
     def add_case_source(self, query: str):
         """Add a case search query to rotate through."""
-        if query not in self.config.case_sources:
+        if query not in self._case_sources_set:
+            self._case_sources_set.add(query)
             self.config.case_sources.append(query)
             self._save_data()
     
@@ -102,8 +177,11 @@ class EpisodeScheduler:
             return "cold case unsolved"
         
         query = self.config.case_sources[self.case_source_index]
-        self.case_source_index = (self.case_source_index + 1) % len(self.config.case_sources)
-        self._save_data()
+        next_index = (self.case_source_index + 1) % len(self.config.case_sources)
+        # A single-source rotation never moves; don't rewrite the file for it
+        if next_index != self.case_source_index:
+            self.case_source_index = next_index
+            self._save_data()
         return query
     
     def get_case_from_database(self, theme: str = None):
@@ -131,76 +209,81 @@ class EpisodeScheduler:
         if from_date is None:
             from_date = datetime.now()
         
+        if self.config.frequency == ScheduleFrequency.MONTHLY:
+            # First of next month at the preferred hour, built in one step
+            if from_date.month == 12:
+                year, month = from_date.year + 1, 1
+            else:
+                year, month = from_date.year, from_date.month + 1
+            return datetime(
+                year, month, 1, self.config.preferred_hour, tzinfo=from_date.tzinfo
+            )
+        
         if self.config.frequency == ScheduleFrequency.DAILY:
-            next_date = from_date + timedelta(days=1)
-        elif self.config.frequency == ScheduleFrequency.WEEKLY:
-            days_ahead = self.config.preferred_day - from_date.weekday()
-            if days_ahead <= 0:
-                days_ahead += 7
-            next_date = from_date + timedelta(days=days_ahead)
-        elif self.config.frequency == ScheduleFrequency.BIWEEKLY:
+            delta = _ONE_DAY
+        else:
             days_ahead = self.config.preferred_day - from_date.weekday()
             if days_ahead <= 0:
-                days_ahead += 14
-            next_date = from_date + timedelta(days=days_ahead)
-        else:  # MONTHLY
-            if from_date.month == 12:
-                next_date = from_date.replace(year=from_date.year + 1, month=1, day=1)
-            else:
-                next_date = from_date.replace(month=from_date.month + 1, day=1)
+                days_ahead += 7 if self.config.frequency == ScheduleFrequency.WEEKLY else 14
+            delta = timedelta(days=days_ahead)
         
         # Set preferred hour
-        next_date = next_date.replace(
+        return (from_date + delta).replace(
             hour=self.config.preferred_hour,
             minute=0,
             second=0,
             microsecond=0
         )
-        
-        return next_date
     
     def schedule_next_episode(self, case_query: Optional[str] = None) -> ScheduledEpisode:
         """Schedule the next episode."""
-        if case_query is None:
-            case_query = self.get_next_case_query()
-        
-        # Find the last scheduled date
-        if self.scheduled_episodes:
-            last_date = max(
-                datetime.fromisoformat(e.scheduled_date)
-                for e in self.scheduled_episodes
+        with self.batch():
+            if case_query is None:
+                case_query = self.get_next_case_query()
+            
+            # Continue from the last scheduled date, or from now for an empty schedule
+            last_date = self._latest_date or datetime.now()
+            
+            next_date = self.calculate_next_date(last_date)
+            
+            episode = ScheduledEpisode(
+                episode_id=f"ep-{next_date.strftime('%Y%m%d')}",
+                case_query=case_query,
+                scheduled_date=next_date,
             )
-        else:
-            last_date = datetime.now()
-        
-        next_date = self.calculate_next_date(last_date)
-        
-        episode = ScheduledEpisode(
-            episode_id=f"ep-{next_date.strftime('%Y%m%d')}",
-            case_query=case_query,
-            scheduled_date=next_date.isoformat(),
-        )
-        
-        self.scheduled_episodes.append(episode)
-        self._save_data()
-        
-        return episode
+            
+            heapq.heappush(self._pending_heap, (next_date, len(self.scheduled_episodes)))
+            self.scheduled_episodes.append(episode)
+            self._by_id.setdefault(episode.episode_id, episode)
+            self._latest_date = max(next_date, last_date)
+            self._save_data()
+            
+            return episode
     
     def schedule_multiple(self, count: int) -> List[ScheduledEpisode]:
         """Schedule multiple episodes in advance."""
         episodes = []
-        for _ in range(count):
-            episode = self.schedule_next_episode()
-            episodes.append(episode)
+        with self.batch():
+            for _ in range(count):
+                episode = self.schedule_next_episode()
+                episodes.append(episode)
         return episodes
     
     def get_pending_episodes(self) -> List[ScheduledEpisode]:
         """Get episodes that are due for generation."""
         now = datetime.now()
-        return [
-            e for e in self.scheduled_episodes
-            if e.status == "pending" and datetime.fromisoformat(e.scheduled_date) <= now
-        ]
+        heap = self._pending_heap
+        due = []
+        # Only the due prefix of the heap is visited, not the whole schedule
+        while heap and heap[0][0] <= now:
+            entry = heapq.heappop(heap)
+            if self.scheduled_episodes[entry[1]].status == "pending":
+                due.append(entry)
+        # Due episodes stay pending until marked, so they go back on the heap
+        for entry in due:
+            heapq.heappush(heap, entry)
+        due.sort(key=lambda entry: entry[1])
+        return [self.scheduled_episodes[position] for _, position in due]
     
     def get_upcoming_episodes(self, days: int = 30) -> List[ScheduledEpisode]:
         """Get upcoming scheduled episodes."""
@@ -208,65 +291,65 @@ class EpisodeScheduler:
         cutoff = now + timedelta(days=days)
         return [
             e for e in self.scheduled_episodes
-            if datetime.fromisoformat(e.scheduled_date) <= cutoff
+            if e.scheduled_date <= cutoff
         ]
     
     def mark_completed(self, episode_id: str, cost: float = 0.0):
         """Mark an episode as completed."""
-        for episode in self.scheduled_episodes:
-            if episode.episode_id == episode_id:
-                episode.status = "completed"
-                episode.generated_date = datetime.now().isoformat()
-                episode.cost = cost
-                break
+        episode = self._by_id.get(episode_id)
+        if episode is not None:
+            episode.status = "completed"
+            episode.generated_date = datetime.now().isoformat()
+            episode.cost = cost
         self._save_data()
     
     def mark_failed(self, episode_id: str, error: str):
         """Mark an episode as failed."""
-        for episode in self.scheduled_episodes:
-            if episode.episode_id == episode_id:
-                episode.status = "failed"
-                episode.error = error
-                break
+        episode = self._by_id.get(episode_id)
+        if episode is not None:
+            episode.status = "failed"
+            episode.error = error
         self._save_data()
     
     def mark_skipped(self, episode_id: str, reason: str):
         """Mark an episode as skipped (e.g., budget exceeded)."""
-        for episode in self.scheduled_episodes:
-            if episode.episode_id == episode_id:
-                episode.status = "skipped"
-                episode.error = reason
-                break
+        episode = self._by_id.get(episode_id)
+        if episode is not None:
+            episode.status = "skipped"
+            episode.error = reason
         self._save_data()
     
     def get_summary(self) -> str:
         """Get a human-readable schedule summary."""
-        pending = [e for e in self.scheduled_episodes if e.status == "pending"]
-        completed = [e for e in self.scheduled_episodes if e.status == "completed"]
-        failed = [e for e in self.scheduled_episodes if e.status == "failed"]
+        # One pass over the schedule for all status counts
+        counts = Counter(e.status for e in self.scheduled_episodes)
         
         lines = [
             "📅 SCHEDULE SUMMARY",
             "=" * 40,
             f"Frequency: {self.config.frequency.value}",
-            f"Preferred Day: {['Mon','Tue','Wed','Thu','Fri','Sat','Sun'][self.config.preferred_day]}",
+            f"Preferred Day: {_WEEKDAYS[self.config.preferred_day]}",
             f"Preferred Time: {self.config.preferred_hour}:00",
             "",
             f"📊 Episodes:",
-            f"   Pending: {len(pending)}",
-            f"   Completed: {len(completed)}",
-            f"   Failed: {len(failed)}",
+            f"   Pending: {counts['pending']}",
+            f"   Completed: {counts['completed']}",
+            f"   Failed: {counts['failed']}",
             "",
         ]
         
-        # Upcoming episodes
-        upcoming = self.get_upcoming_episodes(14)
+        # Upcoming episodes; only the first five are shown, so stop there
+        cutoff = datetime.now() + timedelta(days=14)
+        upcoming = list(islice(
+            (e for e in self.scheduled_episodes if e.scheduled_date <= cutoff), 5
+        ))
         if upcoming:
             lines.append("📆 Upcoming (next 2 weeks):")
-            for ep in upcoming[:5]:
-                date = datetime.fromisoformat(ep.scheduled_date)
-                status_icon = "⏳" if ep.status == "pending" else "✅" if ep.status == "completed" else "❌"
-                lines.append(f"   {status_icon} {date.strftime('%b %d')} - {ep.case_query[:30]}...")
+            lines.extend(
+                f"   {_STATUS_ICONS.get(ep.status, '❌')} "
+                f"{ep.scheduled_date.strftime('%b %d')} - {ep.case_query[:30]}..."
+                for ep in upcoming
+            )
         
         return "\n".join(lines)
 
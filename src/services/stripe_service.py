@@ -7,10 +7,15 @@ Uses Stripe Checkout Sessions (recommended approach) for payment flows.
 
 import os
 import asyncio
-from datetime import datetime
-from typing import Literal, Optional
-from pydantic import BaseModel, Field
+import hashlib
+import hmac
+import time
+from datetime import UTC, datetime
+from typing import Any, Literal, Optional
+from urllib.parse import urlencode
+from pydantic import BaseModel, Field, field_validator
 import httpx
+import orjson
 
 # Membership tiers
 MembershipTier = Literal["free", "premium", "founding"]
@@ -37,8 +42,22 @@ class Member(BaseModel):
     stripe_customer_id: Optional[str] = None
     stripe_subscription_id: Optional[str] = None
     subscription_status: Optional[str] = None
-    created_at: datetime = Field(default_factory=datetime.utcnow)
-    updated_at: datetime = Field(default_factory=datetime.utcnow)
+    # Unix epoch seconds (UTC); format for display at the API boundary
+    created_at: int = Field(default_factory=lambda: int(time.time()))
+    updated_at: int = Field(default_factory=lambda: int(time.time()))
+    
+    @field_validator("created_at", "updated_at", mode="before")
+    @classmethod
+    def _to_epoch_seconds(cls, value: Any) -> Any:
+        """Accept the ISO timestamps stored in the members table."""
+        if isinstance(value, str):
+            value = datetime.fromisoformat(value)
+        if isinstance(value, datetime):
+            # Naive values come from datetime.utcnow() in the auth service
+            if value.tzinfo is None:
+                value = value.replace(tzinfo=UTC)
+            return int(value.timestamp())
+        return value
 
 
 class CheckoutResult(BaseModel):
@@ -91,6 +110,30 @@ MEMBERSHIP_PLANS: dict[MembershipTier, MembershipPlan] = {
     ),
 }
 
+BillingCycle = Literal["monthly", "yearly"]
+
+
+def _plan_price_ids(plan: MembershipPlan) -> tuple[tuple[BillingCycle, Optional[str]], ...]:
+    """Pair each billing cycle with the plan's configured Stripe price ID."""
+    return (
+        ("monthly", plan.stripe_price_id_monthly),
+        ("yearly", plan.stripe_price_id_yearly),
+    )
+
+
+# Flat view of the Stripe price IDs configured on MEMBERSHIP_PLANS, built once
+_TIER_PRICE_IDS: dict[tuple[MembershipTier, BillingCycle], str] = {
+    (tier, cycle): price_id
+    for tier, plan in MEMBERSHIP_PLANS.items()
+    for cycle, price_id in _plan_price_ids(plan)
+    if price_id
+}
+
+
+def get_plan_price_id(tier: MembershipTier, billing_cycle: BillingCycle) -> Optional[str]:
+    """Return the pre-created Stripe price ID for a plan, if one is configured."""
+    return _TIER_PRICE_IDS.get((tier, billing_cycle))
+
 
 class StripeService:
     """
@@ -118,6 +161,26 @@ class StripeService:
             raise ValueError(
                 "Stripe secret key required. Set STRIPE_SECRET_KEY in .env"
             )
+        
+        # One pooled HTTP/2 client for every call, so requests to api.stripe.com
+        # reuse a warm connection instead of a new TCP+TLS handshake each time
+        self._client = httpx.AsyncClient(
+            base_url=self.base_url,
+            headers=self._headers,
+            http2=True,
+            timeout=30.0,
+            limits=httpx.Limits(max_keepalive_connections=20),
+        )
+    
+    async def __aenter__(self) -> "StripeService":
+        return self
+    
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.aclose()
+    
+    async def aclose(self) -> None:
+        """Close the shared HTTP client."""
+        await self._client.aclose()
     
     @property
     def _headers(self) -> dict[str, str]:
@@ -129,70 +192,58 @@ class StripeService:
     
     async def create_customer(self, email: str, name: Optional[str] = None) -> str:
         """Create a Stripe customer and return customer ID."""
-        async with httpx.AsyncClient() as client:
-            data = {"email": email}
-            if name:
-                data["name"] = name
-            
-            response = await client.post(
-                f"{self.base_url}/customers",
-                headers=self._headers,
-                data=data,
-            )
-            response.raise_for_status()
-            return response.json()["id"]
+        data = {"email": email}
+        if name:
+            data["name"] = name
+        
+        response = await self._client.post("/customers", data=data)
+        response.raise_for_status()
+        return orjson.loads(response.content)["id"]
     
     async def create_product_and_prices(self, plan: MembershipPlan) -> dict[str, str]:
         """
         Create a Stripe product with monthly and yearly prices.
         Returns dict with price IDs.
         """
-        async with httpx.AsyncClient() as client:
-            # Create product
-            product_response = await client.post(
-                f"{self.base_url}/products",
-                headers=self._headers,
-                data={
-                    "name": f"Murder Index - {plan.name}",
-                    "description": ", ".join(plan.features[:3]),
-                },
-            )
-            product_response.raise_for_status()
-            product_id = product_response.json()["id"]
-            
-            # Create monthly price
-            monthly_response = await client.post(
-                f"{self.base_url}/prices",
-                headers=self._headers,
-                data={
-                    "product": product_id,
-                    "unit_amount": int(plan.price_monthly * 100),  # cents
-                    "currency": "usd",
-                    "recurring[interval]": "month",
-                },
-            )
-            monthly_response.raise_for_status()
-            monthly_price_id = monthly_response.json()["id"]
-            
-            # Create yearly price
-            yearly_response = await client.post(
-                f"{self.base_url}/prices",
-                headers=self._headers,
+        # Create product
+        product_response = await self._client.post(
+            "/products",
+            data={
+                "name": f"Murder Index - {plan.name}",
+                "description": ", ".join(plan.features[:3]),
+            },
+        )
+        product_response.raise_for_status()
+        product_id = orjson.loads(product_response.content)["id"]
+        
+        async def create_price(unit_amount: float, interval: str) -> str:
+            response = await self._client.post(
+                "/prices",
                 data={
                     "product": product_id,
-                    "unit_amount": int(plan.price_yearly * 100),  # cents
+                    "unit_amount": int(unit_amount * 100),  # cents
                     "currency": "usd",
-                    "recurring[interval]": "year",
+                    "recurring[interval]": interval,
                 },
             )
-            yearly_response.raise_for_status()
-            yearly_price_id = yearly_response.json()["id"]
-            
-            return {
-                "product_id": product_id,
-                "monthly_price_id": monthly_price_id,
-                "yearly_price_id": yearly_price_id,
-            }
+            response.raise_for_status()
+            return str(orjson.loads(response.content)["id"])
+
+        # The two prices only depend on the product, so create them together.
+        # The task group cancels the other request as soon as one fails, so a
+        # failed checkout setup doesn't leave a stray price behind.
+        try:
+            async with asyncio.TaskGroup() as tg:
+                monthly = tg.create_task(create_price(plan.price_monthly, "month"))
+                yearly = tg.create_task(create_price(plan.price_yearly, "year"))
+        except ExceptionGroup as group:
+            raise group.exceptions[0]
+        
+        return {
+            "product_id": product_id,
+            "monthly_price_id": monthly.result(),
+            "yearly_price_id": yearly.result(),
+        }
 
     async def create_checkout_session(
         self,
@@ -206,46 +257,39 @@ class StripeService:
         
         Returns URL to redirect customer to Stripe's hosted checkout.
         """
-        async with httpx.AsyncClient() as client:
-            data = {
-                "mode": "subscription",
-                "line_items[0][price]": price_id,
-                "line_items[0][quantity]": "1",
-                "success_url": f"{self.success_url}?session_id={{CHECKOUT_SESSION_ID}}",
-                "cancel_url": self.cancel_url,
-            }
-            
-            if customer_id:
-                data["customer"] = customer_id
-            elif customer_email:
-                data["customer_email"] = customer_email
-            
-            if metadata:
-                for key, value in metadata.items():
-                    data[f"metadata[{key}]"] = value
-            
-            response = await client.post(
-                f"{self.base_url}/checkout/sessions",
-                headers=self._headers,
-                data=data,
-            )
-            response.raise_for_status()
-            result = response.json()
-            
-            return CheckoutResult(
-                checkout_url=result["url"],
-                session_id=result["id"],
-            )
+        # Form fields go straight into one urlencode pass, without an
+        # intermediate dict for httpx to walk again
+        fields = [
+            ("mode", "subscription"),
+            ("line_items[0][price]", price_id),
+            ("line_items[0][quantity]", "1"),
+            ("success_url", f"{self.success_url}?session_id={{CHECKOUT_SESSION_ID}}"),
+            ("cancel_url", self.cancel_url),
+        ]
+        
+        if customer_id:
+            fields.append(("customer", customer_id))
+        elif customer_email:
+            fields.append(("customer_email", customer_email))
+        
+        if metadata:
+            fields.extend((f"metadata[{key}]", value) for key, value in metadata.items())
+        
+        # The client's default headers already declare the form content type
+        response = await self._client.post("/checkout/sessions", content=urlencode(fields))
+        response.raise_for_status()
+        result = orjson.loads(response.content)
+        
+        return CheckoutResult(
+            checkout_url=result["url"],
+            session_id=result["id"],
+        )
     
     async def get_subscription(self, subscription_id: str) -> dict:
         """Get subscription details."""
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                f"{self.base_url}/subscriptions/{subscription_id}",
-                headers=self._headers,
-            )
-            response.raise_for_status()
-            return response.json()
+        response = await self._client.get(f"/subscriptions/{subscription_id}")
+        response.raise_for_status()
+        return orjson.loads(response.content)
     
     async def cancel_subscription(
         self, 
@@ -257,14 +301,12 @@ class StripeService:
         
         By default, cancels at end of billing period (recommended).
         """
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                f"{self.base_url}/subscriptions/{subscription_id}",
-                headers=self._headers,
-                data={"cancel_at_period_end": str(at_period_end).lower()},
-            )
-            response.raise_for_status()
-            return response.json()
+        response = await self._client.post(
+            f"/subscriptions/{subscription_id}",
+            data={"cancel_at_period_end": str(at_period_end).lower()},
+        )
+        response.raise_for_status()
+        return orjson.loads(response.content)
     
     async def create_billing_portal_session(
         self,
@@ -276,17 +318,15 @@ class StripeService:
         
         Allows customers to manage their subscription, update payment, etc.
         """
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                f"{self.base_url}/billing_portal/sessions",
-                headers=self._headers,
-                data={
-                    "customer": customer_id,
-                    "return_url": return_url,
-                },
-            )
-            response.raise_for_status()
-            return response.json()["url"]
+        response = await self._client.post(
+            "/billing_portal/sessions",
+            data={
+                "customer": customer_id,
+                "return_url": return_url,
+            },
+        )
+        response.raise_for_status()
+        return orjson.loads(response.content)["url"]
     
     def verify_webhook_signature(
         self,
@@ -298,38 +338,39 @@ class StripeService:
         
         Raises ValueError if signature is invalid.
         """
-        import hmac
-        import hashlib
-        import time
-        
         if not self.webhook_secret:
             raise ValueError("Webhook secret not configured")
         
-        # Parse signature header
-        elements = dict(item.split("=") for item in signature.split(","))
-        timestamp = elements.get("t")
-        v1_signature = elements.get("v1")
+        # Parse signature header, keeping only the fields we check. Stripe
+        # sends one v1 entry per active secret while a secret is being rolled.
+        timestamp = None
+        v1_signatures = []
+        for item in signature.split(","):
+            key, _, value = item.partition("=")
+            if key == "t":
+                timestamp = value
+            elif key == "v1" and value:
+                v1_signatures.append(value)
         
-        if not timestamp or not v1_signature:
+        if not timestamp or not v1_signatures:
             raise ValueError("Invalid signature format")
         
         # Check timestamp (prevent replay attacks)
         if abs(time.time() - int(timestamp)) > 300:  # 5 min tolerance
             raise ValueError("Timestamp too old")
         
-        # Compute expected signature
-        signed_payload = f"{timestamp}.{payload.decode()}"
-        expected = hmac.new(
-            self.webhook_secret.encode(),
-            signed_payload.encode(),
-            hashlib.sha256,
-        ).hexdigest()
+        # Compute expected signature over "{timestamp}.{payload}", feeding the
+        # raw body straight in rather than decoding and re-encoding it
+        mac = hmac.new(self.webhook_secret.encode(), None, hashlib.sha256)
+        mac.update(timestamp.encode())
+        mac.update(b".")
+        mac.update(payload)
+        expected = mac.hexdigest()
         
-        if not hmac.compare_digest(expected, v1_signature):
+        if not any(hmac.compare_digest(expected, v1) for v1 in v1_signatures):
             raise ValueError("Invalid signature")
         
-        import json
-        return json.loads(payload)
+        return orjson.loads(payload)
 
 
 # Convenience function
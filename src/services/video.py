@@ -1,9 +1,11 @@
 """Video service for generating video clips using Creatomate REST API."""
 
+import asyncio
 import logging
 from typing import Any, Optional
 
 import httpx
+import orjson
 
 from src.models.script import PodcastScript
 from src.utils.errors import CreatomateAPIError, VideoServiceError
@@ -14,6 +16,9 @@ logger = logging.getLogger(__name__)
 # Creatomate API endpoint
 CREATOMATE_API_URL = "https://api.creatomate.com/v2/renders"
 
+# Renders in flight at once per service, to stay within Creatomate rate limits
+MAX_CONCURRENT_RENDERS = 4
+
 
 class VideoService:
     """Service for generating video clips using Creatomate REST API."""
@@ -23,6 +28,7 @@ class VideoService:
         creatomate_api_key: str,
         template_id: str,
         supabase_client: Optional[Any] = None,
+        max_concurrent_renders: int = MAX_CONCURRENT_RENDERS,
     ) -> None:
         """
         Initialize the VideoService.
@@ -31,11 +37,43 @@ class VideoService:
             creatomate_api_key: API key for Creatomate service
             template_id: Creatomate template ID for video generation
             supabase_client: Supabase client for storage (optional)
+            max_concurrent_renders: Maximum clips rendered at once
         """
         self.api_key = creatomate_api_key
         self.template_id = template_id
         self.supabase = supabase_client
         self.api_url = CREATOMATE_API_URL
+        self.max_concurrent_renders = max_concurrent_renders
+        # Opened on the first render, so a service that never renders holds
+        # no connections
+        self._client: Optional[httpx.AsyncClient] = None
+
+    async def __aenter__(self) -> "VideoService":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """Close the shared HTTP client, if one was opened."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    def _get_client(self) -> httpx.AsyncClient:
+        """Get the HTTP client, opening it on first use."""
+        if self._client is None:
+            # Renders for one script go to the same host; keep the connection warm
+            self._client = httpx.AsyncClient(
+                headers={
+                    "Authorization": f"Bearer {self.api_key}",
+                    "Content-Type": "application/json",
+                },
+                http2=True,
+                timeout=60.0,
+                limits=httpx.Limits(max_keepalive_connections=20),
+            )
+        return self._client
 
     def _build_render_payload(self, hook: str, audio_url: str) -> dict[str, Any]:
         """
@@ -56,7 +94,7 @@ class VideoService:
             },
         }
 
-    @with_retry(max_attempts=3, base_delay=1.0, exceptions=(CreatomateAPIError, Exception))
+    @with_retry(max_attempts=3, base_delay=1.0, exceptions=(VideoServiceError,))
     async def generate_clip(self, hook: str, audio_url: str) -> str:
         """
         Generate a video clip for a social hook.
@@ -75,38 +113,30 @@ class VideoService:
         payload = self._build_render_payload(hook, audio_url)
 
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.post(
-                    self.api_url,
-                    json=payload,
-                    headers={
-                        "Authorization": f"Bearer {self.api_key}",
-                        "Content-Type": "application/json",
-                    },
-                    timeout=60.0,
-                )
+            response = await self._get_client().post(self.api_url, json=payload)
 
-                if response.status_code != 200 and response.status_code != 201:
-                    raise CreatomateAPIError(
-                        response.status_code,
-                        response.text,
-                    )
+            if response.status_code != 200 and response.status_code != 201:
+                raise CreatomateAPIError(
+                    response.status_code,
+                    response.text,
+                )
 
-                result = response.json()
+            # Decode the body bytes directly; renders can carry large template data
+            result = orjson.loads(response.content)
 
-                # Creatomate returns a list of renders
-                if isinstance(result, list) and len(result) > 0:
-                    video_url = result[0].get("url", "")
-                elif isinstance(result, dict):
-                    video_url = result.get("url", "")
-                else:
-                    raise VideoServiceError("Unexpected response format from Creatomate")
+            # Creatomate returns a list of renders
+            if isinstance(result, list) and len(result) > 0:
+                video_url = result[0].get("url", "")
+            elif isinstance(result, dict):
+                video_url = result.get("url", "")
+            else:
+                raise VideoServiceError("Unexpected response format from Creatomate")
 
-                if not video_url:
-                    raise VideoServiceError("No video URL in Creatomate response")
+            if not video_url:
+                raise VideoServiceError("No video URL in Creatomate response")
 
-                logger.info(f"Generated video clip: {video_url}")
-                return video_url
+            logger.info(f"Generated video clip: {video_url}")
+            return video_url
 
         except httpx.HTTPError as e:
             raise VideoServiceError(f"HTTP error during video generation: {e}")
@@ -117,6 +147,9 @@ class VideoService:
         """
         Generate video clips for all social hooks in a script.
 
+        Up to ``max_concurrent_renders`` clips are rendered at once. A hook
+        whose clip fails is logged and left out of the result.
+
         Args:
             script: PodcastScript containing social hooks
             audio_url: URL of the audio file to include in videos
@@ -131,20 +164,27 @@ class VideoService:
             logger.warning(f"Script {script.script_id} has no social hooks")
             return []
 
-        video_urls: list[str] = []
+        semaphore = asyncio.Semaphore(self.max_concurrent_renders)
 
-        for idx, hook in enumerate(script.social_hooks):
-            try:
-                logger.debug(
-                    f"Generating clip {idx + 1}/{len(script.social_hooks)} "
-                    f"for script {script.script_id}"
-                )
-                video_url = await self.generate_clip(hook, audio_url)
-                video_urls.append(video_url)
-            except Exception as e:
-                logger.error(f"Failed to generate clip for hook {idx + 1}: {e}")
-                # Log error and mark as failed per Req 4.4
-                # Continue processing remaining hooks
+        async def render(idx: int, hook: str) -> Optional[str]:
+            async with semaphore:
+                try:
+                    logger.debug(
+                        f"Generating clip {idx + 1}/{len(script.social_hooks)} "
+                        f"for script {script.script_id}"
+                    )
+                    return await self.generate_clip(hook, audio_url)
+                except Exception as e:
+                    logger.error(f"Failed to generate clip for hook {idx + 1}: {e}")
+                    # Log error and mark as failed per Req 4.4
+                    # Continue processing remaining hooks
+                    return None
+
+        # Renders are network-bound, so run them side by side; results keep hook order
+        results = await asyncio.gather(
+            *(render(idx, hook) for idx, hook in enumerate(script.social_hooks))
+        )
+        video_urls = [video_url for video_url in results if video_url is not None]
 
         logger.info(
             f"Generated {len(video_urls)}/{len(script.social_hooks)} clips "
@@ -207,7 +247,8 @@ def create_video_service(supabase_client: Optional[Any] = None) -> VideoService:
         supabase_client: Optional Supabase client for storage
 
     Returns:
-        Configured VideoService instance
+        Configured VideoService instance; the caller owns its HTTP client and
+        should use it as an async context manager or call ``aclose()``
     """
     from src.config import get_settings
 
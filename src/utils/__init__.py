@@ -1,5 +1,6 @@
 """Utility modules for Murder Index."""
 
+from src.utils.cache import disk_cache
 from src.utils.errors import (
     AgentResponseError,
     AudioServiceError,
@@ -9,8 +10,10 @@ from src.utils.errors import (
     DebateEngineError,
     ElevenLabsAPIError,
     FirecrawlAPIError,
+    TransientError,
     VideoServiceError,
 )
+from src.utils.patterns import literal_union
 from src.utils.retry import with_retry
 
 __all__ = [
@@ -23,5 +26,8 @@ __all__ = [
     "ElevenLabsAPIError",
     "VideoServiceError",
     "CreatomateAPIError",
+    "TransientError",
+    "disk_cache",
+    "literal_union",
     "with_retry",
 ]
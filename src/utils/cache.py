@@ -0,0 +1,81 @@
+"""Content-addressed disk cache for expensive async calls."""
+
+import functools
+import hashlib
+import json
+import logging
+import os
+from pathlib import Path
+from typing import Any, Awaitable, Callable, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+def _identity(value: Any) -> Any:
+    return value
+
+
+def cache_key(key: Any) -> str:
+    """
+    Hash a JSON-serializable key into a stable file name.
+
+    Args:
+        key: Value identifying the call, e.g. a tuple of its inputs
+
+    Returns:
+        Hex SHA-256 digest of the key's canonical JSON form
+    """
+    payload = json.dumps(key, sort_keys=True, default=str, separators=(",", ":"))
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def disk_cache(
+    directory: str | Path,
+    key_fn: Callable[..., Any],
+    encode: Callable[[T], bytes] = _identity,
+    decode: Callable[[bytes], T] = _identity,
+) -> Callable[[Callable[..., Awaitable[T]]], Callable[..., Awaitable[T]]]:
+    """
+    Decorator that stores async results on disk, keyed by their inputs.
+
+    A hit returns the stored value without calling the wrapped function, so
+    repeated runs with identical inputs skip the upstream API entirely.
+
+    Args:
+        directory: Directory holding one file per cached result
+        key_fn: Called with the wrapped function's arguments; returns the
+            JSON-serializable key that identifies the result
+        encode: Converts a result to bytes (default: result is already bytes)
+        decode: Converts stored bytes back to a result
+
+    Returns:
+        Decorated async function with disk caching
+    """
+    cache_dir = Path(directory)
+
+    def decorator(func: Callable[..., Awaitable[T]]) -> Callable[..., Awaitable[T]]:
+        @functools.wraps(func)
+        async def wrapper(*args: Any, **kwargs: Any) -> T:
+            path = cache_dir / cache_key(key_fn(*args, **kwargs))
+            try:
+                data = path.read_bytes()
+            except FileNotFoundError:
+                pass
+            else:
+                logger.debug(f"{func.__name__} cache hit: {path.name}")
+                return decode(data)
+
+            result = await func(*args, **kwargs)
+
+            # Write then rename so a crash never leaves a truncated entry
+            cache_dir.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_name(f"{path.name}.tmp")
+            tmp_path.write_bytes(encode(result))
+            os.replace(tmp_path, path)
+            return result
+
+        return wrapper
+
+    return decorator
@@ -1,5 +1,9 @@
 """Custom exception classes for Murder Index."""
 
+# Upstream HTTP statuses worth retrying: timeouts, conflicts, rate limits and
+# temporary server failures. Anything else will fail the same way again.
+RETRIABLE_STATUS_CODES = frozenset({408, 409, 425, 429, 500, 502, 503, 504})
+
 
 class ColdCaseCrawlerError(Exception):
     """Base exception for all application errors."""
@@ -7,18 +11,43 @@ class ColdCaseCrawlerError(Exception):
     pass
 
 
+class TransientError(ColdCaseCrawlerError):
+    """A failure that may succeed if the same call is made again."""
+
+    pass
+
+
+class _APIStatusError(ColdCaseCrawlerError):
+    """An upstream API answered with an error status.
+
+    The message is rendered in __str__ rather than here, so it is only
+    built when the error is displayed or a log record that includes it is
+    actually emitted (with_retry logs lazily). ``args`` is
+    ``(status_code, message)``; use ``str(error)`` for the readable text.
+    """
+
+    service = "API"
+
+    def __init__(self, status_code: int, message: str) -> None:
+        self.status_code = status_code
+        self.message = message
+        self.retriable = status_code in RETRIABLE_STATUS_CODES
+        super().__init__(status_code, message)
+
+    def __str__(self) -> str:
+        return f"{self.service} error {self.status_code}: {self.message}"
+
+
 class CrawlerError(ColdCaseCrawlerError):
     """Errors from the crawler service."""
 
     pass
 
 
-class FirecrawlAPIError(CrawlerError):
+class FirecrawlAPIError(CrawlerError, _APIStatusError):
     """Firecrawl API returned an error."""
 
-    def __init__(self, status_code: int, message: str) -> None:
-        self.status_code = status_code
-        super().__init__(f"Firecrawl error {status_code}: {message}")
+    service = "Firecrawl"
 
 
 class DebateEngineError(ColdCaseCrawlerError):
@@ -39,12 +68,10 @@ class AudioServiceError(ColdCaseCrawlerError):
     pass
 
 
-class ElevenLabsAPIError(AudioServiceError):
+class ElevenLabsAPIError(AudioServiceError, _APIStatusError):
     """ElevenLabs API returned an error."""
 
-    def __init__(self, status_code: int, message: str) -> None:
-        self.status_code = status_code
-        super().__init__(f"ElevenLabs error {status_code}: {message}")
+    service = "ElevenLabs"
 
 
 class VideoServiceError(ColdCaseCrawlerError):
@@ -53,9 +80,7 @@ class VideoServiceError(ColdCaseCrawlerError):
     pass
 
 
-class CreatomateAPIError(VideoServiceError):
+class CreatomateAPIError(VideoServiceError, _APIStatusError):
     """Creatomate API returned an error."""
 
-    def __init__(self, status_code: int, message: str) -> None:
-        self.status_code = status_code
-        super().__init__(f"Creatomate error {status_code}: {message}")
+    service = "Creatomate"
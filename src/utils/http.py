@@ -0,0 +1,42 @@
+"""Shared HTTP client configuration for upstream API SDKs."""
+
+import ssl
+from functools import cache
+
+import httpx
+
+# Keep idle connections long enough to span the gaps between debate turns
+# and TTS segments, so follow-up calls skip the TCP and TLS handshake.
+DEFAULT_LIMITS = httpx.Limits(
+    max_keepalive_connections=16,
+    max_connections=32,
+    keepalive_expiry=60,
+)
+DEFAULT_TIMEOUT = httpx.Timeout(60.0, connect=10.0)
+
+
+def create_async_http_client(timeout: httpx.Timeout = DEFAULT_TIMEOUT) -> httpx.AsyncClient:
+    """
+    Create a pooled HTTP/2 client suitable for passing to an API SDK.
+
+    Args:
+        timeout: Request timeout configuration
+
+    Returns:
+        An httpx.AsyncClient with keep-alive pooling tuned for repeated calls
+    """
+    return httpx.AsyncClient(limits=DEFAULT_LIMITS, http2=True, timeout=timeout)
+
+
+@cache
+def get_ssl_context() -> ssl.SSLContext:
+    """
+    Get the process-wide SSL context for pooled clients.
+
+    Loading the CA bundle takes tens of milliseconds, so clients created per
+    service instance share one context instead of building their own.
+
+    Returns:
+        A default verifying SSL context
+    """
+    return httpx.create_ssl_context()
@@ -0,0 +1,40 @@
+"""Regex construction helpers for fixed keyword lists."""
+
+import re
+from typing import Dict, Iterable, List
+
+
+def literal_union(words: Iterable[str]) -> str:
+    """
+    Build a regex matching any of ``words``, with shared prefixes factored out.
+
+    A plain ``logo|icon|...`` alternation makes the regex engine try every word
+    at each position of the text. Grouping the words into a prefix tree lets
+    one character test rule out a whole branch, which matters for patterns run
+    against every candidate URL or dialogue line. A word that is a prefix of
+    another makes the rest of that branch optional.
+
+    Args:
+        words: Literal strings to match
+
+    Returns:
+        Regex pattern source matching the same texts as the plain alternation
+    """
+    branches: Dict[str, List[str]] = {}
+    for word in sorted(set(words)):
+        if word:
+            branches.setdefault(word[0], []).append(word[1:])
+
+    alternatives = []
+    for head, tails in branches.items():
+        rest = [tail for tail in tails if tail]
+        if not rest:
+            alternatives.append(re.escape(head))
+        elif len(rest) < len(tails):
+            alternatives.append(f"{re.escape(head)}(?:{literal_union(rest)})?")
+        else:
+            alternatives.append(re.escape(head) + literal_union(rest))
+
+    if len(alternatives) == 1:
+        return alternatives[0]
+    return f"(?:{'|'.join(alternatives)})"
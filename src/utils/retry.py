@@ -2,29 +2,65 @@
 
 import asyncio
 import logging
+import random
 from functools import wraps
 from typing import Any, Callable, TypeVar
 
+from src.utils.errors import TransientError
+
 logger = logging.getLogger(__name__)
 T = TypeVar("T")
 
 
+def is_retriable(error: Exception) -> bool:
+    """
+    Default retry predicate: retry unless the error says it is permanent.
+
+    API errors set ``retriable`` from their HTTP status, so a 400 or 404 fails
+    fast while a 429 or 503 is retried.
+
+    Args:
+        error: Exception raised by the decorated call
+
+    Returns:
+        True if the call should be attempted again
+    """
+    return getattr(error, "retriable", True)
+
+
 def with_retry(
     max_attempts: int = 3,
     base_delay: float = 1.0,
-    exceptions: tuple[type[Exception], ...] = (Exception,),
+    exceptions: tuple[type[Exception], ...] = (TransientError, TimeoutError, ConnectionError),
+    jitter: bool = True,
+    max_delay: float = 30.0,
+    retry_if: Callable[[Exception], bool] = is_retriable,
 ) -> Callable[[Callable[..., T]], Callable[..., T]]:
     """
     Decorator for exponential backoff retry logic.
 
+    Retries wait with asyncio.sleep, so other tasks keep running. With
+    jitter, each wait is drawn uniformly from zero up to the exponential
+    delay ("full jitter"), so concurrent calls that fail together, such as
+    parallel clip renders, don't all retry at the same moment. The
+    exponential delay is capped at ``max_delay`` before jitter is applied.
+
     Args:
         max_attempts: Maximum number of retry attempts
         base_delay: Base delay in seconds (doubles each attempt)
-        exceptions: Tuple of exception types to catch
+        exceptions: Tuple of exception types to catch; by default only
+            transient failures, so programming errors surface immediately
+        jitter: Randomize each delay between 0 and its exponential value
+        max_delay: Upper bound in seconds for any single delay
+        retry_if: Predicate deciding whether a caught exception is retried;
+            when it returns False the exception is re-raised at once
 
     Returns:
         Decorated function with retry logic
     """
+    # The backoff schedule depends only on the arguments, so build it once;
+    # delays[n] is the (pre-jitter) wait after the (n + 1)th failure.
+    delays = tuple(min(base_delay * (1 << n), max_delay) for n in range(max_attempts - 1))
 
     def decorator(func: Callable[..., T]) -> Callable[..., T]:
         @wraps(func)
@@ -35,16 +71,23 @@ def with_retry(
                 try:
                     return await func(*args, **kwargs)
                 except exceptions as e:
+                    if not retry_if(e):
+                        raise
                     last_exception = e
                     if attempt < max_attempts - 1:
-                        delay = base_delay * (2**attempt)
+                        delay = delays[attempt]
+                        if jitter:
+                            delay = random.uniform(0, delay)
                         logger.warning(
-                            f"Attempt {attempt + 1}/{max_attempts} failed: {e}. "
-                            f"Retrying in {delay}s..."
+                            "Attempt %d/%d failed: %s. Retrying in %.3fs...",
+                            attempt + 1,
+                            max_attempts,
+                            e,
+                            delay,
                         )
                         await asyncio.sleep(delay)
                     else:
-                        logger.error(f"All {max_attempts} attempts failed: {e}")
+                        logger.error("All %d attempts failed: %s", max_attempts, e)
 
             raise last_exception  # type: ignore
 
@@ -5,15 +5,20 @@ Simple test to verify Anthropic API key works.
 
 import os
 import asyncio
-from anthropic import AsyncAnthropic
 from dotenv import load_dotenv
 
 load_dotenv()
 
+from src.agents import DR_THORNE_SYSTEM_PROMPT, get_anthropic_client
+from src.agents.client import HOST_MODEL_NAME
+
+# Read once at import; the key does not change while the script runs
+ANTHROPIC_API_KEY = os.getenv("ANTHROPIC_API_KEY")
+
 async def test_anthropic_key():
     """Test if the Anthropic API key works."""
     
-    api_key = os.getenv("ANTHROPIC_API_KEY")
+    api_key = ANTHROPIC_API_KEY
     
     if not api_key:
         print("❌ ANTHROPIC_API_KEY not found in .env")
@@ -22,12 +27,15 @@ async def test_anthropic_key():
     print("🔑 Testing Anthropic API Key...")
     
     try:
-        client = AsyncAnthropic(api_key=api_key)
+        client = get_anthropic_client(api_key)
         
-        # Try to make a simple request
+        # Try to make a simple request with the debate model and persona.
+        # The persona alone is below the model's minimum cacheable prompt
+        # length, so it is sent without a cache breakpoint.
         response = await client.messages.create(
-            model="claude-3-5-sonnet-20241022",
+            model=HOST_MODEL_NAME,
             max_tokens=50,
+            system=DR_THORNE_SYSTEM_PROMPT,
             messages=[
                 {"role": "user", "content": "Say hello in one sentence."}
             ]
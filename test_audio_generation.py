@@ -6,6 +6,8 @@ This will test the debate generation and audio synthesis.
 
 import asyncio
 import os
+import shutil
+from pathlib import Path
 from dotenv import load_dotenv
 
 # Load environment variables first
@@ -13,8 +15,54 @@ load_dotenv()
 
 from src.config import get_settings
 from src.models.case import CaseFile, Evidence
+from src.models.script import DialogueLine, PodcastScript
 from src.services.debate import create_debate_engine
-from src.services.audio import create_audio_service
+from src.services.audio import AudioService, create_audio_service
+from src.utils.cache import cache_key, disk_cache
+
+
+# The test lines are synthesized side by side; the service itself defaults
+# to one line at a time
+TEST_CONCURRENT_SYNTHESES = 2
+
+
+# Identical inputs between runs reuse the stored debate and audio instead of
+# paying for the Anthropic and ElevenLabs calls again. Delete .cache/ to refresh.
+@disk_cache(
+    ".cache/debates",
+    key_fn=lambda case, num_exchanges: (case.case_id, case.raw_content, num_exchanges),
+    encode=lambda script: script.model_dump_json().encode(),
+    decode=PodcastScript.model_validate_json,
+)
+async def generate_debate(case: CaseFile, num_exchanges: int) -> PodcastScript:
+    return await create_debate_engine().generate_debate(case, num_exchanges=num_exchanges)
+
+
+AUDIO_CACHE_DIR = Path(".cache/audio")
+
+
+async def synthesize_to_file(service: AudioService, line: DialogueLine, filename: str) -> int:
+    """Stream a line's audio into filename chunk by chunk; returns the byte count."""
+    cached = AUDIO_CACHE_DIR / cache_key((
+        line.speaker,
+        line.text,
+        line.emotion_tag,
+        service.voice_map.get(line.speaker),
+        service.model_id,
+    ))
+    if cached.exists():
+        shutil.copyfile(cached, filename)
+        return cached.stat().st_size
+    
+    size = 0
+    with open(filename, "wb") as f:
+        async for chunk in service.synthesize_dialogue_stream(line):
+            f.write(chunk)
+            size += len(chunk)
+    
+    AUDIO_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    shutil.copyfile(filename, cached)
+    return size
 
 async def test_end_to_end():
     """Test the complete pipeline from case to audio."""
@@ -22,6 +70,8 @@ async def test_end_to_end():
     print("🎙️  TESTING COLD CASE CRAWLER END-TO-END")
     print("=" * 50)
     
+    settings = get_settings()
+    
     # Create a test case
     test_case = CaseFile(
         case_id="test-case-001",
@@ -63,8 +113,7 @@ async def test_end_to_end():
     # Test 1: Generate debate with AI agents
     print("\n🤖 STEP 1: Generating AI debate...")
     try:
-        debate_engine = create_debate_engine()
-        script = await debate_engine.generate_debate(test_case, num_exchanges=3)
+        script = await generate_debate(test_case, num_exchanges=3)
         
         print(f"✅ Generated script with {len(script.chapters)} dialogue lines")
         print(f"📝 Episode title: {script.episode_title}")
@@ -83,7 +132,6 @@ async def test_end_to_end():
     # Test 2: Generate audio (just first 2 lines to save API costs)
     print(f"\n🔊 STEP 2: Generating audio for first 2 lines...")
     try:
-        settings = get_settings()
         if not settings.elevenlabs_api_key:
             print("⚠️  No ElevenLabs API key found - skipping audio generation")
             print("✅ System is ready for audio generation when API key is provided")
@@ -95,26 +143,29 @@ async def test_end_to_end():
         test_lines = script.chapters[:2]
         
         for i, line in enumerate(test_lines, 1):
-            print(f"  Generating audio {i}/{len(test_lines)}...")
-            
             # Apply directorial pass and show formatted text
             processed_line = audio_service.apply_directorial_pass(line)
             formatted_text = processed_line.to_elevenlabs_format()
-            print(f"    Formatted: {formatted_text[:60]}...")
-            
-            # Generate audio (this will make actual API call)
-            audio_data = await audio_service.synthesize_dialogue(line)
-            
-            if audio_data and len(audio_data) > 0:
-                print(f"    ✅ Generated {len(audio_data)} bytes of audio")
-                
-                # Save to file for verification
-                filename = f"test_audio_line_{i}.mp3"
-                with open(filename, "wb") as f:
-                    f.write(audio_data)
-                print(f"    💾 Saved as {filename}")
+            print(f"  Line {i} formatted: {formatted_text[:60]}...")
+        
+        # Stream audio for all lines at once (this will make actual API calls)
+        print(f"  Generating audio for {len(test_lines)} lines...")
+        semaphore = asyncio.Semaphore(TEST_CONCURRENT_SYNTHESES)
+        filenames = [f"test_audio_line_{i}.mp3" for i in range(1, len(test_lines) + 1)]
+        
+        async def synthesize_one(line: DialogueLine, filename: str) -> int:
+            async with semaphore:
+                return await synthesize_to_file(audio_service, line, filename)
+        
+        sizes = await asyncio.gather(
+            *(synthesize_one(line, name) for line, name in zip(test_lines, filenames))
+        )
+        
+        for i, (size, filename) in enumerate(zip(sizes, filenames), 1):
+            if size > 0:
+                print(f"    ✅ Line {i}: streamed {size} bytes of audio to {filename}")
             else:
-                print(f"    ❌ No audio data generated")
+                print(f"    ❌ Line {i}: no audio data generated")
                 return False
                 
         print(f"\n🎉 SUCCESS! Generated audio for {len(test_lines)} dialogue lines")
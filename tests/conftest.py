@@ -1,6 +1,19 @@
 """Pytest fixtures for Murder Index tests."""
 
+import os
+
 import pytest
+from hypothesis import HealthCheck, settings
+
+# Hypothesis profiles, chosen with HYPOTHESIS_PROFILE (default: Hypothesis'
+# own "default", 100 examples). Tests leave max_examples to the profile.
+# The property tests are independent, so "ci" runs pair well with
+# ``pytest -n auto`` (pytest-xdist) to spread them across cores.
+settings.register_profile(
+    "ci", max_examples=50, deadline=None, suppress_health_check=[HealthCheck.too_slow]
+)
+settings.register_profile("dev", max_examples=20)
+settings.load_profile(os.getenv("HYPOTHESIS_PROFILE", "default"))
 
 
 @pytest.fixture
@@ -9,8 +9,7 @@ with error details.
 """
 
 import pytest
-from hypothesis import given, settings, strategies as st
-from fastapi.testclient import TestClient
+from hypothesis import given, strategies as st
 from pydantic import ValidationError
 
 from src.api.routes import CrawlRequest, WebhookPayload
@@ -38,6 +37,13 @@ non_string_types = st.one_of(
     st.none(),
 )
 
+# Non-blank text strategies, built once and shared by the tests below.
+# str.strip as the predicate keeps values with surrounding whitespace (the
+# models must preserve them) while skipping a Python lambda call per draw.
+non_blank_ids = st.text(min_size=1, max_size=50).filter(str.strip)
+non_blank_queries = st.text(min_size=1, max_size=100).filter(str.strip)
+non_blank_titles = st.text(min_size=1, max_size=200).filter(str.strip)
+
 
 # ==================== Property Tests ====================
 
@@ -55,7 +61,6 @@ class TestProperty13InvalidAPIInputErrorResponse:
     """
 
     @given(query=empty_strings)
-    @settings(max_examples=100)
     def test_crawl_empty_query_returns_422(self, query: str) -> None:
         """
         Property: Empty query strings should return 422.
@@ -71,11 +76,10 @@ class TestProperty13InvalidAPIInputErrorResponse:
         errors = exc_info.value.errors()
         assert len(errors) > 0
         # Check that 'query' field is mentioned in errors
-        field_names = [e.get("loc", [])[-1] if e.get("loc") else None for e in errors]
-        assert "query" in field_names or any("query" in str(e) for e in errors)
+        field_names = {e["loc"][-1] for e in errors if e.get("loc")}
+        assert "query" in field_names
 
     @given(limit=invalid_limits)
-    @settings(max_examples=100)
     def test_crawl_invalid_limit_returns_422(self, limit: int) -> None:
         """
         Property: Invalid limit values (< 1 or > 50) should return 422.
@@ -91,11 +95,10 @@ class TestProperty13InvalidAPIInputErrorResponse:
         errors = exc_info.value.errors()
         assert len(errors) > 0
         # Check that 'limit' field is mentioned in errors
-        field_names = [e.get("loc", [])[-1] if e.get("loc") else None for e in errors]
-        assert "limit" in field_names or any("limit" in str(e) for e in errors)
+        field_names = {e["loc"][-1] for e in errors if e.get("loc")}
+        assert "limit" in field_names
 
     @given(query_value=non_string_types)
-    @settings(max_examples=100)
     def test_crawl_wrong_type_query_returns_422(self, query_value) -> None:
         """
         Property: Non-string query values should return 422.
@@ -112,10 +115,9 @@ class TestProperty13InvalidAPIInputErrorResponse:
             CrawlRequest(query=query_value)
 
     @given(
-        valid_query=st.text(min_size=1, max_size=100).filter(lambda x: x.strip()),
+        valid_query=non_blank_queries,
         valid_limit=st.integers(min_value=1, max_value=50),
     )
-    @settings(max_examples=100)
     def test_valid_crawl_request_succeeds(self, valid_query: str, valid_limit: int) -> None:
         """
         Property: Valid inputs should create valid CrawlRequest.
@@ -134,8 +136,7 @@ class TestProperty13InvalidAPIInputErrorResponse:
 class TestErrorResponseFormat:
     """Tests for error response format consistency."""
 
-    @given(error_message=st.text(min_size=1, max_size=200).filter(lambda x: x.strip()))
-    @settings(max_examples=100)
+    @given(error_message=non_blank_titles)
     def test_validation_error_contains_detail(self, error_message: str) -> None:
         """
         Property: ValidationError responses should contain 'detail' field.
@@ -165,11 +166,10 @@ class TestWebhookPayloadValidation:
     """
 
     @given(
-        script_id=st.text(min_size=1, max_size=50).filter(lambda x: x.strip()),
-        case_id=st.text(min_size=1, max_size=50).filter(lambda x: x.strip()),
-        episode_title=st.text(min_size=1, max_size=200).filter(lambda x: x.strip()),
+        script_id=non_blank_ids,
+        case_id=non_blank_ids,
+        episode_title=non_blank_titles,
     )
-    @settings(max_examples=100)
     def test_valid_webhook_payload_succeeds(
         self, script_id: str, case_id: str, episode_title: str
     ) -> None:
@@ -190,7 +190,6 @@ class TestWebhookPayloadValidation:
         assert payload.event_type == "script.created"  # Default value
 
     @given(field_to_empty=st.sampled_from(["script_id", "case_id", "episode_title"]))
-    @settings(max_examples=100)
     def test_empty_required_fields_rejected(self, field_to_empty: str) -> None:
         """
         Property: Empty required fields should raise ValidationError.
@@ -212,13 +211,12 @@ class TestWebhookPayloadValidation:
         errors = exc_info.value.errors()
         assert len(errors) > 0
         # Check that the empty field is mentioned in errors
-        field_names = [e.get("loc", [])[-1] if e.get("loc") else None for e in errors]
-        assert field_to_empty in field_names or any(field_to_empty in str(e) for e in errors)
+        field_names = {e["loc"][-1] for e in errors if e.get("loc")}
+        assert field_to_empty in field_names
 
     @given(
-        event_type=st.text(min_size=1, max_size=50).filter(lambda x: x.strip()),
+        event_type=non_blank_ids,
     )
-    @settings(max_examples=100)
     def test_custom_event_type_accepted(self, event_type: str) -> None:
         """
         Property: Custom event types should be accepted in payload.
@@ -5,10 +5,16 @@ Properties 6, 7, 8: Audio Service Correctness
 Validates: Requirements 3.1, 3.2, 3.4
 """
 
-from hypothesis import given, settings, strategies as st
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+from hypothesis import given, strategies as st
 
 from src.models.script import DialogueLine, PodcastScript
 from src.services.audio import AudioService
+from src.utils.errors import AudioServiceError
 
 
 # Strategies for generating valid DialogueLines
@@ -60,7 +66,6 @@ class TestProperty6SequentialDialogueLineProcessing:
     We test this by tracking processing order through a mock/simulation.
     """
 
-    @settings(max_examples=100)
     @given(chapters=st.lists(dialogue_line_strategy(), min_size=1, max_size=20))
     def test_all_dialogue_lines_would_be_processed(
         self, chapters: list[DialogueLine]
@@ -95,7 +100,6 @@ class TestProperty6SequentialDialogueLineProcessing:
             "Processing order should be sequential"
         )
 
-    @settings(max_examples=100)
     @given(script=podcast_script_strategy(min_chapters=1, max_chapters=15))
     def test_script_chapters_accessible_in_order(
         self, script: PodcastScript
@@ -127,7 +131,6 @@ class TestProperty7DirectorialPassFormat:
     **Validates: Requirements 3.2**
     """
 
-    @settings(max_examples=100)
     @given(line=dialogue_line_strategy())
     def test_directorial_pass_produces_valid_format(
         self, line: DialogueLine
@@ -163,7 +166,6 @@ class TestProperty7DirectorialPassFormat:
                 f"Original text should be in formatted output"
             )
 
-    @settings(max_examples=100)
     @given(
         speaker=valid_speakers,
         text=non_empty_text,
@@ -193,7 +195,6 @@ class TestProperty7DirectorialPassFormat:
             f"Expected '{expected}', got '{formatted_text}'"
         )
 
-    @settings(max_examples=100)
     @given(speaker=valid_speakers, text=non_empty_text)
     def test_neutral_tag_returns_plain_text(
         self, speaker: str, text: str
@@ -229,7 +230,6 @@ class TestProperty8AudioSegmentConcatenation:
     **Validates: Requirements 3.4**
     """
 
-    @settings(max_examples=100)
     @given(segments=st.lists(audio_segment_strategy, min_size=0, max_size=20))
     def test_concatenation_length_equals_sum(
         self, segments: list[bytes]
@@ -252,7 +252,6 @@ class TestProperty8AudioSegmentConcatenation:
             f"Expected length {expected_length}, got {len(result)}"
         )
 
-    @settings(max_examples=100)
     @given(segments=st.lists(audio_segment_strategy, min_size=1, max_size=10))
     def test_concatenation_preserves_content(
         self, segments: list[bytes]
@@ -276,7 +275,6 @@ class TestProperty8AudioSegmentConcatenation:
             )
             offset += len(segment)
 
-    @settings(max_examples=100)
     @given(segment=audio_segment_strategy)
     def test_single_segment_unchanged(
         self, segment: bytes
@@ -307,3 +305,152 @@ class TestProperty8AudioSegmentConcatenation:
         assert result == b"", (
             "Empty segment list should return empty bytes"
         )
+
+
+class TestConcurrentSynthesis:
+    """Lines synthesize side by side, within the configured limit."""
+
+    @given(
+        chapters=st.lists(dialogue_line_strategy(), min_size=1, max_size=20),
+        limit=st.integers(min_value=1, max_value=8),
+    )
+    @pytest.mark.asyncio
+    async def test_synthesis_bounded_and_ordered(
+        self, chapters: list[DialogueLine], limit: int
+    ) -> None:
+        """No more than ``limit`` lines overlap, and segments follow line order."""
+        audio_service = AudioService(
+            elevenlabs_api_key="test-key",
+            thorne_voice_id="test-thorne",
+            maya_voice_id="test-maya",
+            max_concurrent_syntheses=limit,
+        )
+        in_flight = 0
+        peak = 0
+
+        async def mock_synthesize(line: DialogueLine) -> bytes:
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            # Finish out of order to prove results are not completion-ordered
+            for _ in range(1 + len(line.text) % 3):
+                await asyncio.sleep(0)
+            in_flight -= 1
+            return line.text.encode()
+
+        with patch.object(audio_service, "synthesize_dialogue", side_effect=mock_synthesize):
+            segments = await audio_service.synthesize_lines(chapters)
+
+        assert peak == min(limit, len(chapters))
+        assert segments == [line.text.encode() for line in chapters]
+
+    @pytest.mark.asyncio
+    async def test_failure_names_the_line(self) -> None:
+        """A failing line SHALL surface as AudioServiceError with its position."""
+        audio_service = AudioService(elevenlabs_api_key="test-key")
+        lines = [
+            DialogueLine(speaker="maya_vance", text="fine"),
+            DialogueLine(speaker="maya_vance", text="broken"),
+        ]
+
+        async def mock_synthesize(line: DialogueLine) -> bytes:
+            if line.text == "broken":
+                raise RuntimeError("boom")
+            return b"ok"
+
+        with patch.object(audio_service, "synthesize_dialogue", side_effect=mock_synthesize):
+            with pytest.raises(AudioServiceError, match="line 2"):
+                await audio_service.synthesize_lines(lines)
+
+    @pytest.mark.asyncio
+    async def test_failure_cancels_lines_in_flight(self) -> None:
+        """Once a line fails, the other in-flight syntheses are cancelled."""
+        audio_service = AudioService(elevenlabs_api_key="test-key", max_concurrent_syntheses=3)
+        lines = [
+            DialogueLine(speaker="maya_vance", text="slow"),
+            DialogueLine(speaker="maya_vance", text="broken"),
+            DialogueLine(speaker="maya_vance", text="slow"),
+        ]
+        cancelled = 0
+
+        async def mock_synthesize(line: DialogueLine) -> bytes:
+            nonlocal cancelled
+            if line.text == "broken":
+                raise RuntimeError("boom")
+            try:
+                await asyncio.Event().wait()
+            except asyncio.CancelledError:
+                cancelled += 1
+                raise
+            return b"ok"
+
+        with patch.object(audio_service, "synthesize_dialogue", side_effect=mock_synthesize):
+            with pytest.raises(AudioServiceError, match="line 2"):
+                await audio_service.synthesize_lines(lines)
+
+        assert cancelled == 2
+
+    @pytest.mark.asyncio
+    async def test_default_is_one_line_at_a_time(self) -> None:
+        """Without an opt-in, lines are synthesized sequentially."""
+        audio_service = AudioService(elevenlabs_api_key="test-key")
+        in_flight = 0
+        peak = 0
+
+        async def mock_synthesize(line: DialogueLine) -> bytes:
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0)
+            in_flight -= 1
+            return b"ok"
+
+        lines = [DialogueLine(speaker="maya_vance", text=str(i)) for i in range(4)]
+        with patch.object(audio_service, "synthesize_dialogue", side_effect=mock_synthesize):
+            await audio_service.synthesize_lines(lines)
+
+        assert peak == 1
+
+
+class TestStreamingSynthesis:
+    """Audio chunks are passed through as ElevenLabs streams them."""
+
+    @given(chunks=st.lists(st.binary(min_size=1, max_size=64), max_size=10))
+    @pytest.mark.asyncio
+    async def test_stream_yields_chunks_in_order(self, chunks: list[bytes]) -> None:
+        """Streamed chunks SHALL arrive unchanged; the buffered call joins them."""
+        audio_service = AudioService(
+            elevenlabs_api_key="test-key",
+            thorne_voice_id="test-thorne",
+            maya_voice_id="test-maya",
+        )
+        requests: list = []
+
+        async def stream(voice_id: str, **kwargs: object):
+            requests.append(voice_id)
+            for chunk in chunks:
+                yield chunk
+
+        audio_service._client = SimpleNamespace(text_to_speech=SimpleNamespace(stream=stream))
+        line = DialogueLine(speaker="maya_vance", text="Test dialogue")
+
+        streamed = [chunk async for chunk in audio_service.synthesize_dialogue_stream(line)]
+
+        assert streamed == chunks
+        assert await audio_service.synthesize_dialogue(line) == b"".join(chunks)
+        assert requests == ["test-maya", "test-maya"]
+
+
+class TestSharedElevenLabsClient:
+    """Audio services with the same key SHALL share one pooled client."""
+
+    async def test_services_reuse_client_per_key(self) -> None:
+        """Two services for one key get the same client; other keys do not."""
+        first = AudioService(elevenlabs_api_key="shared-key")
+        second = AudioService(elevenlabs_api_key="shared-key")
+        other = AudioService(elevenlabs_api_key="other-key")
+
+        client = await first._get_client()
+
+        assert await second._get_client() is client
+        assert await other._get_client() is not client
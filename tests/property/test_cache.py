@@ -0,0 +1,69 @@
+"""Property-based tests for the disk cache decorator.
+
+Feature: cold-case-crawler
+Cached results SHALL round-trip unchanged and skip the wrapped call on a hit.
+"""
+
+from pathlib import Path
+
+from hypothesis import HealthCheck, given, settings
+from hypothesis import strategies as st
+
+from src.models.script import DialogueLine, PodcastScript
+from src.utils.cache import cache_key, disk_cache
+
+
+class TestDiskCache:
+    """Disk-cached async calls."""
+
+    @settings(
+        deadline=None,
+        suppress_health_check=[HealthCheck.function_scoped_fixture],
+    )
+    @given(text=st.text(max_size=50), payload=st.binary(max_size=200))
+    async def test_hit_skips_call_and_returns_stored_bytes(
+        self, tmp_path: Path, text: str, payload: bytes
+    ) -> None:
+        """A second call with the same key SHALL return the stored bytes."""
+        calls = 0
+
+        @disk_cache(tmp_path / "audio", key_fn=lambda t: ("audio", t))
+        async def synthesize(t: str) -> bytes:
+            nonlocal calls
+            calls += 1
+            return payload
+
+        first = await synthesize(text)
+        second = await synthesize(text)
+
+        assert first == second == (tmp_path / "audio" / cache_key(("audio", text))).read_bytes()
+        assert calls <= 1
+
+    async def test_models_round_trip_and_keys_differ(self, tmp_path: Path) -> None:
+        """Pydantic results SHALL round-trip; distinct keys SHALL not collide."""
+        calls: list = []
+
+        @disk_cache(
+            tmp_path,
+            key_fn=lambda case_id, n: (case_id, n),
+            encode=lambda script: script.model_dump_json().encode(),
+            decode=PodcastScript.model_validate_json,
+        )
+        async def generate(case_id: str, n: int) -> PodcastScript:
+            calls.append((case_id, n))
+            return PodcastScript(
+                script_id=f"script-{case_id}-{n}",
+                case_id=case_id,
+                episode_title="Episode",
+                chapters=[DialogueLine(speaker="maya_vance", text="Hello", emotion_tag="neutral")],
+                social_hooks=[],
+            )
+
+        fresh = await generate("case-1", 3)
+        cached = await generate("case-1", 3)
+        other = await generate("case-1", 4)
+
+        assert cached == fresh
+        assert other.script_id == "script-case-1-4"
+        assert calls == [("case-1", 3), ("case-1", 4)]
+        assert not list(tmp_path.glob("*.tmp"))
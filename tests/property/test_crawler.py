@@ -5,8 +5,12 @@ Properties 1, 2, 3: Crawler Service Transformations
 Validates: Requirements 1.2, 1.3, 1.4
 """
 
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+import httpx
 import pytest
-from hypothesis import given, settings, strategies as st
+from hypothesis import given, strategies as st
 
 from src.models.case import CaseFile, Evidence
 from src.services.crawler import CrawlerService
@@ -68,7 +72,6 @@ class TestProperty1FirecrawlToCaseFileTransformation:
     **Validates: Requirements 1.2**
     """
 
-    @settings(max_examples=100)
     @given(response=firecrawl_response_strategy())
     def test_valid_response_produces_valid_casefile(self, response: dict) -> None:
         """Valid Firecrawl response produces valid CaseFile."""
@@ -92,7 +95,6 @@ class TestProperty1FirecrawlToCaseFileTransformation:
         if response.get("url"):
             assert response["url"] in case_file.source_urls
 
-    @settings(max_examples=100)
     @given(
         url=st.text(min_size=10, max_size=100).map(lambda x: f"https://example.com/{x}"),
         title=st.text(min_size=5, max_size=100).filter(lambda x: x.strip()),
@@ -115,7 +117,6 @@ class TestProperty1FirecrawlToCaseFileTransformation:
         assert case_file is not None
         assert case_file.title == title.strip()
 
-    @settings(max_examples=100)
     @given(
         url=st.text(min_size=10, max_size=100).map(lambda x: f"https://example.com/{x}"),
         heading=st.text(min_size=5, max_size=100).filter(lambda x: x.strip() and '\n' not in x),
@@ -139,7 +140,6 @@ class TestProperty1FirecrawlToCaseFileTransformation:
         assert case_file is not None
         assert case_file.title == heading.strip()
 
-    @settings(max_examples=100)
     @given(response=firecrawl_response_strategy())
     def test_case_id_generated_consistently(self, response: dict) -> None:
         """Same response produces same case_id (deterministic)."""
@@ -162,7 +162,6 @@ class TestProperty2EvidenceListDistinctness:
     **Validates: Requirements 1.3**
     """
 
-    @settings(max_examples=100)
     @given(markdown=markdown_with_evidence_strategy())
     def test_evidence_ids_are_unique(self, markdown: str) -> None:
         """All evidence items have unique evidence_id values."""
@@ -178,7 +177,6 @@ class TestProperty2EvidenceListDistinctness:
             f"Duplicate evidence IDs found: {evidence_ids}"
         )
 
-    @settings(max_examples=100)
     @given(
         evidence_text=st.text(min_size=15, max_size=100).filter(lambda x: x.strip()),
     )
@@ -191,7 +189,6 @@ class TestProperty2EvidenceListDistinctness:
         
         assert id1 == id2
 
-    @settings(max_examples=100)
     @given(
         text1=st.text(min_size=15, max_size=100).filter(lambda x: x.strip()),
         text2=st.text(min_size=15, max_size=100).filter(lambda x: x.strip()),
@@ -211,7 +208,6 @@ class TestProperty2EvidenceListDistinctness:
         
         assert id1 != id2, f"Different texts produced same ID: {text1!r} vs {text2!r}"
 
-    @settings(max_examples=100)
     @given(response=firecrawl_response_strategy())
     def test_casefile_evidence_list_has_unique_ids(self, response: dict) -> None:
         """CaseFile evidence_list has unique evidence_id values."""
@@ -234,7 +230,6 @@ class TestProperty3ErrorResilienceInBatchProcessing:
     **Validates: Requirements 1.4**
     """
 
-    @settings(max_examples=100)
     @given(
         valid_responses=st.lists(
             firecrawl_response_strategy(),
@@ -275,7 +270,6 @@ class TestProperty3ErrorResilienceInBatchProcessing:
         # Should have processed all valid responses
         assert len(case_files) >= len(valid_responses) - num_invalid
 
-    @settings(max_examples=100)
     @given(
         valid_count=st.integers(min_value=1, max_value=5),
         invalid_count=st.integers(min_value=0, max_value=3),
@@ -321,7 +315,6 @@ class TestProperty3ErrorResilienceInBatchProcessing:
         # All valid responses should be processed
         assert len(successful_cases) == valid_count
 
-    @settings(max_examples=100)
     @given(response=firecrawl_response_strategy())
     def test_parse_does_not_raise_on_valid_input(self, response: dict) -> None:
         """Parsing valid input does not raise exceptions."""
@@ -334,7 +327,6 @@ class TestProperty3ErrorResilienceInBatchProcessing:
         except Exception as e:
             pytest.fail(f"Parsing raised unexpected exception: {e}")
 
-    @settings(max_examples=100)
     @given(
         invalid_input=st.sampled_from([
             None,
@@ -355,3 +347,58 @@ class TestProperty3ErrorResilienceInBatchProcessing:
             assert result is None
         except Exception as e:
             pytest.fail(f"Parsing raised exception on invalid input: {e}")
+
+
+class TestCasePageKeywordGate:
+    """Off-topic pages are skipped before the parse pipeline runs."""
+
+    @given(
+        prefix=st.text(max_size=200),
+        keyword=st.sampled_from(
+            ["Cold Case", "HOMICIDE", "murder", "Missing", "unsolved", "Victim"]
+        ),
+        suffix=st.text(max_size=200),
+    )
+    def test_pages_with_case_keyword_pass(self, prefix: str, keyword: str, suffix: str) -> None:
+        """Any page mentioning a case keyword passes, regardless of case."""
+        assert CrawlerService._looks_like_case_page(f"{prefix} {keyword} {suffix}")
+
+    @pytest.mark.parametrize(
+        "markdown", [None, "", "# Contact Us\n\nPhone: 555-0100", "404 Not Found"]
+    )
+    def test_pages_without_case_keyword_are_rejected(self, markdown) -> None:
+        """Navigation, listing and error pages are rejected."""
+        assert not CrawlerService._looks_like_case_page(markdown)
+
+
+class TestCrawlerClose:
+    """The crawler pools the SDK's HTTP traffic and closes it on request."""
+
+    async def test_sdk_gets_pooled_client(self, monkeypatch) -> None:
+        """The SDK's client SHALL be replaced by a pooled one with its settings."""
+        stock = httpx.AsyncClient(
+            base_url="https://api.firecrawl.dev", headers={"Authorization": "Bearer k"}
+        )
+        sdk_http = SimpleNamespace(_client=stock)
+        monkeypatch.setattr(CrawlerService, "_sdk_http_client", lambda self: sdk_http)
+
+        crawler = CrawlerService(firecrawl_api_key="test-key")
+
+        assert sdk_http._client is crawler._http
+        assert crawler._http.base_url == stock.base_url
+        assert crawler._http.headers["Authorization"] == "Bearer k"
+
+        await crawler.aclose()
+        await stock.aclose()
+        assert crawler._http.is_closed
+
+    async def test_aclose_falls_back_to_sdk_close(self, monkeypatch) -> None:
+        """Without a pooled client, aclose() SHALL call the SDK's own close()."""
+        sdk_http = SimpleNamespace(close=AsyncMock())
+        monkeypatch.setattr(CrawlerService, "_sdk_http_client", lambda self: sdk_http)
+
+        crawler = CrawlerService(firecrawl_api_key="test-key")
+        await crawler.aclose()
+
+        assert crawler._http is None
+        sdk_http.close.assert_awaited_once()
@@ -5,16 +5,21 @@ Properties 11, 12: Database Integrity and Query Filtering
 Validates: Requirements 5.3, 5.4, 5.5
 """
 
+import re
 from datetime import datetime
 from typing import Any, Dict, List, Optional
-from unittest.mock import MagicMock
-from uuid import uuid4
+from unittest.mock import AsyncMock, MagicMock, patch
+from uuid import UUID, uuid4
 
+import httpx
 import pytest
-from hypothesis import given, settings, strategies as st
+from hypothesis import given, strategies as st
+from postgrest.exceptions import APIError
 
 from src.models.case import CaseFile, Evidence
+from src.models.job import JobStatus
 from src.models.script import DialogueLine, PodcastScript
+from src.services import database as database_module
 from src.services.database import DatabaseService
 
 
@@ -24,8 +29,53 @@ from src.services.database import DatabaseService
 class MockSupabaseResponse:
     """Mock response from Supabase operations."""
 
-    def __init__(self, data: Optional[List[Dict[str, Any]]] = None) -> None:
+    def __init__(self, data: Any = None, count: Optional[int] = None) -> None:
         self.data = data or []
+        self.count = count
+
+
+def _split_top_level(expr: str) -> List[str]:
+    """Split a PostgREST logic tree on commas outside parentheses and quotes."""
+    parts, depth, quoted, start = [], 0, False, 0
+    for i, ch in enumerate(expr):
+        if ch == '"':
+            quoted = not quoted
+        elif not quoted and ch == "(":
+            depth += 1
+        elif not quoted and ch == ")":
+            depth -= 1
+        elif not quoted and depth == 0 and ch == ",":
+            parts.append(expr[start:i])
+            start = i + 1
+    parts.append(expr[start:])
+    return parts
+
+
+def _parse_logic_tree(expr: str) -> List[Any]:
+    """Parse 'field.op.value' terms and nested and(...) groups."""
+    conditions: List[Any] = []
+    for term in _split_top_level(expr):
+        if term.startswith("and(") and term.endswith(")"):
+            conditions.append(("and", _parse_logic_tree(term[4:-1])))
+        else:
+            field, op, value = term.split(".", 2)
+            conditions.append((op, field, value.strip('"')))
+    return conditions
+
+
+def _matches_condition(record: Dict[str, Any], condition: Any) -> bool:
+    """Evaluate one parsed logic-tree condition against a record."""
+    if condition[0] == "and":
+        return all(_matches_condition(record, c) for c in condition[1])
+    op, field, value = condition
+    actual = record.get(field)
+    if op == "eq":
+        return actual == value
+    if op == "lt":
+        return actual is not None and actual < value
+    if op == "gt":
+        return actual is not None and actual > value
+    raise ValueError(f"Unsupported operator: {op}")
 
 
 class MockSupabaseTable:
@@ -37,25 +87,41 @@ class MockSupabaseTable:
         self._filters: List[tuple[str, str, Any]] = []
         self._select_columns: str = "*"
         self._limit_value: Optional[int] = None
+        self._order: List[tuple[str, bool]] = []
+        self._maybe_single = False
+        self._count: Optional[str] = None
+        self._head = False
+        self._client: Optional["MockSupabaseClient"] = None
 
     def _reset_query(self) -> None:
         """Reset query state."""
         self._filters = []
         self._select_columns = "*"
         self._limit_value = None
-
-    def select(self, columns: str = "*") -> "MockSupabaseTable":
-        """Mock select operation."""
+        self._order = []
+        self._maybe_single = False
+        self._count = None
+        self._head = False
+
+    def select(
+        self, columns: str = "*", count: Optional[str] = None, head: bool = False
+    ) -> "MockSupabaseTable":
+        """Mock select operation, including HEAD requests with a row count."""
         self._select_columns = columns
+        self._count = count
+        self._head = head
         return self
 
-    def insert(self, data: Dict[str, Any]) -> "MockSupabaseTable":
-        """Mock insert operation."""
+    def insert(
+        self, data: Dict[str, Any] | List[Dict[str, Any]]
+    ) -> "MockSupabaseTable":
+        """Mock insert operation (single row or bulk)."""
         # Determine primary key based on table
         pk_field = self._get_pk_field()
-        pk_value = data.get(pk_field)
-        if pk_value:
-            self._data[pk_value] = data.copy()
+        for row in data if isinstance(data, list) else [data]:
+            pk_value = row.get(pk_field)
+            if pk_value:
+                self._data[pk_value] = row.copy()
         return self
 
     def update(self, data: Dict[str, Any]) -> "MockSupabaseTable":
@@ -73,12 +139,32 @@ class MockSupabaseTable:
         self._filters.append(("eq", field, value))
         return self
 
+    def in_(self, field: str, values: List[Any]) -> "MockSupabaseTable":
+        """Mock in_ filter."""
+        self._filters.append(("in", field, values))
+        return self
+
+    def or_(self, filters: str) -> "MockSupabaseTable":
+        """Mock or_ filter, e.g. 'a.lt."x",and(a.eq."x",b.lt."y")'."""
+        self._filters.append(("or", "", _parse_logic_tree(filters)))
+        return self
+
+    def order(self, field: str, desc: bool = False) -> "MockSupabaseTable":
+        """Mock order operation."""
+        self._order.append((field, desc))
+        return self
+
     def limit(self, count: int) -> "MockSupabaseTable":
         """Mock limit operation."""
         self._limit_value = count
         return self
 
-    def execute(self) -> MockSupabaseResponse:
+    def maybe_single(self) -> "MockSupabaseTable":
+        """Mock maybe_single: one row object, or no response when nothing matches."""
+        self._maybe_single = True
+        return self
+
+    def execute(self) -> Optional[MockSupabaseResponse]:
         """Execute the mock query."""
         # Handle delete
         if hasattr(self, "_is_delete") and self._is_delete:
@@ -111,10 +197,41 @@ class MockSupabaseTable:
             if self._matches_filters(record):
                 results.append(record)
 
+        for field, desc in reversed(self._order):
+            results.sort(key=lambda r: r.get(field), reverse=desc)
+
+        # Like Content-Range, the count covers every match regardless of limit
+        if self._count is not None:
+            total, head = len(results), self._head
+            self._reset_query()
+            return MockSupabaseResponse(None if head else results, count=total)
+
         if self._limit_value:
             results = results[: self._limit_value]
 
+        # Embedded resources, e.g. select("*, evidence(*)")
+        embeds = re.findall(r"(\w+)\(", self._select_columns)
+        if embeds and self._client is not None:
+            pk_field = self._get_pk_field()
+            results = [
+                {
+                    **record,
+                    **{
+                        name: [
+                            child.copy()
+                            for child in self._client.get_all_records(name)
+                            if child.get(pk_field) == record.get(pk_field)
+                        ]
+                        for name in embeds
+                    },
+                }
+                for record in results
+            ]
+
+        maybe_single = self._maybe_single
         self._reset_query()
+        if maybe_single:
+            return MockSupabaseResponse(results[0]) if results else None
         return MockSupabaseResponse(results)
 
     def _matches_filters(self, record: Dict[str, Any]) -> bool:
@@ -123,6 +240,12 @@ class MockSupabaseTable:
             if op == "eq":
                 if record.get(field) != value:
                     return False
+            elif op == "in":
+                if record.get(field) not in value:
+                    return False
+            elif op == "or":
+                if not any(_matches_condition(record, c) for c in value):
+                    return False
         return True
 
     def _get_pk_field(self) -> str:
@@ -149,8 +272,13 @@ class MockSupabaseClient:
             self._tables[name] = MockSupabaseTable()
         table = self._tables[name]
         table._table_name = name
+        table._client = self
         return table
 
+    def rpc(self, fn: str, params: Dict[str, Any]) -> "MockRpcCall":
+        """Mock a call to one of the setup_database.sql functions."""
+        return MockRpcCall(self, fn, params)
+
     def get_all_records(self, table_name: str) -> List[Dict[str, Any]]:
         """Get all records from a table (for testing)."""
         if table_name in self._tables:
@@ -158,6 +286,59 @@ class MockSupabaseClient:
         return []
 
 
+class MockRpcCall:
+    """Mock Postgres function call, replaying the function body on the tables."""
+
+    def __init__(self, client: MockSupabaseClient, fn: str, params: Dict[str, Any]) -> None:
+        self._client = client
+        self._fn = fn
+        self._params = params
+
+    def execute(self) -> MockSupabaseResponse:
+        """Execute the mock function."""
+        client, params = self._client, self._params
+        if self._fn == "create_case_with_evidence":
+            client.table("cases").insert(params["case_data"]).execute()
+            client.table("evidence").insert(params["evidence_rows"]).execute()
+            return MockSupabaseResponse(params["case_data"]["case_id"])
+        if self._fn == "delete_case_with_evidence":
+            case_id = params["target_case_id"]
+            client.table("evidence").delete().eq("case_id", case_id).execute()
+            deleted = client.table("cases").delete().eq("case_id", case_id).execute()
+            return MockSupabaseResponse(bool(deleted.data))
+        if self._fn == "delete_script_with_media":
+            script_id = params["target_script_id"]
+            client.table("media").delete().eq("script_id", script_id).execute()
+            deleted = client.table("scripts").delete().eq("script_id", script_id).execute()
+            return MockSupabaseResponse(bool(deleted.data))
+        raise ValueError(f"Unknown function: {self._fn}")
+
+
+class MockAsyncpgPool:
+    """Mock asyncpg pool serving rows typed the way asyncpg returns them."""
+
+    def __init__(self, cases: Dict[str, Dict[str, Any]]) -> None:
+        self._cases = cases
+
+    def acquire(self) -> "MockAsyncpgPool":
+        return self
+
+    async def __aenter__(self) -> "MockAsyncpgPool":
+        return self
+
+    async def __aexit__(self, *exc: Any) -> None:
+        return None
+
+    async def fetchrow(self, query: str, key: str) -> Optional[Dict[str, Any]]:
+        return self._cases.get(key)
+
+    async def fetchval(self, query: str, key: str) -> bool:
+        return key in self._cases
+
+    async def fetch(self, query: str, key: str) -> List[Dict[str, Any]]:
+        return list(self._cases.get(key, {}).get("evidence", []))
+
+
 # ==================== Hypothesis Strategies ====================
 
 # Strategy for valid non-empty text
@@ -241,7 +422,6 @@ class TestProperty11DatabaseIntegrity:
     **Validates: Requirements 5.3, 5.4**
     """
 
-    @settings(max_examples=100)
     @given(cases=st.lists(case_file_strategy(), min_size=1, max_size=10))
     @pytest.mark.asyncio
     async def test_case_ids_are_unique(self, cases: List[CaseFile]) -> None:
@@ -262,7 +442,6 @@ class TestProperty11DatabaseIntegrity:
         # Each ID should appear exactly once
         assert len(stored_case_ids) == len(set(stored_case_ids))
 
-    @settings(max_examples=100)
     @given(
         case=case_file_strategy(),
         num_scripts=st.integers(min_value=1, max_value=5),
@@ -296,7 +475,6 @@ class TestProperty11DatabaseIntegrity:
 
         assert len(stored_ids) == len(set(stored_ids))
 
-    @settings(max_examples=100)
     @given(case=case_file_strategy())
     @pytest.mark.asyncio
     async def test_script_references_existing_case(self, case: CaseFile) -> None:
@@ -320,7 +498,6 @@ class TestProperty11DatabaseIntegrity:
         case_exists = await db_service.case_exists(script.case_id)
         assert case_exists is True
 
-    @settings(max_examples=100)
     @given(case=case_file_strategy())
     @pytest.mark.asyncio
     async def test_retrieved_case_matches_stored(self, case: CaseFile) -> None:
@@ -340,6 +517,164 @@ class TestProperty11DatabaseIntegrity:
         assert retrieved.location == case.location
         assert retrieved.raw_content == case.raw_content
 
+    @given(
+        case=case_file_strategy(),
+        descriptions=st.lists(non_empty_text, min_size=1, max_size=5),
+    )
+    @pytest.mark.asyncio
+    async def test_retrieved_case_includes_evidence(
+        self, case: CaseFile, descriptions: List[str]
+    ) -> None:
+        """Evidence stored with a case comes back with it on every read path."""
+        mock_client = MockSupabaseClient()
+        db_service = DatabaseService(mock_client)
+
+        case.evidence_list = [
+            Evidence(evidence_id=f"ev-{uuid4()}", description=d, evidence_type="physical")
+            for d in descriptions
+        ]
+        await db_service.create_case(case)
+
+        expected = sorted(e.evidence_id for e in case.evidence_list)
+        retrieved = await db_service.get_case(case.case_id)
+        by_location = await db_service.get_cases_by_location(case.location)
+        listed, _ = await db_service.list_cases()
+
+        for result in (retrieved, by_location[0], listed[0]):
+            assert result is not None
+            assert sorted(e.evidence_id for e in result.evidence_list) == expected
+
+
+    @given(case=case_file_strategy())
+    @pytest.mark.asyncio
+    async def test_delete_case_removes_its_evidence(self, case: CaseFile) -> None:
+        """Deleting a case removes its evidence rows with it."""
+        mock_client = MockSupabaseClient()
+        db_service = DatabaseService(mock_client)
+
+        case.evidence_list = [
+            Evidence(evidence_id=f"ev-{uuid4()}", description="Knife", evidence_type="physical")
+        ]
+        await db_service.create_case(case)
+
+        assert await db_service.delete_case(case.case_id) is True
+        assert mock_client.get_all_records("cases") == []
+        assert mock_client.get_all_records("evidence") == []
+        assert await db_service.delete_case(case.case_id) is False
+
+
+    @given(case=case_file_strategy(), new_title=non_empty_text)
+    @pytest.mark.asyncio
+    async def test_cached_case_invalidated_on_update(
+        self, case: CaseFile, new_title: str
+    ) -> None:
+        """Reads are served from cache until the case is written again."""
+        mock_client = MockSupabaseClient()
+        db_service = DatabaseService(mock_client)
+        await db_service.create_case(case)
+        await db_service.get_case(case.case_id)
+
+        # Out-of-band edits are not seen while the entry is cached
+        mock_client.get_all_records("cases")[0]["title"] = "Stale"
+        cached = await db_service.get_case(case.case_id)
+        assert cached is not None and cached.title == case.title
+
+        case.title = new_title
+        await db_service.update_case(case)
+        retrieved = await db_service.get_case(case.case_id)
+        assert retrieved is not None and retrieved.title == new_title
+
+    @given(case=case_file_strategy(), description=non_empty_text)
+    @pytest.mark.asyncio
+    async def test_evidence_write_keeps_cached_case_row(
+        self, case: CaseFile, description: str
+    ) -> None:
+        """Adding evidence refreshes only the evidence, not the cached case columns."""
+        mock_client = MockSupabaseClient()
+        db_service = DatabaseService(mock_client)
+        await db_service.create_case(case)
+        await db_service.get_case(case.case_id)
+
+        mock_client.get_all_records("cases")[0]["title"] = "Stale"
+        evidence = Evidence(
+            evidence_id=str(uuid4()), description=description, evidence_type="physical"
+        )
+        await db_service._create_evidence(case.case_id, evidence)
+
+        retrieved = await db_service.get_case(case.case_id)
+        assert retrieved is not None
+        assert retrieved.title == case.title
+        assert [e.evidence_id for e in retrieved.evidence_list] == [
+            e.evidence_id for e in case.evidence_list
+        ] + [evidence.evidence_id]
+
+    def test_case_cache_entries_expire(self) -> None:
+        """The LFU case cache still drops entries once their TTL has passed."""
+        now = [0.0]
+        cache = database_module._ExpiringLFUCache(2, ttl=10.0, timer=lambda: now[0])
+        cache["a"] = "row"
+        assert cache.get("a") == "row"
+
+        now[0] = 10.0
+        assert cache.get("a") is None
+        assert "a" not in cache
+
+
+    @given(script=podcast_script_strategy())
+    @pytest.mark.asyncio
+    async def test_retrieved_script_chapters_match_stored(
+        self, script: PodcastScript
+    ) -> None:
+        """Dialogue lines survive the round trip through the chapters column."""
+        mock_client = MockSupabaseClient()
+        db_service = DatabaseService(mock_client)
+
+        await db_service.create_script(script)
+        retrieved = await db_service.get_script(script.script_id)
+
+        assert retrieved is not None
+        assert retrieved.chapters == script.chapters
+
+
+    @given(
+        num_cases=st.integers(min_value=0, max_value=12),
+        page_size=st.integers(min_value=1, max_value=5),
+    )
+    @pytest.mark.asyncio
+    async def test_list_cases_pages_cover_every_case_once(
+        self, num_cases: int, page_size: int
+    ) -> None:
+        """Following cursors visits every case exactly once, newest first."""
+        mock_client = MockSupabaseClient()
+        db_service = DatabaseService(mock_client)
+
+        base = datetime(2024, 1, 1)
+        for i in range(num_cases):
+            await db_service.create_case(
+                CaseFile(
+                    case_id=f"case-{uuid4()}",
+                    title=f"Case {i}",
+                    location="Ohio",
+                    raw_content="Content",
+                    # Pairs of cases share a timestamp so ties are exercised
+                    created_at=base.replace(hour=i // 2),
+                )
+            )
+
+        seen: List[CaseFile] = []
+        cursor = None
+        while True:
+            page, cursor = await db_service.list_cases(limit=page_size, after=cursor)
+            assert len(page) <= page_size
+            seen.extend(page)
+            if cursor is None:
+                break
+
+        keys = [(c.created_at, c.case_id) for c in seen]
+        assert len(keys) == num_cases
+        assert len(set(keys)) == num_cases
+        assert keys == sorted(keys, reverse=True)
+
 
 class TestProperty12QueryFilteringCorrectness:
     """Property 12: Query Filtering Correctness.
@@ -351,7 +686,6 @@ class TestProperty12QueryFilteringCorrectness:
     **Validates: Requirements 5.5**
     """
 
-    @settings(max_examples=100)
     @given(
         cases=st.lists(case_file_strategy(), min_size=2, max_size=10),
     )
@@ -375,7 +709,6 @@ class TestProperty12QueryFilteringCorrectness:
         assert retrieved is not None
         assert retrieved.case_id == target_case.case_id
 
-    @settings(max_examples=100)
     @given(
         location=valid_locations,
         num_matching=st.integers(min_value=1, max_value=5),
@@ -426,7 +759,6 @@ class TestProperty12QueryFilteringCorrectness:
         # Verify we got the expected number of matching cases
         assert len(results) == num_matching
 
-    @settings(max_examples=100)
     @given(case=case_file_strategy())
     @pytest.mark.asyncio
     async def test_filter_by_script_case_id_returns_only_matching(
@@ -478,7 +810,6 @@ class TestProperty12QueryFilteringCorrectness:
         # Verify we got the expected number
         assert len(results) == len(scripts_for_case)
 
-    @settings(max_examples=100)
     @given(case=case_file_strategy())
     @pytest.mark.asyncio
     async def test_nonexistent_case_id_returns_none(self, case: CaseFile) -> None:
@@ -495,7 +826,6 @@ class TestProperty12QueryFilteringCorrectness:
 
         assert result is None
 
-    @settings(max_examples=100)
     @given(location=valid_locations)
     @pytest.mark.asyncio
     async def test_nonexistent_location_returns_empty(self, location: str) -> None:
@@ -521,3 +851,217 @@ class TestProperty12QueryFilteringCorrectness:
         results = await db_service.get_cases_by_location(location)
 
         assert results == []
+
+
+class TestPostgresReadPath:
+    """Reads through a direct asyncpg pool hydrate the same models as PostgREST."""
+
+    @given(case_uuid=st.uuids(), title=non_empty_text, location=valid_locations)
+    @pytest.mark.asyncio
+    async def test_pool_rows_hydrate_case(
+        self, case_uuid: UUID, title: str, location: str
+    ) -> None:
+        """UUID and timestamp columns from asyncpg are normalised before hydration."""
+        dsn = "postgresql://test"
+        record = {
+            "case_id": case_uuid,
+            "title": title,
+            "location": location,
+            "date_occurred": None,
+            "raw_content": "Content",
+            "source_urls": [],
+            "created_at": datetime(2024, 1, 1, 12, 0, 0),
+            "evidence": [
+                {
+                    "evidence_id": str(uuid4()),
+                    "case_id": str(case_uuid),
+                    "description": "Knife",
+                    "evidence_type": "physical",
+                    "source_url": None,
+                }
+            ],
+        }
+        pool = MockAsyncpgPool({str(case_uuid): record})
+        database_module._pools[dsn] = pool
+        try:
+            db_service = DatabaseService(MockSupabaseClient(), db_url=dsn)
+
+            case = await db_service.get_case(str(case_uuid))
+            assert case is not None
+            assert case.case_id == str(case_uuid)
+            assert case.title == title
+            assert case.created_at == datetime(2024, 1, 1, 12, 0, 0)
+            assert [e.description for e in case.evidence_list] == ["Knife"]
+
+            assert await db_service.case_exists(str(case_uuid)) is True
+            assert await db_service.get_case(str(uuid4())) is None
+        finally:
+            database_module._pools.pop(dsn, None)
+
+
+class TestBulkJobStatusUpdate:
+    """Bulk status updates touch exactly the requested jobs."""
+
+    @given(
+        num_jobs=st.integers(min_value=1, max_value=8),
+        data=st.data(),
+    )
+    @pytest.mark.asyncio
+    async def test_only_listed_jobs_are_updated(self, num_jobs: int, data: st.DataObject) -> None:
+        """Listed jobs get the new status; all others keep theirs."""
+        mock_client = MockSupabaseClient()
+        db_service = DatabaseService(mock_client)
+
+        job_ids = [f"job-{uuid4()}" for _ in range(num_jobs)]
+        for job_id in job_ids:
+            await db_service.create_job(JobStatus(job_id=job_id, job_type="crawl"))
+            await db_service.get_job(job_id)
+
+        selected = data.draw(st.lists(st.sampled_from(job_ids), unique=True))
+        updated = await db_service.bulk_update_job_status(selected, "failed")
+
+        assert updated == len(selected)
+        for job_id in job_ids:
+            job = await db_service.get_job(job_id)
+            assert job is not None
+            assert job.status == ("failed" if job_id in selected else "pending")
+
+
+class FlakyQuery:
+    """Query that raises the given errors before returning a response."""
+
+    def __init__(self, errors: List[Exception]) -> None:
+        self._errors = list(errors)
+        self.calls = 0
+
+    def execute(self) -> MockSupabaseResponse:
+        self.calls += 1
+        if self._errors:
+            raise self._errors.pop(0)
+        return MockSupabaseResponse([{"ok": True}])
+
+
+class TestTransientRetry:
+    """Only failures that never reached Postgres are retried."""
+
+    @pytest.mark.asyncio
+    async def test_connection_errors_are_retried(self) -> None:
+        """A dropped connection is retried until the query succeeds."""
+        query = FlakyQuery([httpx.ConnectError("reset"), httpx.ConnectError("reset")])
+        with patch("src.utils.retry.asyncio.sleep", new=AsyncMock()):
+            result = await database_module._execute(query)
+
+        assert result.data == [{"ok": True}]
+        assert query.calls == 3
+
+    @pytest.mark.asyncio
+    async def test_api_errors_fail_fast(self) -> None:
+        """Errors Postgres reported, like constraint violations, are not retried."""
+        error = APIError({"message": "duplicate key", "code": "23505"})
+        query = FlakyQuery([error])
+        with patch("src.utils.retry.asyncio.sleep", new=AsyncMock()):
+            with pytest.raises(APIError):
+                await database_module._execute(query)
+
+        assert query.calls == 1
+
+
+class TestJobRowAccess:
+    """The raw-row read agrees with the hydrated model."""
+
+    @given(status=st.sampled_from(["pending", "processing", "completed", "failed"]))
+    @pytest.mark.asyncio
+    async def test_job_row_matches_job(self, status: str) -> None:
+        """get_job_row returns the stored columns get_job hydrates."""
+        mock_client = MockSupabaseClient()
+        db_service = DatabaseService(mock_client)
+        job = JobStatus(job_id=f"job-{uuid4()}", job_type="debate", status=status)
+        await db_service.create_job(job)
+
+        row = await db_service.get_job_row(job.job_id)
+        hydrated = await db_service.get_job(job.job_id)
+
+        assert row is not None and hydrated is not None
+        assert row["status"] == hydrated.status == status
+        assert row["job_id"] == hydrated.job_id
+        assert await db_service.get_job_row(f"job-{uuid4()}") is None
+
+
+class TestExistenceChecks:
+    """Existence checks answer from a HEAD count without fetching rows."""
+
+    @given(case_file=case_file_strategy())
+    @pytest.mark.asyncio
+    async def test_case_exists_uses_count(self, case_file: CaseFile) -> None:
+        """A fresh service sees stored cases and rejects unknown IDs."""
+        mock_client = MockSupabaseClient()
+        await DatabaseService(mock_client).create_case(case_file)
+
+        # New service so the answer cannot come from the read cache
+        db_service = DatabaseService(mock_client)
+        assert await db_service.case_exists(case_file.case_id) is True
+        assert await db_service.case_exists(f"case-{uuid4()}") is False
+        assert await db_service.script_exists(f"script-{uuid4()}") is False
+
+
+class TestBulkGetters:
+    """Batch lookups return the same models as per-ID gets, in request order."""
+
+    @given(
+        cases=st.lists(
+            case_file_strategy(), min_size=1, max_size=5, unique_by=lambda c: c.case_id
+        )
+    )
+    @pytest.mark.asyncio
+    async def test_get_cases_matches_get_case(self, cases: List[CaseFile]) -> None:
+        """get_cases agrees with get_case and skips unknown IDs."""
+        mock_client = MockSupabaseClient()
+        writer = DatabaseService(mock_client)
+        for case in cases:
+            await writer.create_case(case)
+
+        db_service = DatabaseService(mock_client)
+        # Warm the cache for one case so both the hit and miss paths run
+        await db_service.get_case(cases[0].case_id)
+
+        ids = [c.case_id for c in reversed(cases)] + [f"case-{uuid4()}"]
+        batch = await db_service.get_cases(ids)
+
+        assert [c.case_id for c in batch] == ids[:-1]
+        for case in batch:
+            single = await db_service.get_case(case.case_id)
+            assert single is not None
+            assert case.model_dump() == single.model_dump()
+
+    @pytest.mark.asyncio
+    async def test_get_jobs_in_request_order(self) -> None:
+        """get_jobs collapses duplicates and preserves the requested order."""
+        db_service = DatabaseService(MockSupabaseClient())
+        jobs = [JobStatus(job_id=f"job-{i}", job_type="crawl") for i in range(3)]
+        for job in jobs:
+            await db_service.create_job(job)
+
+        found = await db_service.get_jobs(["job-2", "job-0", "job-2", "job-9"])
+
+        assert [j.job_id for j in found] == ["job-2", "job-0"]
+        assert await db_service.get_scripts([]) == []
+
+
+class TestJobStatusFreshness:
+    """Jobs still in progress are always read fresh; finished jobs are cached."""
+
+    @pytest.mark.asyncio
+    async def test_other_worker_updates_visible_until_finished(self) -> None:
+        """A poller SHALL see another worker's status change without waiting for the TTL."""
+        mock_client = MockSupabaseClient()
+        poller = DatabaseService(mock_client)
+        worker = DatabaseService(mock_client)
+        job_id = f"job-{uuid4()}"
+        await worker.create_job(JobStatus(job_id=job_id, job_type="crawl"))
+
+        assert (await poller.get_job(job_id)).status == "pending"
+        await worker.update_job_status(job_id, "processing")
+        assert (await poller.get_job(job_id)).status == "processing"
+        await worker.update_job_status(job_id, "completed")
+        assert (await poller.get_job(job_id)).status == "completed"
+        assert job_id in poller._job_cache
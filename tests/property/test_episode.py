@@ -0,0 +1,102 @@
+"""Property-based tests for episode production.
+
+Feature: cold-case-crawler
+Debate generation and image scraping run concurrently per case
+"""
+
+import asyncio
+from typing import Any, List
+
+import pytest
+from hypothesis import given
+from hypothesis import strategies as st
+
+from src.models.case import CaseFile
+from src.models.script import DialogueLine, PodcastScript
+from src.services.episode import produce_episode
+from src.services.image_scraper import CaseImage
+from src.utils.errors import DebateEngineError
+
+
+class StubDebateEngine:
+    """Debate engine that waits for the scraper to start before finishing."""
+
+    def __init__(self, scraping_started: asyncio.Event, fail: bool = False) -> None:
+        self.scraping_started = scraping_started
+        self.fail = fail
+
+    async def generate_debate(self, case: CaseFile, num_exchanges: int = 10) -> PodcastScript:
+        # Deadlocks (and times out) unless scraping runs alongside the debate
+        await asyncio.wait_for(self.scraping_started.wait(), timeout=1)
+        if self.fail:
+            raise DebateEngineError("agent unavailable")
+        return PodcastScript(
+            script_id="script-test",
+            case_id=case.case_id,
+            episode_title=case.title,
+            chapters=[DialogueLine(speaker="maya_vance", text="Welcome")] * num_exchanges,
+        )
+
+
+class StubImageScraper:
+    """Scraper that signals when it starts."""
+
+    def __init__(self, scraping_started: asyncio.Event) -> None:
+        self.scraping_started = scraping_started
+
+    async def scrape_and_download(self, urls: List[str], limit_per_url: int = 5) -> List[Any]:
+        self.scraping_started.set()
+        await asyncio.sleep(0)
+        return [
+            CaseImage(
+                image_id=f"img{i}",
+                url=url,
+                source_url=url,
+                source_name="example.com",
+                attribution="Image source: example.com",
+            )
+            for i, url in enumerate(urls)
+        ]
+
+
+CASE = CaseFile(
+    case_id="case-001",
+    title="Test Case",
+    location="Test Location",
+    raw_content="Test content for the case.",
+)
+
+
+class TestProduceEpisode:
+    """Debate and images are produced concurrently from the same case."""
+
+    @given(
+        urls=st.lists(st.integers(0, 99).map(lambda i: f"https://example.com/{i}"), max_size=5),
+        num_exchanges=st.integers(min_value=1, max_value=12),
+    )
+    @pytest.mark.asyncio
+    async def test_script_and_images_returned(self, urls: List[str], num_exchanges: int) -> None:
+        """Both results come back, with images for every URL."""
+        started = asyncio.Event()
+        script, images = await produce_episode(
+            CASE,
+            urls,
+            debate_engine=StubDebateEngine(started),
+            image_scraper=StubImageScraper(started),
+            num_exchanges=num_exchanges,
+        )
+
+        assert len(script.chapters) == num_exchanges
+        assert [image.url for image in images] == urls
+
+    @pytest.mark.asyncio
+    async def test_debate_failure_propagates(self) -> None:
+        """A failed debate raises its own error rather than an exception group."""
+        started = asyncio.Event()
+        with pytest.raises(DebateEngineError):
+            await produce_episode(
+                CASE,
+                ["https://example.com/a"],
+                debate_engine=StubDebateEngine(started, fail=True),
+                image_scraper=StubImageScraper(started),
+            )
@@ -0,0 +1,159 @@
+"""Property-based tests for image scraping.
+
+Feature: cold-case-crawler
+Image extraction and attribution for case sources
+"""
+
+import asyncio
+from html import escape
+
+import httpx
+import pytest
+from hypothesis import given
+from hypothesis import strategies as st
+
+from src.services.image_scraper import CaseImage, ImageScraperService
+
+PAGE_URL = "https://news.example.com/cases/story"
+
+# Path segments that pass _is_valid_case_image's skip list and extension check
+image_paths = st.lists(
+    st.sampled_from(["media", "2024", "victim", "scene", "evidence", "case-file", "photos"]),
+    min_size=1,
+    max_size=4,
+).map(lambda parts: "/" + "/".join(parts) + ".jpg")
+
+alt_texts = st.text(
+    alphabet=st.characters(blacklist_categories=("Cc", "Cs")), max_size=40
+).map(lambda t: " ".join(t.split()))
+
+
+def build_page(images: list[tuple[str, str]], caption: str, og_path: str) -> str:
+    """Render a page with plain images, one captioned figure and an og:image."""
+    tags = [f'<img src="{escape(src)}" alt="{escape(alt)}">' for src, alt in images]
+    return (
+        f'<html><head><meta property="og:image" content="https://cdn.example.com{og_path}">'
+        f"</head><body>{''.join(tags)}"
+        f'<figure><img src="/figure/photo-main.jpg"><figcaption>{escape(caption)}</figcaption>'
+        "</figure></body></html>"
+    )
+
+
+def scraper_for(html: str, tmp_path: str) -> ImageScraperService:
+    """Build a scraper whose HTTP client serves ``html`` for every request."""
+    scraper = ImageScraperService(output_dir=tmp_path)
+
+    def handler(_: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, text=html)
+
+    scraper._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    return scraper
+
+
+class TestImageExtraction:
+    """Parsed images keep document order, alt text and captions."""
+
+    @given(
+        images=st.lists(st.tuples(image_paths, alt_texts), max_size=6, unique_by=lambda i: i[0]),
+        caption=alt_texts,
+        og_path=image_paths,
+    )
+    @pytest.mark.asyncio
+    async def test_images_follow_document_order(
+        self, tmp_path_factory: pytest.TempPathFactory, images, caption: str, og_path: str
+    ) -> None:
+        """Every valid image appears once, in page order, with its own text."""
+        html = build_page(images, caption, og_path)
+        async with scraper_for(html, str(tmp_path_factory.mktemp("img"))) as scraper:
+            scraped = await scraper.scrape_images_from_url(PAGE_URL, limit=20)
+
+        expected_urls = [f"https://news.example.com{src}" for src, _ in images]
+        expected_urls.append("https://news.example.com/figure/photo-main.jpg")
+        og_url = f"https://cdn.example.com{og_path}"
+        expected_urls.append(og_url)
+
+        assert [image.url for image in scraped] == expected_urls
+        assert [image.alt_text for image in scraped[: len(images)]] == [a for _, a in images]
+        assert scraped[len(images)].caption == caption
+        assert all(image.source_name == "news.example.com" for image in scraped)
+
+    @given(limit=st.integers(min_value=1, max_value=5))
+    @pytest.mark.asyncio
+    async def test_limit_is_respected(
+        self, tmp_path_factory: pytest.TempPathFactory, limit: int
+    ) -> None:
+        """No more than ``limit`` images are returned for a page."""
+        images = [(f"/media/victim-{i}.jpg", "") for i in range(8)]
+        html = build_page(images, "", "/og.jpg")
+        async with scraper_for(html, str(tmp_path_factory.mktemp("img"))) as scraper:
+            scraped = await scraper.scrape_images_from_url(PAGE_URL, limit=limit)
+
+        assert len(scraped) == limit
+
+
+class TestImageDownload:
+    """Streamed downloads write exactly the bytes served."""
+
+    @given(
+        body=st.binary(min_size=1, max_size=200_000),
+        content_type=st.sampled_from(["image/jpeg", "image/png", "image/webp"]),
+    )
+    @pytest.mark.asyncio
+    async def test_download_round_trip(
+        self, tmp_path_factory: pytest.TempPathFactory, body: bytes, content_type: str
+    ) -> None:
+        """The saved file matches the response body and content type."""
+        output_dir = tmp_path_factory.mktemp("img")
+        scraper = ImageScraperService(output_dir=str(output_dir))
+        scraper._client = httpx.AsyncClient(
+            transport=httpx.MockTransport(
+                lambda _: httpx.Response(200, headers={"content-type": content_type}, content=body)
+            )
+        )
+        image = CaseImage(
+            image_id="abc123def456",
+            url="https://cdn.example.com/media/victim.jpg",
+            source_url=PAGE_URL,
+            source_name="news.example.com",
+            attribution="Image source: news.example.com",
+        )
+
+        async with scraper:
+            local_path = await scraper.download_image(image)
+
+        ext = {"image/jpeg": ".jpg", "image/png": ".png", "image/webp": ".webp"}[content_type]
+        assert local_path == f"images/abc123def456{ext}"
+        assert (output_dir / f"abc123def456{ext}").read_bytes() == body
+
+    @given(copies=st.integers(min_value=1, max_value=6))
+    @pytest.mark.asyncio
+    async def test_duplicate_urls_download_once(
+        self, tmp_path_factory: pytest.TempPathFactory, copies: int
+    ) -> None:
+        """Concurrent and repeated requests for one URL share a single fetch."""
+        requests: list[httpx.Request] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            return httpx.Response(200, headers={"content-type": "image/png"}, content=b"png")
+
+        scraper = ImageScraperService(output_dir=str(tmp_path_factory.mktemp("img")))
+        scraper._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        images = [
+            CaseImage(
+                image_id="abc123def456",
+                url="https://cdn.example.com/media/victim.jpg",
+                source_url=f"https://news{i}.example.com/story",
+                source_name=f"news{i}.example.com",
+                attribution=f"Image source: news{i}.example.com",
+            )
+            for i in range(copies + 1)
+        ]
+
+        async with scraper:
+            paths = await asyncio.gather(*(scraper.download_image(i) for i in images[:-1]))
+            paths.append(await scraper.download_image(images[-1]))
+
+        assert len(requests) == 1
+        assert paths == ["images/abc123def456.png"] * (copies + 1)
+        assert all(image.local_path == paths[0] for image in images)
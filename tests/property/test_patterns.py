@@ -0,0 +1,29 @@
+"""Property-based tests for keyword pattern construction.
+
+Feature: cold-case-crawler
+Prefix-factored keyword regexes used by the hook and image filters
+"""
+
+import re
+
+from hypothesis import given
+from hypothesis import strategies as st
+
+from src.utils.patterns import literal_union
+
+# A small alphabet with regex metacharacters, so words share prefixes often
+words = st.text(alphabet="ab.*(", min_size=1, max_size=4)
+texts = st.text(alphabet="ab.*(x", max_size=12)
+
+
+class TestLiteralUnion:
+    """The factored pattern matches exactly what the plain alternation matches."""
+
+    @given(keywords=st.lists(words, min_size=1, max_size=8), samples=st.lists(texts, max_size=20))
+    def test_matches_plain_alternation(self, keywords: list[str], samples: list[str]) -> None:
+        """search() finds a keyword in the same texts either way."""
+        plain = re.compile("|".join(re.escape(word) for word in keywords))
+        factored = re.compile(literal_union(keywords))
+
+        for text in samples + keywords:
+            assert bool(factored.search(text)) == bool(plain.search(text))
@@ -6,12 +6,14 @@ Validates: Requirements 3.6
 """
 
 import asyncio
+import logging
 from typing import Optional, Tuple
 from unittest.mock import patch
 
 import pytest
 from hypothesis import given, settings, strategies as st
 
+from src.utils.errors import CreatomateAPIError, RETRIABLE_STATUS_CODES
 from src.utils.retry import with_retry
 
 
@@ -25,7 +27,7 @@ class TestProperty9ExponentialBackoffRetry:
     **Validates: Requirements 3.6**
     """
 
-    @settings(max_examples=100, deadline=None)
+    @settings(deadline=None)
     @given(
         max_attempts=st.integers(min_value=1, max_value=5),
         num_failures=st.integers(min_value=0, max_value=10),
@@ -40,7 +42,7 @@ class TestProperty9ExponentialBackoffRetry:
         async def mock_sleep(delay: float) -> None:
             recorded_delays.append(delay)
 
-        @with_retry(max_attempts=max_attempts, base_delay=0.001)
+        @with_retry(max_attempts=max_attempts, base_delay=0.001, exceptions=(ValueError,))
         async def failing_func() -> str:
             nonlocal call_count
             call_count += 1
@@ -58,10 +60,10 @@ class TestProperty9ExponentialBackoffRetry:
                 except ValueError:
                     pass  # Expected if num_failures >= max_attempts
 
-        asyncio.get_event_loop().run_until_complete(run_test())
+        asyncio.run(run_test())
         assert call_count <= max_attempts
 
-    @settings(max_examples=100, deadline=None)
+    @settings(deadline=None)
     @given(
         max_attempts=st.integers(min_value=2, max_value=5),
         base_delay=st.floats(min_value=0.001, max_value=0.05),
@@ -75,7 +77,12 @@ class TestProperty9ExponentialBackoffRetry:
         async def mock_sleep(delay: float) -> None:
             recorded_delays.append(delay)
 
-        @with_retry(max_attempts=max_attempts, base_delay=base_delay)
+        @with_retry(
+            max_attempts=max_attempts,
+            base_delay=base_delay,
+            exceptions=(ValueError,),
+            jitter=False,
+        )
         async def always_fails() -> str:
             raise ValueError("Always fails")
 
@@ -88,7 +95,7 @@ class TestProperty9ExponentialBackoffRetry:
                 except ValueError:
                     pass
 
-        asyncio.get_event_loop().run_until_complete(run_test())
+        asyncio.run(run_test())
 
         # Should have max_attempts - 1 delays (no delay after last attempt)
         expected_delay_count = max_attempts - 1
@@ -101,7 +108,7 @@ class TestProperty9ExponentialBackoffRetry:
                 f"Delay {i} was {delay}, expected {expected_delay}"
             )
 
-    @settings(max_examples=100, deadline=None)
+    @settings(deadline=None)
     @given(
         max_attempts=st.integers(min_value=1, max_value=5),
         success_on_attempt=st.integers(min_value=1, max_value=5),
@@ -115,7 +122,7 @@ class TestProperty9ExponentialBackoffRetry:
         async def mock_sleep(delay: float) -> None:
             pass
 
-        @with_retry(max_attempts=max_attempts, base_delay=0.001)
+        @with_retry(max_attempts=max_attempts, base_delay=0.001, exceptions=(ValueError,))
         async def eventually_succeeds() -> str:
             nonlocal call_count
             call_count += 1
@@ -133,7 +140,7 @@ class TestProperty9ExponentialBackoffRetry:
                 except ValueError:
                     return None, False
 
-        result, succeeded = asyncio.get_event_loop().run_until_complete(run_test())
+        result, succeeded = asyncio.run(run_test())
 
         if success_on_attempt <= max_attempts:
             assert succeeded
@@ -143,7 +150,7 @@ class TestProperty9ExponentialBackoffRetry:
             assert not succeeded
             assert call_count == max_attempts
 
-    @settings(max_examples=100, deadline=None)
+    @settings(deadline=None)
     @given(max_attempts=st.integers(min_value=1, max_value=5))
     def test_raises_last_exception_on_exhaustion(self, max_attempts: int) -> None:
         """When all attempts fail, the last exception is raised."""
@@ -152,7 +159,7 @@ class TestProperty9ExponentialBackoffRetry:
         async def mock_sleep(delay: float) -> None:
             pass
 
-        @with_retry(max_attempts=max_attempts, base_delay=0.001)
+        @with_retry(max_attempts=max_attempts, base_delay=0.001, exceptions=(ValueError,))
         async def always_fails() -> str:
             nonlocal call_count
             call_count += 1
@@ -168,11 +175,11 @@ class TestProperty9ExponentialBackoffRetry:
                 except ValueError as e:
                     return str(e)
 
-        error_msg = asyncio.get_event_loop().run_until_complete(run_test())
+        error_msg = asyncio.run(run_test())
         assert error_msg == f"Failure {max_attempts}"
         assert call_count == max_attempts
 
-    @settings(max_examples=100, deadline=None)
+    @settings(deadline=None)
     @given(max_attempts=st.integers(min_value=1, max_value=5))
     def test_only_catches_specified_exceptions(self, max_attempts: int) -> None:
         """Retry only catches specified exception types."""
@@ -201,6 +208,179 @@ class TestProperty9ExponentialBackoffRetry:
                 except TypeError:
                     return True
 
-        raised_immediately = asyncio.get_event_loop().run_until_complete(run_test())
+        raised_immediately = asyncio.run(run_test())
         assert raised_immediately
         assert call_count == 1  # No retries for uncaught exception type
+
+    @settings(deadline=None)
+    @given(
+        max_attempts=st.integers(min_value=2, max_value=5),
+        base_delay=st.floats(min_value=0.001, max_value=0.05),
+    )
+    def test_jittered_delays_within_backoff(
+        self, max_attempts: int, base_delay: float
+    ) -> None:
+        """Jittered delays SHALL stay between zero and the exponential delay."""
+        recorded_delays: list = []
+
+        async def mock_sleep(delay: float) -> None:
+            recorded_delays.append(delay)
+
+        @with_retry(max_attempts=max_attempts, base_delay=base_delay, exceptions=(ValueError,))
+        async def always_fails() -> str:
+            raise ValueError("Always fails")
+
+        async def run_test() -> None:
+            with patch("src.utils.retry.asyncio.sleep", mock_sleep):
+                try:
+                    await always_fails()
+                except ValueError:
+                    pass
+
+        asyncio.run(run_test())
+
+        assert len(recorded_delays) == max_attempts - 1
+        for i, delay in enumerate(recorded_delays):
+            assert 0 <= delay <= base_delay * (2**i)
+
+    @settings(deadline=None)
+    @given(
+        max_attempts=st.integers(min_value=2, max_value=8),
+        base_delay=st.floats(min_value=0.001, max_value=1.0),
+        max_delay=st.floats(min_value=0.001, max_value=2.0),
+        jitter=st.booleans(),
+    )
+    def test_delays_capped_at_max_delay(
+        self, max_attempts: int, base_delay: float, max_delay: float, jitter: bool
+    ) -> None:
+        """No delay SHALL exceed max_delay; unjittered delays are min(exponential, cap)."""
+        recorded_delays: list = []
+
+        async def mock_sleep(delay: float) -> None:
+            recorded_delays.append(delay)
+
+        @with_retry(
+            max_attempts=max_attempts,
+            base_delay=base_delay,
+            exceptions=(ValueError,),
+            max_delay=max_delay,
+            jitter=jitter,
+        )
+        async def always_fails() -> str:
+            raise ValueError("Always fails")
+
+        async def run_test() -> None:
+            with patch("src.utils.retry.asyncio.sleep", mock_sleep):
+                try:
+                    await always_fails()
+                except ValueError:
+                    pass
+
+        asyncio.run(run_test())
+
+        assert len(recorded_delays) == max_attempts - 1
+        for i, delay in enumerate(recorded_delays):
+            cap = min(base_delay * (2**i), max_delay)
+            if jitter:
+                assert 0 <= delay <= cap
+            else:
+                assert delay == cap
+
+    @settings(deadline=None)
+    @given(
+        max_attempts=st.integers(min_value=2, max_value=5),
+        status_code=st.integers(min_value=400, max_value=599),
+    )
+    def test_retries_only_retriable_status_codes(
+        self, max_attempts: int, status_code: int
+    ) -> None:
+        """API errors SHALL be retried only for transient HTTP statuses."""
+        call_count = 0
+
+        async def mock_sleep(delay: float) -> None:
+            pass
+
+        @with_retry(max_attempts=max_attempts, base_delay=0.001, exceptions=(CreatomateAPIError,))
+        async def api_call() -> str:
+            nonlocal call_count
+            call_count += 1
+            raise CreatomateAPIError(status_code, "upstream")
+
+        async def run_test() -> None:
+            with patch("src.utils.retry.asyncio.sleep", mock_sleep):
+                with pytest.raises(CreatomateAPIError):
+                    await api_call()
+
+        asyncio.run(run_test())
+
+        expected_calls = max_attempts if status_code in RETRIABLE_STATUS_CODES else 1
+        assert call_count == expected_calls
+
+    @settings(deadline=None)
+    @given(max_attempts=st.integers(min_value=2, max_value=5))
+    def test_default_skips_programming_errors(self, max_attempts: int) -> None:
+        """By default only transient failures SHALL be retried."""
+        calls: list = []
+
+        async def mock_sleep(delay: float) -> None:
+            pass
+
+        @with_retry(max_attempts=max_attempts, base_delay=0.001)
+        async def raises(error: Exception) -> str:
+            calls.append(error)
+            raise error
+
+        async def run_test() -> None:
+            with patch("src.utils.retry.asyncio.sleep", mock_sleep):
+                with pytest.raises(KeyError):
+                    await raises(KeyError("bug"))
+                with pytest.raises(ConnectionError):
+                    await raises(ConnectionError("reset"))
+
+        asyncio.run(run_test())
+
+        assert len(calls) == 1 + max_attempts
+
+    @settings(deadline=None)
+    @given(
+        status_code=st.integers(min_value=400, max_value=599),
+        message=st.text(max_size=50),
+    )
+    def test_api_error_message_rendered_on_demand(self, status_code: int, message: str) -> None:
+        """API errors SHALL keep their fields and render the usual message."""
+        error = CreatomateAPIError(status_code, message)
+
+        assert (error.status_code, error.message) == (status_code, message)
+        assert str(error) == f"Creatomate error {status_code}: {message}"
+
+    def test_retry_logging_is_lazy(self) -> None:
+        """Retried errors SHALL not be rendered when their log records are filtered out."""
+        rendered = 0
+
+        class CountingError(CreatomateAPIError):
+            def __str__(self) -> str:
+                nonlocal rendered
+                rendered += 1
+                return super().__str__()
+
+        async def mock_sleep(delay: float) -> None:
+            pass
+
+        @with_retry(max_attempts=3, base_delay=0.001, exceptions=(CreatomateAPIError,))
+        async def api_call() -> str:
+            raise CountingError(503, "upstream")
+
+        async def run_test() -> None:
+            with patch("src.utils.retry.asyncio.sleep", mock_sleep):
+                with pytest.raises(CountingError):
+                    await api_call()
+
+        retry_logger = logging.getLogger("src.utils.retry")
+        previous = retry_logger.disabled
+        retry_logger.disabled = True
+        try:
+            asyncio.run(run_test())
+        finally:
+            retry_logger.disabled = previous
+
+        assert rendered == 0
@@ -0,0 +1,222 @@
+"""Property-based tests for the episode scheduler.
+
+Feature: cold-case-crawler
+Schedule persistence and episode status tracking
+"""
+
+import json
+from datetime import datetime, timedelta
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+from hypothesis import given, settings
+from hypothesis import strategies as st
+
+from src.services.scheduler import EpisodeScheduler, ScheduleFrequency
+
+frequencies = st.sampled_from(list(ScheduleFrequency))
+queries = st.text(min_size=1, max_size=40).filter(lambda q: q.strip())
+
+
+class TestSchedulePersistence:
+    """A reloaded scheduler sees exactly the state that was saved."""
+
+    @settings(deadline=None)
+    @given(
+        frequency=frequencies,
+        count=st.integers(min_value=0, max_value=6),
+        extra_sources=st.lists(queries, max_size=3),
+    )
+    def test_round_trip(
+        self,
+        tmp_path_factory: pytest.TempPathFactory,
+        frequency: ScheduleFrequency,
+        count: int,
+        extra_sources: list[str],
+    ) -> None:
+        """Episodes, config and rotation index survive a reload."""
+        data_file = str(tmp_path_factory.mktemp("schedule") / "schedule_data.json")
+        scheduler = EpisodeScheduler(data_file)
+        scheduler.set_frequency(frequency)
+        for query in extra_sources:
+            scheduler.add_case_source(query)
+        scheduler.schedule_multiple(count)
+        if count:
+            scheduler.mark_completed(scheduler.scheduled_episodes[0].episode_id, cost=1.25)
+
+        reloaded = EpisodeScheduler(data_file)
+
+        assert reloaded.scheduled_episodes == scheduler.scheduled_episodes
+        assert reloaded.config == scheduler.config
+        assert reloaded.case_source_index == scheduler.case_source_index
+
+    def test_failed_write_keeps_previous_file(self, tmp_path: Path) -> None:
+        """An error while encoding leaves the saved schedule intact."""
+        data_file = tmp_path / "schedule_data.json"
+        scheduler = EpisodeScheduler(str(data_file))
+        scheduler.schedule_multiple(2)
+        saved = data_file.read_bytes()
+
+        with patch("src.services.scheduler.orjson.dumps", side_effect=TypeError("boom")):
+            with pytest.raises(TypeError):
+                scheduler.schedule_next_episode()
+
+        assert data_file.read_bytes() == saved
+        assert list(tmp_path.iterdir()) == [data_file]
+
+    def test_missing_file_starts_empty(self, tmp_path: Path) -> None:
+        """A scheduler without a data file has no episodes and default config."""
+        scheduler = EpisodeScheduler(str(tmp_path / "absent.json"))
+
+        assert scheduler.scheduled_episodes == []
+        assert scheduler.case_source_index == 0
+
+
+class TestBatchedSaves:
+    """Grouped changes reach disk in one write."""
+
+    @settings(deadline=None)
+    @given(count=st.integers(min_value=1, max_value=8))
+    def test_schedule_multiple_writes_once(
+        self, tmp_path_factory: pytest.TempPathFactory, count: int
+    ) -> None:
+        """Scheduling several episodes rewrites the file a single time."""
+        data_file = str(tmp_path_factory.mktemp("schedule") / "schedule_data.json")
+        scheduler = EpisodeScheduler(data_file)
+
+        with patch.object(
+            EpisodeScheduler, "_write_data", autospec=True, side_effect=EpisodeScheduler._write_data
+        ) as write:
+            scheduler.schedule_multiple(count)
+
+        assert write.call_count == 1
+        assert len(EpisodeScheduler(data_file).scheduled_episodes) == count
+
+
+class TestEpisodeStatus:
+    """Status changes land on the episode with the given id."""
+
+    @settings(deadline=None)
+    @given(
+        count=st.integers(min_value=1, max_value=6),
+        data=st.data(),
+    )
+    def test_mark_updates_matching_episode(
+        self, tmp_path_factory: pytest.TempPathFactory, count: int, data: st.DataObject
+    ) -> None:
+        """Each mark_* call changes only its episode, and survives a reload."""
+        data_file = str(tmp_path_factory.mktemp("schedule") / "schedule_data.json")
+        scheduler = EpisodeScheduler(data_file)
+        episodes = scheduler.schedule_multiple(count)
+        target = data.draw(st.sampled_from(episodes))
+        action = data.draw(st.sampled_from(["completed", "failed", "skipped"]))
+
+        if action == "completed":
+            scheduler.mark_completed(target.episode_id, cost=2.5)
+        elif action == "failed":
+            scheduler.mark_failed(target.episode_id, "boom")
+        else:
+            scheduler.mark_skipped(target.episode_id, "budget")
+        scheduler.mark_failed("ep-unknown", "ignored")
+
+        reloaded = {e.episode_id: e.status for e in EpisodeScheduler(data_file).scheduled_episodes}
+        assert reloaded[target.episode_id] == action
+        assert all(
+            status == "pending" for episode_id, status in reloaded.items()
+            if episode_id != target.episode_id
+        )
+
+
+class TestPendingEpisodes:
+    """get_pending_episodes returns due, still-pending episodes in schedule order."""
+
+    @settings(deadline=None)
+    @given(
+        episodes=st.lists(
+            st.tuples(
+                st.integers(min_value=-30, max_value=30),
+                st.sampled_from(["pending", "completed", "failed", "skipped"]),
+            ),
+            max_size=12,
+        ),
+        marked=st.lists(st.integers(min_value=0, max_value=11), max_size=4),
+    )
+    def test_matches_linear_filter(
+        self,
+        tmp_path_factory: pytest.TempPathFactory,
+        episodes: list[tuple[int, str]],
+        marked: list[int],
+    ) -> None:
+        """The heap-backed lookup agrees with a scan of every episode, call after call."""
+        data_file = tmp_path_factory.mktemp("schedule") / "schedule_data.json"
+        base = datetime.now().replace(microsecond=0)
+        data_file.write_text(json.dumps({
+            "episodes": [
+                {
+                    "episode_id": f"ep-{i}",
+                    "case_query": "cold case",
+                    "scheduled_date": (base + timedelta(days=offset)).isoformat(),
+                    "status": status,
+                }
+                for i, (offset, status) in enumerate(episodes)
+            ]
+        }))
+        scheduler = EpisodeScheduler(str(data_file))
+
+        def expected() -> list[str]:
+            now = datetime.now()
+            return [
+                e.episode_id for e in scheduler.scheduled_episodes
+                if e.status == "pending" and e.scheduled_date <= now
+            ]
+
+        assert [e.episode_id for e in scheduler.get_pending_episodes()] == expected()
+        for index in marked:
+            scheduler.mark_completed(f"ep-{index}")
+            assert [e.episode_id for e in scheduler.get_pending_episodes()] == expected()
+
+
+class TestCaseSources:
+    """Case sources stay unique and keep insertion order."""
+
+    @settings(deadline=None)
+    @given(
+        added=st.lists(
+            st.sampled_from(["a", "b", "c", "unsolved murder cold case"]), max_size=8
+        )
+    )
+    def test_add_case_source_dedupes(
+        self, tmp_path_factory: pytest.TempPathFactory, added: list[str]
+    ) -> None:
+        """Adding a known query is a no-op, also after a reload."""
+        data_file = str(tmp_path_factory.mktemp("schedule") / "schedule_data.json")
+        scheduler = EpisodeScheduler(data_file)
+        expected = list(scheduler.config.case_sources)
+        for query in added:
+            scheduler.add_case_source(query)
+            if query not in expected:
+                expected.append(query)
+
+        reloaded = EpisodeScheduler(data_file)
+        reloaded.add_case_source(added[0] if added else expected[0])
+
+        assert scheduler.config.case_sources == expected
+        assert reloaded.config.case_sources == expected
+
+
+    @settings(deadline=None)
+    @given(calls=st.integers(min_value=1, max_value=6))
+    def test_single_source_rotation_skips_writes(
+        self, tmp_path_factory: pytest.TempPathFactory, calls: int
+    ) -> None:
+        """With one case source the rotation is static and nothing is written."""
+        data_file = str(tmp_path_factory.mktemp("schedule") / "schedule_data.json")
+        scheduler = EpisodeScheduler(data_file)
+        scheduler.config.case_sources = ["only query"]
+
+        with patch.object(EpisodeScheduler, "_write_data", autospec=True) as write:
+            queries = [scheduler.get_next_case_query() for _ in range(calls)]
+
+        assert queries == ["only query"] * calls
+        assert write.call_count == 0
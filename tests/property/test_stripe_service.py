@@ -0,0 +1,280 @@
+"""Property-based tests for the Stripe service.
+
+Feature: cold-case-crawler
+Membership checkout and subscription calls against the Stripe REST API
+"""
+
+import asyncio
+import hashlib
+import hmac
+import json
+import time
+from datetime import UTC, datetime, timedelta, timezone
+from urllib.parse import parse_qs
+
+import httpx
+import pytest
+import respx
+from hypothesis import given
+from hypothesis import strategies as st
+
+from src.api import membership
+from src.services.stripe_service import (
+    MEMBERSHIP_PLANS,
+    Member,
+    StripeService,
+    get_plan_price_id,
+)
+
+STRIPE_API = "https://api.stripe.com/v1"
+
+emails = st.emails()
+names = st.none() | st.text(
+    alphabet=st.characters(blacklist_categories=("Cc", "Cs")), min_size=1, max_size=30
+)
+
+
+class TestStripeRequests:
+    """Every call goes to the Stripe API with the service's credentials."""
+
+    @given(email=emails, name=names)
+    @pytest.mark.asyncio
+    async def test_create_customer_form_body(self, email: str, name: str | None) -> None:
+        """create_customer posts the email and optional name, authenticated."""
+        with respx.mock(assert_all_called=True) as router:
+            route = router.post(f"{STRIPE_API}/customers").mock(
+                return_value=httpx.Response(200, json={"id": "cus_123"})
+            )
+            async with StripeService(secret_key="sk_test_123") as stripe:
+                customer_id = await stripe.create_customer(email, name)
+
+        request = route.calls.last.request
+        expected = {"email": [email]}
+        if name:
+            expected["name"] = [name]
+        assert customer_id == "cus_123"
+        assert parse_qs(request.content.decode(), keep_blank_values=True) == expected
+        assert request.headers["Authorization"] == "Bearer sk_test_123"
+
+    @pytest.mark.asyncio
+    async def test_calls_share_one_client(self) -> None:
+        """Consecutive calls reuse the service's client instead of opening new ones."""
+        with respx.mock(assert_all_called=True) as router:
+            router.get(f"{STRIPE_API}/subscriptions/sub_1").mock(
+                return_value=httpx.Response(200, json={"id": "sub_1", "status": "active"})
+            )
+            router.post(f"{STRIPE_API}/subscriptions/sub_1").mock(
+                return_value=httpx.Response(200, json={"id": "sub_1", "cancel_at_period_end": True})
+            )
+            stripe = StripeService(secret_key="sk_test_123")
+            client = stripe._client
+            subscription = await stripe.get_subscription("sub_1")
+            cancelled = await stripe.cancel_subscription("sub_1")
+            await stripe.aclose()
+
+        assert subscription["status"] == "active"
+        assert cancelled["cancel_at_period_end"] is True
+        assert stripe._client is client and client.is_closed
+
+    @given(tier=st.sampled_from(["premium", "founding"]))
+    @pytest.mark.asyncio
+    async def test_product_and_prices(self, tier: str) -> None:
+        """Each price is created for the new product with its own interval and amount."""
+        plan = MEMBERSHIP_PLANS[tier]
+
+        def create_price(request: httpx.Request) -> httpx.Response:
+            form = parse_qs(request.content.decode())
+            assert form["product"] == ["prod_1"]
+            interval = form["recurring[interval]"][0]
+            return httpx.Response(200, json={"id": f"price_{interval}_{form['unit_amount'][0]}"})
+
+        with respx.mock(assert_all_called=True) as router:
+            router.post(f"{STRIPE_API}/products").mock(
+                return_value=httpx.Response(200, json={"id": "prod_1"})
+            )
+            router.post(f"{STRIPE_API}/prices").mock(side_effect=create_price)
+            async with StripeService(secret_key="sk_test_123") as stripe:
+                prices = await stripe.create_product_and_prices(plan)
+
+        assert prices == {
+            "product_id": "prod_1",
+            "monthly_price_id": f"price_month_{int(plan.price_monthly * 100)}",
+            "yearly_price_id": f"price_year_{int(plan.price_yearly * 100)}",
+        }
+
+    @pytest.mark.asyncio
+    async def test_failed_price_cancels_the_other(self) -> None:
+        """A rejected price request cancels the one still in flight."""
+        cancelled = asyncio.Event()
+
+        async def create_price(request: httpx.Request) -> httpx.Response:
+            if parse_qs(request.content.decode())["recurring[interval]"] == ["month"]:
+                return httpx.Response(402, json={"error": {"message": "declined"}})
+            try:
+                await asyncio.Event().wait()
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+            return httpx.Response(200, json={"id": "price_year"})
+
+        with respx.mock(assert_all_called=True) as router:
+            router.post(f"{STRIPE_API}/products").mock(
+                return_value=httpx.Response(200, json={"id": "prod_1"})
+            )
+            router.post(f"{STRIPE_API}/prices").mock(side_effect=create_price)
+            async with StripeService(secret_key="sk_test_123") as stripe:
+                with pytest.raises(httpx.HTTPStatusError):
+                    await stripe.create_product_and_prices(MEMBERSHIP_PLANS["premium"])
+
+        assert cancelled.is_set()
+
+
+    @pytest.mark.asyncio
+    async def test_shared_service_closed_on_shutdown(self, monkeypatch) -> None:
+        """close_stripe_service closes the process-wide pool and forgets it."""
+        monkeypatch.setenv("STRIPE_SECRET_KEY", "sk_test_123")
+        monkeypatch.setattr(membership, "_stripe_service", None)
+        stripe = membership.get_stripe_service()
+
+        await membership.close_stripe_service()
+
+        assert stripe._client.is_closed
+        assert membership._stripe_service is None
+
+
+class TestCheckoutSession:
+    """Checkout sessions carry the price, customer and metadata as form fields."""
+
+    @given(
+        email=emails,
+        metadata=st.dictionaries(
+            st.text(alphabet="abcdefgh_", min_size=1, max_size=8), st.text(max_size=20), max_size=4
+        ),
+    )
+    @pytest.mark.asyncio
+    async def test_form_fields(self, email: str, metadata: dict[str, str]) -> None:
+        """The posted form decodes to exactly the fields Stripe expects."""
+        with respx.mock(assert_all_called=True) as router:
+            route = router.post(f"{STRIPE_API}/checkout/sessions").mock(
+                return_value=httpx.Response(200, json={"id": "cs_1", "url": "https://pay/cs_1"})
+            )
+            async with StripeService(secret_key="sk_test_123") as stripe:
+                result = await stripe.create_checkout_session(
+                    "price_1", customer_email=email, metadata=metadata
+                )
+
+        request = route.calls.last.request
+        expected = {
+            "mode": ["subscription"],
+            "line_items[0][price]": ["price_1"],
+            "line_items[0][quantity]": ["1"],
+            "success_url": [f"{stripe.success_url}?session_id={{CHECKOUT_SESSION_ID}}"],
+            "cancel_url": [stripe.cancel_url],
+            "customer_email": [email],
+            **{f"metadata[{key}]": [value] for key, value in metadata.items()},
+        }
+        assert result.session_id == "cs_1"
+        assert parse_qs(request.content.decode(), keep_blank_values=True) == expected
+        assert request.headers["Content-Type"] == "application/x-www-form-urlencoded"
+
+
+class TestWebhookSignature:
+    """Webhook payloads are accepted only with a valid, fresh signature."""
+
+    # orjson parses integers exactly within 64 bits, which covers every
+    # number Stripe sends; wider ones would come back as floats
+    payloads = st.dictionaries(
+        st.text(min_size=1, max_size=10),
+        st.text(max_size=30) | st.integers(-(2**63), 2**64 - 1) | st.booleans(),
+        max_size=5,
+    ).map(lambda d: json.dumps({"type": "checkout.session.completed", "data": d}).encode())
+
+    @staticmethod
+    def sign(payload: bytes, timestamp: int, secret: str = "whsec_test") -> str:
+        signed = f"{timestamp}.{payload.decode()}".encode()
+        digest = hmac.new(secret.encode(), signed, hashlib.sha256).hexdigest()
+        return f"t={timestamp},v1={digest}"
+
+    @given(payload=payloads)
+    def test_valid_signature_returns_event(self, payload: bytes) -> None:
+        """A correctly signed payload is parsed and returned."""
+        stripe = StripeService(secret_key="sk_test_123", webhook_secret="whsec_test")
+        signature = self.sign(payload, int(time.time()))
+
+        assert stripe.verify_webhook_signature(payload, signature) == json.loads(payload)
+
+    @given(payload=payloads, secret=st.text(min_size=1, max_size=10))
+    def test_wrong_secret_rejected(self, payload: bytes, secret: str) -> None:
+        """A payload signed with another secret raises ValueError."""
+        stripe = StripeService(secret_key="sk_test_123", webhook_secret="whsec_test")
+        signature = self.sign(payload, int(time.time()), secret=f"other-{secret}")
+
+        with pytest.raises(ValueError, match="Invalid signature"):
+            stripe.verify_webhook_signature(payload, signature)
+
+    @given(payload=payloads, stale=st.lists(st.text(alphabet="0123456789abcdef", max_size=64)))
+    def test_any_v1_may_match(self, payload: bytes, stale: list[str]) -> None:
+        """Extra scheme entries and stale v1 values don't hide the valid signature."""
+        stripe = StripeService(secret_key="sk_test_123", webhook_secret="whsec_test")
+        timestamp, valid = self.sign(payload, int(time.time())).split(",")
+        parts = [timestamp, "v0=deadbeef", *(f"v1={s}" for s in stale), valid]
+
+        assert stripe.verify_webhook_signature(payload, ",".join(parts)) == json.loads(payload)
+
+    def test_missing_fields_rejected(self) -> None:
+        """A header without a timestamp or v1 signature is a format error."""
+        stripe = StripeService(secret_key="sk_test_123", webhook_secret="whsec_test")
+
+        for header in ("", "t=123", "v1=abc", "garbage"):
+            with pytest.raises(ValueError, match="Invalid signature format"):
+                stripe.verify_webhook_signature(b"{}", header)
+
+
+class TestPlanPriceLookup:
+    """Configured plan price IDs resolve by tier and billing cycle."""
+
+    def test_price_lookups_match_plans(self) -> None:
+        """Every plan's configured price ID is returned for its tier and cycle."""
+        for tier, plan in MEMBERSHIP_PLANS.items():
+            for cycle, price_id in (
+                ("monthly", plan.stripe_price_id_monthly),
+                ("yearly", plan.stripe_price_id_yearly),
+            ):
+                assert get_plan_price_id(tier, cycle) == price_id
+
+
+class TestMemberTimestamps:
+    """Member rows written as ISO strings load as epoch seconds."""
+
+    @given(
+        moment=st.datetimes(
+            min_value=datetime(2000, 1, 1), max_value=datetime(2100, 1, 1)
+        ).map(lambda d: d.replace(microsecond=0)),
+        aware=st.booleans(),
+    )
+    def test_auth_service_row_round_trips(self, moment: datetime, aware: bool) -> None:
+        """A row shaped like auth.py writes it SHALL rehydrate to the same instant."""
+        # auth.py stores datetime.utcnow().isoformat(); Postgres returns TIMESTAMPTZ
+        stamp = moment.replace(tzinfo=UTC).isoformat() if aware else moment.isoformat()
+        row = {
+            "member_id": "member-1",
+            "email": "listener@example.com",
+            "tier": "free",
+            "created_at": stamp,
+            "updated_at": stamp,
+        }
+
+        member = Member(**row)
+
+        expected = int(moment.replace(tzinfo=UTC).timestamp())
+        assert member.created_at == member.updated_at == expected
+        assert Member(**member.model_dump()) == member
+
+    def test_offset_timestamps_convert_to_utc(self) -> None:
+        """Non-UTC offsets SHALL be normalised to the same epoch second."""
+        moment = datetime(2024, 5, 1, 12, 0, tzinfo=timezone(timedelta(hours=-5)))
+        member = Member(
+            member_id="member-1", email="listener@example.com", created_at=moment.isoformat()
+        )
+
+        assert member.created_at == int(moment.timestamp())
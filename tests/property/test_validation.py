@@ -6,7 +6,7 @@ Validates: Requirements 8.1, 8.2, 8.3, 8.4, 8.5, 8.6, 8.7
 """
 
 import pytest
-from hypothesis import given, settings, strategies as st
+from hypothesis import given, strategies as st
 from pydantic import ValidationError
 
 from src.models.case import CaseFile, Evidence
@@ -43,7 +43,6 @@ class TestProperty14RequiredNonEmptyFields:
     **Validates: Requirements 8.1, 8.2, 8.3**
     """
 
-    @settings(max_examples=100)
     @given(empty_value=empty_or_whitespace)
     def test_casefile_case_id_rejects_empty(self, empty_value: str) -> None:
         """CaseFile rejects empty/whitespace case_id."""
@@ -55,7 +54,6 @@ class TestProperty14RequiredNonEmptyFields:
                 raw_content="Valid content",
             )
 
-    @settings(max_examples=100)
     @given(empty_value=empty_or_whitespace)
     def test_casefile_location_rejects_empty(self, empty_value: str) -> None:
         """CaseFile rejects empty/whitespace location."""
@@ -67,7 +65,6 @@ class TestProperty14RequiredNonEmptyFields:
                 raw_content="Valid content",
             )
 
-    @settings(max_examples=100)
     @given(empty_value=empty_or_whitespace)
     def test_podcastscript_episode_title_rejects_empty(self, empty_value: str) -> None:
         """PodcastScript rejects empty/whitespace episode_title."""
@@ -80,7 +77,6 @@ class TestProperty14RequiredNonEmptyFields:
                 chapters=[valid_line],
             )
 
-    @settings(max_examples=100)
     @given(empty_value=empty_or_whitespace)
     def test_dialogueline_text_rejects_empty(self, empty_value: str) -> None:
         """DialogueLine rejects empty/whitespace text."""
@@ -97,7 +93,6 @@ class TestProperty15ListMinimumLength:
     **Validates: Requirements 8.4**
     """
 
-    @settings(max_examples=100)
     @given(
         script_id=non_empty_text,
         case_id=non_empty_text,
@@ -129,7 +124,6 @@ class TestProperty16LiteralEnumValidation:
     **Validates: Requirements 8.5, 8.6**
     """
 
-    @settings(max_examples=100)
     @given(invalid_speaker=invalid_speakers, text=non_empty_text)
     def test_dialogueline_invalid_speaker_rejected(
         self, invalid_speaker: str, text: str
@@ -138,7 +132,6 @@ class TestProperty16LiteralEnumValidation:
         with pytest.raises(ValidationError):
             DialogueLine(speaker=invalid_speaker, text=text)  # type: ignore
 
-    @settings(max_examples=100)
     @given(
         speaker=valid_speakers,
         text=non_empty_text,
@@ -151,7 +144,6 @@ class TestProperty16LiteralEnumValidation:
         with pytest.raises(ValidationError):
             DialogueLine(speaker=speaker, text=text, emotion_tag=invalid_tag)  # type: ignore
 
-    @settings(max_examples=100)
     @given(speaker=valid_speakers, text=non_empty_text, tag=valid_emotion_tags)
     def test_dialogueline_valid_values_accepted(
         self, speaker: str, text: str, tag: str
@@ -172,7 +164,6 @@ class TestProperty17ValidationErrorFieldIdentification:
     **Validates: Requirements 8.7**
     """
 
-    @settings(max_examples=100)
     @given(empty_value=empty_or_whitespace)
     def test_validation_error_identifies_case_id_field(self, empty_value: str) -> None:
         """ValidationError identifies case_id field."""
@@ -187,7 +178,6 @@ class TestProperty17ValidationErrorFieldIdentification:
         field_names = [str(e.get("loc", ())) for e in errors]
         assert any("case_id" in name for name in field_names)
 
-    @settings(max_examples=100)
     @given(empty_value=empty_or_whitespace)
     def test_validation_error_identifies_text_field(self, empty_value: str) -> None:
         """ValidationError identifies text field."""
@@ -197,7 +187,6 @@ class TestProperty17ValidationErrorFieldIdentification:
         field_names = [str(e.get("loc", ())) for e in errors]
         assert any("text" in name for name in field_names)
 
-    @settings(max_examples=100)
     @given(invalid_speaker=invalid_speakers)
     def test_validation_error_identifies_speaker_field(self, invalid_speaker: str) -> None:
         """ValidationError identifies speaker field."""
@@ -207,7 +196,6 @@ class TestProperty17ValidationErrorFieldIdentification:
         field_names = [str(e.get("loc", ())) for e in errors]
         assert any("speaker" in name for name in field_names)
 
-    @settings(max_examples=100)
     @given(
         script_id=non_empty_text,
         case_id=non_empty_text,
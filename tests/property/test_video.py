@@ -5,13 +5,16 @@ Property 10: Social Hooks Extraction Completeness
 Validates: Requirements 4.1
 """
 
+import asyncio
 from unittest.mock import AsyncMock, patch
 
+import httpx
 import pytest
-from hypothesis import given, settings, strategies as st
+import respx
+from hypothesis import given, strategies as st
 
 from src.models.script import DialogueLine, PodcastScript
-from src.services.video import VideoService
+from src.services.video import CREATOMATE_API_URL, VideoService
 
 
 # Strategies for generating valid DialogueLines
@@ -60,7 +63,6 @@ class TestProperty10SocialHooksExtractionCompleteness:
     **Validates: Requirements 4.1**
     """
 
-    @settings(max_examples=100)
     @given(script=podcast_script_with_hooks_strategy(min_hooks=1, max_hooks=10))
     @pytest.mark.asyncio
     async def test_all_social_hooks_processed(
@@ -101,7 +103,6 @@ class TestProperty10SocialHooksExtractionCompleteness:
                 f"Hook '{hook}' was not processed"
             )
 
-    @settings(max_examples=100)
     @given(hooks=st.lists(social_hook_strategy, min_size=1, max_size=15))
     @pytest.mark.asyncio
     async def test_hook_count_equals_video_count(
@@ -145,7 +146,6 @@ class TestProperty10SocialHooksExtractionCompleteness:
             f"Expected {len(hooks)} generate_clip calls, got {call_count}"
         )
 
-    @settings(max_examples=100)
     @given(script=podcast_script_with_hooks_strategy(min_hooks=1, max_hooks=10))
     @pytest.mark.asyncio
     async def test_hooks_processed_in_order(
@@ -197,3 +197,87 @@ class TestProperty10SocialHooksExtractionCompleteness:
         assert video_urls == [], (
             "Empty social hooks should return empty video list"
         )
+
+
+class TestConcurrentClipGeneration:
+    """Clips render side by side, within the configured limit."""
+
+    @given(
+        hooks=st.lists(social_hook_strategy, min_size=1, max_size=12),
+        limit=st.integers(min_value=1, max_value=5),
+    )
+    @pytest.mark.asyncio
+    async def test_renders_bounded_and_ordered(self, hooks: list[str], limit: int) -> None:
+        """No more than ``limit`` renders overlap, and URLs follow hook order."""
+        script = PodcastScript(
+            script_id="test-script-001",
+            case_id="test-case-001",
+            episode_title="Test Episode",
+            chapters=[DialogueLine(speaker="maya_vance", text="Test dialogue")],
+            social_hooks=hooks,
+        )
+        video_service = VideoService(
+            creatomate_api_key="test-key",
+            template_id="test-template",
+            max_concurrent_renders=limit,
+        )
+        in_flight = 0
+        peak = 0
+
+        async def mock_generate_clip(hook: str, audio_url: str) -> str:
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0)
+            in_flight -= 1
+            return f"https://example.com/video/{hooks.index(hook)}.mp4"
+
+        with patch.object(video_service, "generate_clip", side_effect=mock_generate_clip):
+            video_urls = await video_service.generate_all_clips(script, "https://example.com/a.mp3")
+
+        assert peak == min(limit, len(hooks))
+        assert video_urls == [f"https://example.com/video/{hooks.index(h)}.mp4" for h in hooks]
+
+
+class TestCreatomateResponse:
+    """The render URL is read from either response shape Creatomate returns."""
+
+    @given(
+        video_id=st.text(alphabet="abcdef0123456789", min_size=1, max_size=12),
+        as_list=st.booleans(),
+    )
+    @pytest.mark.asyncio
+    async def test_generate_clip_reads_url(self, video_id: str, as_list: bool) -> None:
+        """generate_clip returns the url of the (first) render."""
+        render = {"id": video_id, "url": f"https://cdn.creatomate.com/{video_id}.mp4"}
+        with respx.mock(assert_all_called=True) as router:
+            route = router.post(CREATOMATE_API_URL).mock(
+                return_value=httpx.Response(200, json=[render] if as_list else render)
+            )
+            async with VideoService("test-key", "test-template") as video_service:
+                video_url = await video_service.generate_clip("hook", "https://example.com/a.mp3")
+
+        assert video_url == render["url"]
+        assert route.calls.last.request.headers["Authorization"] == "Bearer test-key"
+
+
+class TestVideoServiceClose:
+    """The service's HTTP client is opened on demand and closed by its owner."""
+
+    @pytest.mark.asyncio
+    async def test_client_opened_on_first_render_and_closed(self) -> None:
+        """No client until a render; aclose() closes it and is safe to repeat."""
+        render = {"id": "r1", "url": "https://cdn.creatomate.com/r1.mp4"}
+        video_service = VideoService("test-key", "test-template")
+        assert video_service._client is None
+
+        with respx.mock(assert_all_called=True) as router:
+            router.post(CREATOMATE_API_URL).mock(return_value=httpx.Response(200, json=render))
+            await video_service.generate_clip("hook", "https://example.com/a.mp3")
+        client = video_service._client
+
+        await video_service.aclose()
+        await video_service.aclose()
+
+        assert client is not None and client.is_closed
+        assert video_service._client is None